@@ -11,7 +11,9 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -30,6 +32,9 @@ from app.database.association_user_company import (
     AssociationUserCompany,
 )  # this ensures the model is registered
 from app.database.role import Role
+from app.database.audit_event import AuditEvent
+from app.database.email_outbox import EmailOutbox
+from app.database.one_time_token import OneTimeToken
 
 target_metadata = BaseModel.metadata
 
@@ -70,6 +75,15 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # app.database.bootstrap passes in a connection to the configured database
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,45 @@
+"""Add trigram search indexes
+
+Revision ID: 3f6b2a8d91c4
+Revises: 9552b9fc884a
+Create Date: 2026-10-18 10:12:41.218554
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6b2a8d91c4"
+down_revision: Union[str, None] = "9552b9fc884a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns filtered with ILIKE '%term%' (see app.database.search.TextSearch)
+SEARCH_COLUMNS = {
+    "user": ("first_name", "last_name", "email"),
+    "company": ("name", "description", "industry", "email"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
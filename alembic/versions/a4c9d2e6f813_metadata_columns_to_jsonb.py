@@ -0,0 +1,51 @@
+"""Store metadata columns as JSONB
+
+Revision ID: a4c9d2e6f813
+Revises: 5c8e1d4f7a26
+Create Date: 2026-10-18 14:05:12.530871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c9d2e6f813"
+down_revision: Union[str, None] = "5c8e1d4f7a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("user", "company", "role", "association_user_company", "email_outbox")
+COLUMNS = ("primary_meta_data", "secondary_meta_data")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # jsonb lets json_set patch one key in place (jsonb || jsonb_build_object)
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.JSON(),
+                type_=postgresql.JSONB(),
+                existing_nullable=True,
+                postgresql_using=f"{column}::jsonb",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=postgresql.JSONB(),
+                type_=sa.JSON(),
+                existing_nullable=True,
+                postgresql_using=f"{column}::json",
+            )
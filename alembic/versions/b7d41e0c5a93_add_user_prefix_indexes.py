@@ -0,0 +1,37 @@
+"""Add user prefix indexes
+
+Revision ID: b7d41e0c5a93
+Revises: 3f6b2a8d91c4
+Create Date: 2026-10-18 11:04:27.730912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d41e0c5a93"
+down_revision: Union[str, None] = "3f6b2a8d91c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns matched by prefix in member typeahead (TextSearch.starts_with)
+PREFIX_COLUMNS = ("first_name", "last_name", "email")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in PREFIX_COLUMNS:
+        op.create_index(
+            f"ix_user_{column}_prefix",
+            "user",
+            [sa.text(f"lower({column}) text_pattern_ops")],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in PREFIX_COLUMNS:
+        op.drop_index(f"ix_user_{column}_prefix", table_name="user")
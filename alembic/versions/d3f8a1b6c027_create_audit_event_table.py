@@ -0,0 +1,48 @@
+"""create audit event table
+
+Revision ID: d3f8a1b6c027
+Revises: a4c9d2e6f813
+Create Date: 2026-10-18 16:05:12.418302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a1b6c027"
+down_revision: Union[str, None] = "a4c9d2e6f813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "audit_event",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("action", sa.String(length=64), nullable=False),
+        sa.Column("company_id", sa.Integer(), nullable=True),
+        sa.Column("target_type", sa.String(length=64), nullable=False),
+        sa.Column("target_id", sa.String(length=256), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_event_company_id_id", "audit_event", ["company_id", "id"])
+    op.create_index(
+        "ix_audit_event_target", "audit_event", ["target_type", "target_id", "id"]
+    )
+    op.create_index("ix_audit_event_actor_id_id", "audit_event", ["actor_id", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_audit_event_actor_id_id", table_name="audit_event")
+    op.drop_index("ix_audit_event_target", table_name="audit_event")
+    op.drop_index("ix_audit_event_company_id_id", table_name="audit_event")
+    op.drop_table("audit_event")
@@ -0,0 +1,53 @@
+"""Add soft-delete aware indexes
+
+Revision ID: e2a9c7f31b08
+Revises: b7d41e0c5a93
+Create Date: 2026-10-18 11:52:06.481207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a9c7f31b08"
+down_revision: Union[str, None] = "b7d41e0c5a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_association_user_company_company_id_closed_at",
+        "association_user_company",
+        ["company_id", "_closed_at"],
+    )
+    op.create_index(
+        "ix_association_user_company_company_id_role_name",
+        "association_user_company",
+        ["company_id", "role_name"],
+    )
+    op.create_index(
+        "ix_association_user_company_active",
+        "association_user_company",
+        ["company_id", "user_id"],
+        postgresql_where=sa.text("_closed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_association_user_company_active", table_name="association_user_company"
+    )
+    op.drop_index(
+        "ix_association_user_company_company_id_role_name",
+        table_name="association_user_company",
+    )
+    op.drop_index(
+        "ix_association_user_company_company_id_closed_at",
+        table_name="association_user_company",
+    )
@@ -0,0 +1,46 @@
+"""create one time token table
+
+Revision ID: f1b5e7c30d48
+Revises: d3f8a1b6c027
+Create Date: 2026-10-18 17:22:47.610935
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b5e7c30d48"
+down_revision: Union[str, None] = "d3f8a1b6c027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "one_time_token",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("purpose", sa.String(length=32), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "purpose"),
+    )
+    op.create_index("ix_one_time_token_expires_at", "one_time_token", ["expires_at"])
+    # reset tokens no longer live in the user's metadata
+    op.execute(
+        "UPDATE \"user\" SET primary_meta_data = primary_meta_data - 'password_reset' "
+        "WHERE primary_meta_data ? 'password_reset'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_one_time_token_expires_at", table_name="one_time_token")
+    op.drop_table("one_time_token")
@@ -1,7 +1,13 @@
+import os
+import threading
+
 from sqlalchemy import create_engine
-from sqlalchemy_utils import create_database, database_exists
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from app.utils.config.database import DatabaseConfig
 from app.utils.config.loader import ConfigLoader
+from .pool_metrics import pool_metrics
 
 Base = declarative_base()
 
@@ -13,32 +19,166 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseSessionManager:
+    """
+    Handle to the process-wide engines and session factories.
+
+    The engines (and their connection pools) are built once per process, the
+    first time they are needed or explicitly from the application lifespan, and
+    are then shared by every repository. Constructing a
+    ``DatabaseSessionManager`` is cheap: it only looks up the registry.
+
+    The request path uses the asyncio engine (asyncpg / aiosqlite); the sync
+    engine is kept for scripts, migrations and tests. Building the engines
+    issues no DDL; the schema is created by ``app.database.bootstrap``.
+    """
+
+    # the sync engine never serves requests, so its pool ignores the config
+    SYNC_POOL = {"pool_size": 1, "max_overflow": 2}
+
+    _engine = None
+    _session_factory = None
+    _async_engine = None
+    _async_session_factory = None
+    _pid = None
+    _lock = threading.Lock()
+
     def __init__(self) -> None:
         self._base = Base
-        # load configs
-        loader = ConfigLoader()
-        configs = loader.get_config()
-        self.configs = configs
-        from .company import Company
-        from .role import Role
-        from .association_user_company import AssociationUserCompany
-        from .user import User
-
-        self.engine = self._configure_engine()
-        self._base.metadata.create_all(bind=self.engine)
-        self._session = sessionmaker()
-        self._session.configure(bind=self.engine)
-
-    def _configure_engine(self):
-        url = self.configs["database_url"]
-        if not database_exists(url):
-            create_database(url)
-
-        return create_engine(url, pool_pre_ping=True, echo=False)
-
-    def session_object(self):
+        self.initialize()
+        self.engine = self._engine
+        self._session = self._session_factory
+        self.async_engine = self._async_engine
+        self._async_session = self._async_session_factory
+
+    @classmethod
+    def initialize(cls, configs: dict = None) -> None:
+        """
+        Create the engines and sessionmakers for this process if needed.
+
+        A registry inherited through ``fork`` (e.g. ``--workers N``) is discarded
+        without closing the parent's connections and rebuilt for the child.
+        """
+        if cls._engine is not None and cls._pid == os.getpid():
+            return
+
+        with cls._lock:
+            if cls._engine is not None and cls._pid != os.getpid():
+                # never touch connections owned by the parent process
+                cls._engine.dispose(close=False)
+                cls._async_engine.sync_engine.dispose(close=False)
+                cls._clear()
+
+            if cls._engine is None:
+                configs = configs or ConfigLoader().get_config()
+                from .company import Company
+                from .role import Role
+                from .association_user_company import AssociationUserCompany
+                from .audit_event import AuditEvent
+                from .email_outbox import EmailOutbox
+                from .one_time_token import OneTimeToken
+                from .user import User
+
+                url = configs["database_url"]
+                pool_options = cls._pool_options(url, configs.get("database_pool"))
+                engine = create_engine(
+                    url,
+                    echo=False,
+                    **cls._pool_options(
+                        url, {**(configs.get("database_pool") or {}), **cls.SYNC_POOL}
+                    ),
+                )
+                async_engine = create_async_engine(
+                    DatabaseConfig.get_async_connection_string(url),
+                    echo=False,
+                    **pool_options,
+                )
+                cls._session_factory = sessionmaker(bind=engine)
+                cls._async_session_factory = async_sessionmaker(
+                    bind=async_engine, expire_on_commit=False
+                )
+                cls._engine = engine
+                cls._async_engine = async_engine
+                cls._pid = os.getpid()
+                pool_metrics.track("sync", engine)
+                pool_metrics.track("async", async_engine.sync_engine)
+                logger.info("Database engines initialized for process %s", cls._pid)
+
+    @classmethod
+    def dispose(cls) -> None:
+        """
+        Close every pooled sync connection and clear the registry.
+
+        Async connections are only released; use ``dispose_async`` from a
+        running event loop to close them.
+        """
+        with cls._lock:
+            if cls._engine is not None:
+                cls._engine.dispose(close=cls._pid == os.getpid())
+                cls._async_engine.sync_engine.dispose(close=False)
+            cls._clear()
+
+    @classmethod
+    async def dispose_async(cls) -> None:
+        """
+        Close every pooled connection, sync and async, and clear the registry.
+        """
+        if cls._async_engine is not None and cls._pid == os.getpid():
+            await cls._async_engine.dispose()
+        cls.dispose()
+
+    @classmethod
+    def _clear(cls) -> None:
+        cls._engine = None
+        cls._session_factory = None
+        cls._async_engine = None
+        cls._async_session_factory = None
+        cls._pid = None
+        pool_metrics.untrack()
+
+    @staticmethod
+    def _pool_options(url: str, pool_options: dict = None) -> dict:
+        options = {"pool_pre_ping": True, **(pool_options or {})}
+        parsed = make_url(url)
+        if parsed.get_backend_name() == "sqlite" and parsed.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            # memory databases share one connection; there is no queue to size
+            options = {
+                key: value
+                for key, value in options.items()
+                if key in ("pool_pre_ping", "pool_recycle")
+            }
+        return options
+
+    def session_object(self) -> Session:
         return self._session()
 
+    def async_session_object(self) -> AsyncSession:
+        return self._async_session()
+
+
+async def get_session():
+    """
+    FastAPI dependency yielding a single async session for the whole request.
+
+    Services and repositories only flush; the unit of work is committed once
+    here when the handler succeeds and rolled back if it raises. Declare it as
+    ``Depends(get_session, scope="function")`` so the commit happens before
+    the response is sent and a failed commit reaches the client as an error.
+    """
+    async with DatabaseSessionManager().async_session_object() as session:
+        try:
+            # check out up front so the pool wait is measured on its own
+            with pool_metrics.time_checkout():
+                await session.connection()
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
 
 if __name__ == "__main__":
     # Example usage
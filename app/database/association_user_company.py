@@ -1,14 +1,29 @@
+from typing import Dict, Set
+
 from app.models.company.response_messages import CompanyUserResponseMessages
 from app.models.user.user import UserRead
+from app.security.membership import membership_cache, membership_changed
+from app.utils.ttl_cache import MISSING
 from app.utils.app_error import AppError
-from sqlalchemy import Column, Integer, String, ForeignKey, ForeignKeyConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    insert,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import relationship, backref, Session
 from sqlalchemy.sql import func
-from sqlalchemy.orm.attributes import flag_modified
 from fastapi import status
 
 
-from .base_model import BaseModel
+from .audit_event import AuditEvent
+from .base_model import BaseModel, chunked
 
 
 class AssociationUserCompany(BaseModel):
@@ -24,6 +39,25 @@ class AssociationUserCompany(BaseModel):
             ["role.company_id", "role.name"],
             ondelete="CASCADE",
         ),
+        # the primary key starts with user_id; these serve per-company lookups
+        Index(
+            "ix_association_user_company_company_id_closed_at",
+            "company_id",
+            "_closed_at",
+        ),
+        Index(
+            "ix_association_user_company_company_id_role_name",
+            "company_id",
+            "role_name",
+        ),
+        # active members of a company in keyset (user_id) order
+        Index(
+            "ix_association_user_company_active",
+            "company_id",
+            "user_id",
+            postgresql_where=text("_closed_at IS NULL"),
+            sqlite_where=text("_closed_at IS NULL"),
+        ),
     )
 
     # relationships
@@ -37,12 +71,22 @@ class AssociationUserCompany(BaseModel):
     ) -> bool:
         """
         Check if a user is associated with a company, optionally filtered by role.
+
+        The member's role is served from ``membership_cache`` when present.
         """
-        query = session.query(cls).filter_by(user_id=user_id, company_id=company_id)
-        if role_name:
-            query = query.filter_by(role_name=role_name)
+        key = (int(user_id), int(company_id))
+        linked_role = membership_cache.get("links", key)
+        if linked_role is MISSING:
+            linked_role = (
+                session.query(cls.role_name)
+                .filter_by(user_id=user_id, company_id=company_id)
+                .scalar()
+            )
+            membership_cache.links.set(key, linked_role)
 
-        return session.query(query.exists()).scalar()
+        if linked_role is None:
+            return False
+        return not role_name or linked_role == role_name
 
     @classmethod
     def link_user(
@@ -63,17 +107,111 @@ class AssociationUserCompany(BaseModel):
         if existing:
             raise ValueError(CompanyUserResponseMessages.ADD_EXISTING_USER_FAILED.value)
 
-        assoc = cls(
-            user_id=user_id,
+        assoc = cls(user_id=user_id, company_id=company_id, role_name=role_name)
+        session.add(assoc)
+        AuditEvent.record(
+            session,
+            AuditEvent.MEMBER_ADDED,
+            actor=added_by,
+            target_type="user",
+            target_id=user_id,
             company_id=company_id,
-            role_name=role_name,
-            primary_meta_data={"added_by": added_by.model_dump()},
+            payload={"role_name": role_name},
         )
-        session.add(assoc)
 
-        session.commit()
+        session.flush()
+        membership_changed(session, user_id=user_id)
         return assoc
 
+    @classmethod
+    def link_users(
+        cls,
+        session: Session,
+        company_id: int,
+        members: Dict[int, str],
+        added_by: UserRead,
+    ) -> Set[int]:
+        """
+        Link many users (``user_id -> role_name``) to a company at once.
+
+        Users already active in the company are skipped. Previously removed
+        members are re-opened with their new role (the link's primary key
+        survives removal) and everyone else is added with one multi-row
+        insert, with their audit events in a second one. Returns the ids of
+        the users that were linked.
+        """
+        members = dict(members)
+        closed = set()
+        for chunk in chunked(list(members)):
+            for user_id, closed_at in session.execute(
+                select(cls.user_id, cls._closed_at).where(
+                    cls.company_id == company_id, cls.user_id.in_(chunk)
+                )
+            ):
+                if closed_at is None:
+                    members.pop(user_id)
+                else:
+                    closed.add(user_id)
+
+        if not members:
+            return set()
+
+        by_role: Dict[str, list] = {}
+        for user_id in closed:
+            by_role.setdefault(members[user_id], []).append(user_id)
+        for role_name, ids in by_role.items():
+            for chunk in chunked(ids):
+                session.execute(
+                    update(cls)
+                    .where(cls.company_id == company_id, cls.user_id.in_(chunk))
+                    .values(role_name=role_name, _closed_at=None),
+                    execution_options={"synchronize_session": False},
+                )
+
+        new_links = [
+            {
+                "user_id": user_id,
+                "company_id": company_id,
+                "role_name": role_name,
+            }
+            for user_id, role_name in members.items()
+            if user_id not in closed
+        ]
+        if new_links:
+            session.execute(insert(cls), new_links)
+        AuditEvent.record_many(
+            session,
+            AuditEvent.MEMBER_ADDED,
+            actor=added_by,
+            target_type="user",
+            targets={
+                user_id: {"role_name": role_name}
+                for user_id, role_name in members.items()
+            },
+            company_id=company_id,
+        )
+
+        session.flush()
+        membership_changed(session, company_id=company_id)
+        return set(members)
+
+    @staticmethod
+    def is_company_creator(
+        session: Session, assoc: "AssociationUserCompany", user_id: int
+    ) -> bool:
+        """
+        Whether ``user_id`` created the company of ``assoc``: the actor of its
+        ``company.created`` event, or, for links stamped before the audit
+        table existed, a member who added themselves.
+        """
+        created = AuditEvent.latest(
+            session, AuditEvent.COMPANY_CREATED, "company", assoc.company_id
+        )
+        if created is not None:
+            return created.actor_id == user_id
+        added_by = (assoc.primary_meta_data or {}).get("added_by") or {}
+        return added_by.get("id") == user_id
+
     @classmethod
     def unlink_user(
         cls,
@@ -95,20 +233,24 @@ class AssociationUserCompany(BaseModel):
             )
 
         # Ensure the user being removed is not super admin
-        if (
-            assoc.primary_meta_data.get("added_by") == removed_by.model_dump()
-            and assoc.user_id == removed_by.id
+        if assoc.user_id == removed_by.id and cls.is_company_creator(
+            session, assoc, removed_by.id
         ):
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=CompanyUserResponseMessages.SUPER_ADMIN_REMOVE_FORBIDDEN.value,
             )
 
-        assoc.primary_meta_data["removed_by"] = removed_by.model_dump()
-
-        # Force SQLAlchemy to mark the column as dirty
-        flag_modified(assoc, "primary_meta_data")
-
         assoc._closed_at = func.now()
-        session.commit()
+        AuditEvent.record(
+            session,
+            AuditEvent.MEMBER_REMOVED,
+            actor=removed_by,
+            target_type="user",
+            target_id=user_id,
+            company_id=company_id,
+            payload={"role_name": assoc.role_name},
+        )
+        session.flush()
+        membership_changed(session, user_id=user_id)
         return assoc
@@ -0,0 +1,135 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from app.models.user.user import UserRead
+from . import Base
+from .email_outbox import utcnow
+from .json_patch import JSONDocument
+
+
+class AuditEvent(Base):
+    """
+    Append-only record of who changed what.
+
+    Events are added to the session of the change they describe, so they are
+    flushed with it and committed or rolled back together. Rows are never
+    updated, so the table has none of ``BaseModel``'s bookkeeping columns,
+    and ``actor_id`` carries no foreign key: the trail outlives its users.
+    """
+
+    __tablename__ = "audit_event"
+
+    COMPANY_CREATED = "company.created"
+    MEMBER_ADDED = "company.member_added"
+    MEMBER_REMOVED = "company.member_removed"
+    ROLE_CREATED = "role.created"
+    ROLE_DELETED = "role.deleted"
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        nullable=False,
+        primary_key=True,
+        autoincrement=True,
+    )
+    occurred_at = Column(DateTime(), nullable=False, default=utcnow)
+    actor_id = Column(Integer, nullable=True)
+    action = Column(String(64), nullable=False)
+    company_id = Column(Integer, nullable=True)
+    target_type = Column(String(64), nullable=False)
+    target_id = Column(String(256), nullable=False)
+    payload = Column(JSONDocument, nullable=False, default=dict)
+
+    __table_args__ = (
+        # every query is scoped by one of these and pages by id
+        Index("ix_audit_event_company_id_id", "company_id", "id"),
+        Index("ix_audit_event_target", "target_type", "target_id", "id"),
+        Index("ix_audit_event_actor_id_id", "actor_id", "id"),
+    )
+
+    @classmethod
+    def record(
+        cls,
+        session: Session,
+        action: str,
+        actor: Optional[UserRead],
+        target_type: str,
+        target_id: Any,
+        company_id: int = None,
+        payload: Dict = None,
+    ) -> "AuditEvent":
+        """
+        Add one event to the session; it is written by the caller's next flush.
+        """
+        event = cls(
+            action=action,
+            actor_id=actor.id if actor else None,
+            company_id=company_id,
+            target_type=target_type,
+            target_id=str(target_id),
+            payload=payload or {},
+        )
+        session.add(event)
+        return event
+
+    @classmethod
+    def record_many(
+        cls,
+        session: Session,
+        action: str,
+        actor: Optional[UserRead],
+        target_type: str,
+        targets: Dict[Any, Dict],
+        company_id: int = None,
+    ) -> None:
+        """
+        Write one event per ``target_id -> payload`` with a multi-row insert.
+        """
+        if not targets:
+            return
+        session.execute(
+            insert(cls),
+            [
+                {
+                    "action": action,
+                    "actor_id": actor.id if actor else None,
+                    "company_id": company_id,
+                    "target_type": target_type,
+                    "target_id": str(target_id),
+                    "payload": payload or {},
+                }
+                for target_id, payload in targets.items()
+            ],
+        )
+
+    @classmethod
+    def latest(
+        cls, session: Session, action: str, target_type: str, target_id: Any
+    ) -> Optional["AuditEvent"]:
+        """
+        The most recent ``action`` on a target, from the target index.
+        """
+        return session.scalars(
+            select(cls)
+            .where(
+                cls.target_type == target_type,
+                cls.target_id == str(target_id),
+                cls.action == action,
+            )
+            .order_by(cls.id.desc())
+            .limit(1)
+        ).first()
+
+    @staticmethod
+    def to_dict(obj: Any) -> Dict[str, Any]:
+        return {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
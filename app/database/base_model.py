@@ -1,5 +1,7 @@
-from sqlalchemy import Column, DateTime, JSON
+from sqlalchemy import Column, DateTime, JSON, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import IntegrityError
@@ -11,9 +13,20 @@ from sqlalchemy.ext.mutable import MutableDict
 
 
 from . import Base  # Ensure this points to your declarative base
+from .json_patch import JSONDocument, json_set
+from .pagination import Keyset, count_rows, pagination_meta
 from app.utils.logging import logger
 
 
+def chunked(values: List[Any], size: int = 500):
+    """
+    Yield ``values`` in slices of ``size``, to keep ``IN`` lists and
+    multi-row statements under the drivers' bind parameter limits.
+    """
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
 class RecordNotFoundError(Exception):
     """Custom exception for record not found errors."""
 
@@ -23,14 +36,15 @@ class RecordNotFoundError(Exception):
 
 class BaseModel(Base):
     __abstract__ = True  # This ensures the class is not mapped to a table
+    # Helpers below only flush; the caller owns the transaction and commits it.
 
     # Common fields for all models
     _created_at = Column(DateTime(), nullable=False, server_default=func.now())
     _updated_at = Column(DateTime(), nullable=True, onupdate=func.now())
     _closed_at = Column(DateTime(), nullable=True)
-    # Use MutableDict here:
-    primary_meta_data = Column(MutableDict.as_mutable(JSON), default=dict)
-    secondary_meta_data = Column(MutableDict.as_mutable(JSON), default=dict)
+    # Use MutableDict here; single keys are patched with patch_json_field
+    primary_meta_data = Column(MutableDict.as_mutable(JSONDocument), default=dict)
+    secondary_meta_data = Column(MutableDict.as_mutable(JSONDocument), default=dict)
 
     @staticmethod
     def to_dict(obj: Any) -> Dict[str, Any]:
@@ -44,9 +58,15 @@ class BaseModel(Base):
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         Retrieve all records of a model with optional filters and pagination.
+
+        Records are ordered by primary key. Pass the previous page's
+        ``next_cursor`` as ``cursor`` to page by key instead of offset.
+        ``count`` selects how the total is computed (see ``count_rows``).
         """
         query = session.query(cls)
 
@@ -56,14 +76,21 @@ class BaseModel(Base):
                 query = query.filter(condition)
 
         # Get total records count
-        total_records = query.count()
+        total_records = count_rows(session, query.statement, count)
 
         # Apply pagination
-        records = query.offset(offset).limit(limit).all()
+        primary_key = inspect(cls).primary_key
+        keyset = Keyset(*primary_key)
+        rows = keyset.apply(query, limit, offset=offset, cursor=cursor).all()
+        records, next_cursor = keyset.page(
+            rows, limit, key=lambda row: [getattr(row, c.key) for c in primary_key]
+        )
 
         return {
             "records": [cls.to_dict(record) for record in records],
-            "pagination": cls._get_pagination_metadata(total_records, limit, offset),
+            "pagination": pagination_meta(
+                total_records, limit, offset, cursor, next_cursor, count
+            ),
         }
 
     @classmethod
@@ -85,17 +112,16 @@ class BaseModel(Base):
         try:
             record = cls(**kwargs)
             session.add(record)
-            session.commit()
+            session.flush()
             logger.info(f"{cls.__name__} created: {record}")
             return cls.to_dict(record)
         except IntegrityError as e:
-            session.rollback()
+            # the caller's transaction is rolled back as a whole
             logger.error(f"Integrity error: {e.orig}")
-            raise ValueError(f"Integrity error: {e.orig}")
+            raise ValueError(f"Integrity error: {e.orig}") from e
         except Exception as e:
-            session.rollback()
             logger.error(f"Error creating {cls.__name__}: {e}")
-            raise ValueError(f"Error creating {cls.__name__}: {e}")
+            raise ValueError(f"Error creating {cls.__name__}: {e}") from e
 
     @classmethod
     def update(cls, session: Session, record_id: Any, **kwargs) -> Dict[str, Any]:
@@ -106,7 +132,7 @@ class BaseModel(Base):
             record = session.query(cls).filter_by(id=record_id).one()
             for field, value in kwargs.items():
                 setattr(record, field, value)
-            session.commit()
+            session.flush()
             logger.info(f"{cls.__name__} updated: {record}")
             return cls.to_dict(record)
         except NoResultFound:
@@ -123,7 +149,7 @@ class BaseModel(Base):
             record = session.query(cls).filter_by(**filters).one()
             for field, value in kwargs.items():
                 setattr(record, field, value)
-            session.commit()
+            session.flush()
             logger.info(f"{cls.__name__} updated with filters {filters}")
             return cls.to_dict(record)
         except NoResultFound:
@@ -138,7 +164,7 @@ class BaseModel(Base):
             record = session.query(cls).filter_by(id=record_id).one()
             record._closed_at = func.now()
             session.add(record)
-            session.commit()
+            session.flush()
             logger.info(f"{cls.__name__} with id={record_id} deleted.")
             return {"message": f"{cls.__name__} with id={record_id} deleted"}
         except NoResultFound:
@@ -154,7 +180,7 @@ class BaseModel(Base):
         try:
             record = session.query(cls).filter_by(**filters).one()
             record._closed_at = func.now()
-            session.commit()
+            session.flush()
             logger.info(f"{cls.__name__} deleted with filters {filters}")
             return {"message": f"{cls.__name__} with filters {filters} deleted"}
         except NoResultFound:
@@ -169,10 +195,115 @@ class BaseModel(Base):
         """
         objects = [cls(**record) for record in records]
         session.bulk_save_objects(objects)
-        session.commit()
+        session.flush()
         logger.info(f"Bulk created {len(records)} records for {cls.__name__}.")
         return {"message": f"{len(records)} records added successfully"}
 
+    @classmethod
+    def bulk_create_skip_conflicts(
+        cls,
+        session: Session,
+        records: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        returning: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Insert records with one multi-row ``INSERT ... ON CONFLICT DO
+        NOTHING`` and return the ``returning`` columns of the rows that went
+        in. Records clashing with a unique ``conflict_columns`` key (already
+        stored, or earlier in ``records``) are skipped; the caller reports
+        them by what is missing from the result.
+        """
+        if not records:
+            return []
+        dialects = {"postgresql": postgresql, "sqlite": sqlite}
+        dialect = dialects.get(session.get_bind().dialect.name)
+        if dialect is None:
+            raise ValueError(
+                f"bulk_create_skip_conflicts is not supported on "
+                f"{session.get_bind().dialect.name}"
+            )
+        statement = (
+            dialect.insert(cls)
+            .values(records)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(*(getattr(cls, name) for name in returning))
+        )
+        rows = session.execute(statement).mappings().all()
+        logger.info(f"Bulk inserted {len(rows)}/{len(records)} {cls.__name__} records.")
+        return [dict(row) for row in rows]
+
+    @classmethod
+    def patch_json_field(
+        cls,
+        session: Session,
+        filters: Dict[str, Any],
+        column_name: str,
+        key: str,
+        value: Union[str, int, list, dict],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Set ``key`` in the JSON column of the records matching ``filters``
+        with one UPDATE, computed by the database (see ``json_set``); the
+        rest of the document is neither loaded nor rewritten. Dialects that
+        ``json_set`` does not support fall back to loading the records (with
+        row locks) and writing the whole document back.
+
+        Returns the first updated record, or None when nothing matched.
+        """
+        column = cls.__table__.columns.get(column_name)
+        if column is None:
+            raise ValueError(f"Column {column_name} does not exist on the model.")
+        if not isinstance(column.type, JSON):
+            raise ValueError(f"Column {column_name} is not a JSON field.")
+
+        if session.get_bind().dialect.name not in json_set.dialects:
+            return cls._rewrite_json_field(session, filters, column_name, key, value)
+
+        statement = (
+            update(cls)
+            .filter_by(**filters)
+            .values({column_name: json_set(column, key, value)})
+            .returning(*cls.__table__.columns)
+        )
+        # matched objects already in the session are expired, not re-read
+        result = session.execute(
+            statement, execution_options={"synchronize_session": "fetch"}
+        )
+        record = result.mappings().first()
+        if record is None:
+            return None
+        logger.info(
+            f"Patched JSON field '{column_name}.{key}' for {cls.__name__} {filters}"
+        )
+        return dict(record)
+
+    @classmethod
+    def _rewrite_json_field(
+        cls,
+        session: Session,
+        filters: Dict[str, Any],
+        column_name: str,
+        key: str,
+        value: Union[str, int, list, dict],
+    ) -> Optional[Dict[str, Any]]:
+        records = session.scalars(
+            select(cls).filter_by(**filters).with_for_update()
+        ).all()
+        for record in records:
+            document = getattr(record, column_name)
+            # a new dict, so the change is tracked whatever the column held
+            document = dict(document) if isinstance(document, dict) else {}
+            document[key] = value
+            setattr(record, column_name, document)
+        if not records:
+            return None
+        session.flush()
+        logger.info(
+            f"Rewrote JSON field '{column_name}.{key}' for {cls.__name__} {filters}"
+        )
+        return cls.to_dict(records[0])
+
     @classmethod
     def update_json_field(
         cls,
@@ -182,43 +313,146 @@ class BaseModel(Base):
         key: str,
         value: Union[str, int, list, dict],
     ) -> Dict[str, Any]:
-        try:
-            record = session.query(cls).filter_by(id=record_id).one()
+        """
+        Set ``key`` in the JSON column of the record with this id.
+        """
+        record = cls.patch_json_field(
+            session, {"id": record_id}, column_name, key, value
+        )
+        if record is None:
+            raise RecordNotFoundError(cls.__name__, record_id)
+        return record
 
-            # Check if the column exists
-            if not hasattr(record, column_name):
-                raise ValueError(f"Column {column_name} does not exist on the model.")
+    # Async variants for the request path. Each runs the sync implementation
+    # above through AsyncSession.run_sync, so the ORM logic lives in one place
+    # while I/O goes through the asyncio driver without a worker thread.
 
-            json_field = getattr(record, column_name)
+    @classmethod
+    async def aget_all(
+        cls,
+        session: AsyncSession,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact",
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_all.
+        """
+        return await session.run_sync(
+            cls.get_all,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
 
-            # MutableDict takes care of tracking, no need to reassign:
-            if json_field is None:
-                json_field = {}
-                setattr(record, column_name, json_field)
+    @classmethod
+    async def aget_by_id(cls, session: AsyncSession, record_id: Any) -> Dict[str, Any]:
+        """
+        Async variant of get_by_id.
+        """
+        return await session.run_sync(cls.get_by_id, record_id)
 
-            if not isinstance(json_field, dict):
-                raise ValueError(f"Column {column_name} is not a JSON field.")
+    @classmethod
+    async def acreate(cls, session: AsyncSession, **kwargs) -> Dict[str, Any]:
+        """
+        Async variant of create.
+        """
+        return await session.run_sync(cls.create, **kwargs)
 
-            json_field[key] = value  # Automatic change tracking by MutableDict
-            session.commit()
-            logger.info(
-                f"Updated JSON field '{column_name}' for {cls.__name__} with id={record_id}"
-            )
-            return cls.to_dict(record)
-        except NoResultFound:
-            raise RecordNotFoundError(cls.__name__, record_id)
+    @classmethod
+    async def aupdate(
+        cls, session: AsyncSession, record_id: Any, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of update.
+        """
+        return await session.run_sync(cls.update, record_id, **kwargs)
 
-    @staticmethod
-    def _get_pagination_metadata(
-        total_records: int, limit: int, offset: int
-    ) -> Dict[str, int]:
+    @classmethod
+    async def aupdate_by_filters(
+        cls, session: AsyncSession, filters: Dict[str, Any], **kwargs
+    ) -> Dict[str, Any]:
         """
-        Generate pagination metadata.
+        Async variant of update_by_filters.
         """
-        return {
-            "total_records": total_records,
-            "limit": limit,
-            "offset": offset,
-            "current_page": offset // limit + 1,
-            "total_pages": (total_records + limit - 1) // limit,  # Ceiling division
-        }
+        return await session.run_sync(cls.update_by_filters, filters, **kwargs)
+
+    @classmethod
+    async def adelete(cls, session: AsyncSession, record_id: Any) -> Dict[str, str]:
+        """
+        Async variant of delete.
+        """
+        return await session.run_sync(cls.delete, record_id)
+
+    @classmethod
+    async def adelete_by_filters(
+        cls, session: AsyncSession, filters: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        Async variant of delete_by_filters.
+        """
+        return await session.run_sync(cls.delete_by_filters, filters)
+
+    @classmethod
+    async def abulk_create(
+        cls, session: AsyncSession, records: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Async variant of bulk_create.
+        """
+        return await session.run_sync(cls.bulk_create, records)
+
+    @classmethod
+    async def abulk_create_skip_conflicts(
+        cls,
+        session: AsyncSession,
+        records: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        returning: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of bulk_create_skip_conflicts.
+        """
+        return await session.run_sync(
+            cls.bulk_create_skip_conflicts, records, conflict_columns, returning
+        )
+
+    @classmethod
+    async def apatch_json_field(
+        cls,
+        session: AsyncSession,
+        filters: Dict[str, Any],
+        column_name: str,
+        key: str,
+        value: Union[str, int, list, dict],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of patch_json_field.
+        """
+        return await session.run_sync(
+            cls.patch_json_field, filters, column_name, key, value
+        )
+
+    @classmethod
+    async def aupdate_json_field(
+        cls,
+        session: AsyncSession,
+        record_id: Any,
+        column_name: str,
+        key: str,
+        value: Union[str, int, list, dict],
+    ) -> Dict[str, Any]:
+        """
+        Async variant of update_json_field.
+        """
+        return await session.run_sync(
+            cls.update_json_field,
+            record_id=record_id,
+            column_name=column_name,
+            key=key,
+            value=value,
+        )
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, pool
+from sqlalchemy.engine import make_url
+from sqlalchemy_utils import create_database, database_exists
+
+from app.database import Base, DatabaseSessionManager
+from app.utils.config.loader import ConfigLoader
+from app.utils.logging import logger
+
+# register every model on Base.metadata
+from app.database.association_user_company import AssociationUserCompany
+from app.database.company import Company
+from app.database.audit_event import AuditEvent
+from app.database.email_outbox import EmailOutbox
+from app.database.one_time_token import OneTimeToken
+from app.database.role import Role
+from app.database.user import User
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+# schema that databases built before bootstrap existed have, unstamped
+BASELINE_REVISION = "9552b9fc884a"
+
+
+def alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    # keep the application's logging setup intact
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def bootstrap_database(
+    configs: dict = None, revision: str = "head", create_all: bool = None
+) -> None:
+    """
+    Create the configured database if needed and bring its schema up to date.
+
+    This is the only place the application issues DDL; the request path assumes
+    the schema already exists. Run it from ``python -m app.main migrate`` or
+    once at startup with ``--bootstrap-db``.
+
+    Args:
+        configs (dict): Application config, defaults to ``ConfigLoader``.
+        revision (str): Alembic revision to upgrade (or stamp) to.
+        create_all (bool): Build tables straight from the models and stamp
+            ``revision`` instead of running migrations. Defaults to True on
+            SQLite, whose ALTER support the migrations do not target, and on
+            databases without any tables: the early revisions only upgrade
+            the schema they were written against and cannot build it.
+            A database with tables but no Alembic revision was built by the
+            baseline and is stamped ``BASELINE_REVISION`` before upgrading.
+    """
+    configs = configs or ConfigLoader().get_config()
+    url = configs["database_url"]
+
+    if not database_exists(url):
+        logger.info("Creating database")
+        create_database(url)
+
+    if make_url(url).database in (None, "", ":memory:"):
+        # a memory database only exists on the shared engine's connection
+        DatabaseSessionManager.initialize(configs)
+        engine = DatabaseSessionManager().engine
+    else:
+        engine = create_engine(url, poolclass=pool.NullPool)
+
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        if create_all is None:
+            create_all = (
+                connection.dialect.name == "sqlite"
+                or not inspect(connection).get_table_names()
+            )
+        if create_all:
+            logger.info("Creating tables from models, stamping %s", revision)
+            Base.metadata.create_all(bind=connection)
+            command.stamp(config, revision)
+        else:
+            if MigrationContext.configure(connection).get_current_revision() is None:
+                logger.info("Stamping unversioned schema as %s", BASELINE_REVISION)
+                command.stamp(config, BASELINE_REVISION)
+            logger.info("Upgrading database schema to %s", revision)
+            command.upgrade(config, revision)
@@ -1,11 +1,21 @@
+from typing import Dict, List, Tuple
+
 from sqlalchemy import Column, String, Integer
 from sqlalchemy.orm import relationship, backref, Session
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from app.models.user.user import UserRead
+from app.security.membership import membership_changed
+from .association_user_company import AssociationUserCompany
+from .audit_event import AuditEvent
 from .base_model import BaseModel
+from .role import Role
+from .search import TextSearch
 
 
 class Company(BaseModel):
     __tablename__ = "company"
+    search = TextSearch("company", "name", "description", "industry", "email")
+    __table_args__ = search.indexes()
 
     id = Column(Integer, nullable=False, primary_key=True, autoincrement=True)
     name = Column(String(256), nullable=True)
@@ -27,3 +37,49 @@ class Company(BaseModel):
             return cls.to_dict(company)
         except NoResultFound:
             raise ValueError(f"Company with email:{email}, not found.")
+
+    @classmethod
+    def register(
+        cls,
+        session: Session,
+        data: Dict,
+        roles: List[Tuple[str, str]],
+        admin_role: str,
+        created_by: UserRead,
+        address: Dict = None,
+    ) -> dict:
+        """
+        Create a company with its roles (``(name, description)``) and
+        ``created_by`` linked as ``admin_role``, in one flush: the company
+        insert, one multi-row insert for the roles, the link and the
+        ``company.created`` audit event. Returns the company as written,
+        without reading it back.
+        """
+        company = cls(**data, primary_meta_data={"address": address} if address else {})
+        company.roles = [
+            Role(name=name, description=description) for name, description in roles
+        ]
+        session.add(company)
+        session.add(
+            AssociationUserCompany(
+                company=company, user_id=created_by.id, role_name=admin_role
+            )
+        )
+        try:
+            session.flush()
+            # the event needs the company id, so it follows the first flush
+            AuditEvent.record(
+                session,
+                AuditEvent.COMPANY_CREATED,
+                actor=created_by,
+                target_type="company",
+                target_id=company.id,
+                company_id=company.id,
+                payload={"admin_role": admin_role},
+            )
+            session.flush()
+        except IntegrityError as e:
+            # the caller's transaction is rolled back as a whole
+            raise ValueError(f"Integrity error: {e.orig}") from e
+        membership_changed(session, user_id=created_by.id)
+        return cls.to_dict(company)
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    delete,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from .base_model import BaseModel
+
+
+def utcnow() -> datetime:
+    # naive UTC, like the other DateTime columns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class EmailOutbox(BaseModel):
+    """
+    Emails waiting to be sent.
+
+    Rows are written in the same transaction as the change that triggers the
+    email, so a rolled back request sends nothing and a committed one is not
+    lost when SMTP is down. ``app.logic.mailer.EmailDispatcher`` sends them.
+
+    ``context`` can hold secrets such as password reset OTPs, so it is
+    cleared once a row is sent or given up on, and finished rows are purged
+    by ``app.logic.user.tokens.TokenSweeper``.
+    """
+
+    __tablename__ = "email_outbox"
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+    id = Column(Integer, nullable=False, primary_key=True, autoincrement=True)
+    recipient = Column(String(256), nullable=False)
+    subject = Column(String(256), nullable=False)
+    template_name = Column(String(128), nullable=False)
+    context = Column(JSON, nullable=False, default=dict)
+    status = Column(String(16), nullable=False, default=PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(), nullable=False, default=utcnow)
+    sent_at = Column(DateTime(), nullable=True)
+    last_error = Column(String(1024), nullable=True)
+
+    __table_args__ = (
+        # the dispatcher only ever looks at pending rows that are due
+        Index(
+            "ix_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
+    @classmethod
+    def claim_due(
+        cls, session: Session, limit: int = 50, lease: float = 300
+    ) -> List["EmailOutbox"]:
+        """
+        Lock up to ``limit`` due emails and push them ``lease`` seconds out.
+
+        Once the caller commits, other dispatchers skip the claimed rows until
+        the lease runs out, so a dispatcher that dies mid-send only delays
+        its emails. Every claim counts as an attempt.
+        """
+        now = utcnow()
+        emails = list(
+            session.scalars(
+                select(cls)
+                .where(cls.status == cls.PENDING, cls.next_attempt_at <= now)
+                .order_by(cls.next_attempt_at, cls.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        for email in emails:
+            email.attempts += 1
+            email.next_attempt_at = now + timedelta(seconds=lease)
+        session.flush()
+        return emails
+
+    @classmethod
+    def purge(cls, session: Session, before: datetime, limit: int = 1000) -> int:
+        """
+        Delete up to ``limit`` sent or failed emails finished before
+        ``before``; returns how many were deleted.
+        """
+        finished = (
+            select(cls.id)
+            .where(
+                cls.status != cls.PENDING,
+                func.coalesce(cls.sent_at, cls.next_attempt_at) <= before,
+            )
+            .limit(limit)
+        )
+        return session.execute(
+            delete(cls).where(cls.id.in_(finished)),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+
+    def mark_sent(self) -> None:
+        self.status = self.SENT
+        self.sent_at = utcnow()
+        self.last_error = None
+        self.context = {}
+
+    def mark_failed(self, error: str, retry_in: float, max_attempts: int) -> None:
+        """
+        Schedule a retry in ``retry_in`` seconds, or give up after
+        ``max_attempts``.
+        """
+        self.last_error = error[:1024]
+        if self.attempts >= max_attempts:
+            self.status = self.FAILED
+            self.context = {}
+        else:
+            self.next_attempt_at = utcnow() + timedelta(seconds=retry_in)
@@ -0,0 +1,72 @@
+import json
+
+from sqlalchemy import JSON, Text, bindparam, case, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement
+
+# JSON everywhere, JSONB on Postgres so documents can be patched in place
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class json_set(ColumnElement):
+    """
+    ``column`` with its top-level ``key`` set to ``value``, computed by the
+    database, for use in ``UPDATE ... SET column = json_set(...)``:
+
+    - Postgres: ``column || jsonb_build_object(key, value)``
+    - SQLite: ``json_set(column, '$."key"', json(value))``
+
+    Other keys of the document are left as stored, so concurrent patches to
+    different keys do not overwrite each other and the document is never
+    sent back in full. A column that does not hold an object (SQL or JSON
+    null) is treated as an empty object.
+    """
+
+    inherit_cache = False
+    # other dialects patch by loading the document (see BaseModel)
+    dialects = ("postgresql", "sqlite")
+
+    def __init__(self, column, key: str, value) -> None:
+        if '"' in key:
+            raise ValueError(f"Invalid JSON key: {key!r}")
+        self.column = column.expression if hasattr(column, "expression") else column
+        self.type = self.column.type
+        self.key = key
+        self.value = value
+
+
+@compiles(json_set)
+def _compile_json_set(element, compiler, **kw):
+    raise CompileError(
+        f"json_set is not supported on {compiler.dialect.name}; "
+        "use Postgres or SQLite"
+    )
+
+
+@compiles(json_set, "postgresql")
+def _compile_json_set_postgresql(element, compiler, **kw):
+    document = case(
+        (func.jsonb_typeof(element.column) == "object", element.column),
+        else_=literal_column("'{}'::jsonb"),
+    )
+    patch = func.jsonb_build_object(
+        bindparam(None, element.key, unique=True).cast(Text()),
+        bindparam(None, element.value, type_=JSONB(), unique=True).cast(JSONB()),
+    )
+    return compiler.process(document.op("||")(patch), **kw)
+
+
+@compiles(json_set, "sqlite")
+def _compile_json_set_sqlite(element, compiler, **kw):
+    patched = func.json_set(
+        case(
+            (func.json_type(element.column) == "object", element.column),
+            else_=literal_column("'{}'"),
+        ),
+        bindparam(None, f'$."{element.key}"', unique=True),
+        # bound as JSON text and parsed by the database
+        func.json(bindparam(None, json.dumps(element.value), unique=True)),
+    )
+    return compiler.process(patched, **kw)
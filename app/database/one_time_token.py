@@ -0,0 +1,143 @@
+import hashlib
+import hmac
+from datetime import timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    delete,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import Base
+from .email_outbox import utcnow
+
+
+class OneTimeToken(Base):
+    """
+    Short-lived secrets such as password reset OTPs, one per user and purpose.
+
+    Only an HMAC of the token is stored, keyed with a server secret that is
+    not in the database, so a copy of the table is no use for testing
+    guesses offline. Issuing a new token replaces the previous one, every
+    verification counts as an attempt, and a token is deleted once used.
+    Expired rows are removed by ``app.logic.user.tokens.TokenSweeper`` along
+    the ``expires_at`` index.
+    """
+
+    __tablename__ = "one_time_token"
+
+    PASSWORD_RESET = "password_reset"
+
+    user_id = Column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    purpose = Column(String(32), primary_key=True)
+    token_hash = Column(String(64), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    created_at = Column(DateTime(), nullable=False, default=utcnow)
+    expires_at = Column(DateTime(), nullable=False)
+
+    __table_args__ = (Index("ix_one_time_token_expires_at", "expires_at"),)
+
+    @staticmethod
+    def hash_token(secret: bytes, user_id: int, purpose: str, token: str) -> str:
+        return hmac.new(
+            secret, f"{user_id}:{purpose}:{token}".encode(), hashlib.sha256
+        ).hexdigest()
+
+    @classmethod
+    def issue(
+        cls,
+        session: Session,
+        user_id: int,
+        purpose: str,
+        token: str,
+        secret: bytes,
+        ttl: timedelta,
+        max_attempts: int = 5,
+    ) -> None:
+        """
+        Store ``token`` for ``(user_id, purpose)`` with one upsert, replacing
+        any earlier token and its attempt count.
+        """
+        dialects = {"postgresql": postgresql, "sqlite": sqlite}
+        dialect = dialects.get(session.get_bind().dialect.name)
+        if dialect is None:
+            raise ValueError(
+                f"OneTimeToken.issue is not supported on "
+                f"{session.get_bind().dialect.name}"
+            )
+        now = utcnow()
+        values = {
+            "token_hash": cls.hash_token(secret, user_id, purpose, token),
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "created_at": now,
+            "expires_at": now + ttl,
+        }
+        session.execute(
+            dialect.insert(cls)
+            .values(user_id=user_id, purpose=purpose, **values)
+            .on_conflict_do_update(index_elements=["user_id", "purpose"], set_=values)
+        )
+
+    @classmethod
+    def verify(
+        cls, session: Session, user_id: int, purpose: str, token: str, secret: bytes
+    ) -> bool:
+        """
+        Check ``token`` against the live token for ``(user_id, purpose)``.
+
+        The attempt is counted by the same primary key ``UPDATE`` that reads
+        the hash, so concurrent guesses cannot exceed ``max_attempts``. A
+        matching token is deleted so it cannot be used twice. Failed attempts
+        must be committed too for the counter to hold, so run it in a
+        transaction of its own.
+        """
+        key = (cls.user_id == user_id, cls.purpose == purpose)
+        token_hash = session.execute(
+            update(cls)
+            .where(
+                *key,
+                cls.expires_at > utcnow(),
+                cls.attempts < cls.max_attempts,
+            )
+            .values(attempts=cls.attempts + 1)
+            .returning(cls.token_hash),
+            execution_options={"synchronize_session": False},
+        ).scalar()
+        if token_hash is None or not hmac.compare_digest(
+            token_hash, cls.hash_token(secret, user_id, purpose, token)
+        ):
+            return False
+
+        session.execute(
+            delete(cls).where(*key),
+            execution_options={"synchronize_session": False},
+        )
+        return True
+
+    @classmethod
+    def sweep(cls, session: Session, limit: int = 1000) -> int:
+        """
+        Delete up to ``limit`` expired tokens; returns how many were deleted.
+        """
+        expired = (
+            select(cls.user_id, cls.purpose)
+            .where(cls.expires_at <= utcnow())
+            .limit(limit)
+        )
+        return session.execute(
+            delete(cls).where(tuple_(cls.user_id, cls.purpose).in_(expired)),
+            execution_options={"synchronize_session": False},
+        ).rowcount
@@ -0,0 +1,153 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import status
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.utils.app_error import AppError
+
+INVALID_CURSOR = "Invalid pagination cursor"
+# rows counted at most when an estimate is requested and there is no planner
+ESTIMATE_CAP = 1000
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Opaque cursor holding the sort key of the last row on a page.
+    """
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise AppError(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=INVALID_CURSOR,
+            error=f"Cursor must encode {size} sort key value(s)",
+        )
+    return values
+
+
+class Keyset:
+    """
+    Stable ordering plus cursor (keyset) pagination over unique sort columns.
+
+    ``apply`` orders the query by the columns and, given a cursor, starts
+    right after the row it points at with an indexable ``(cols) > (values)``
+    predicate instead of ``OFFSET``, so every page costs the same. One extra
+    row is fetched to tell whether a next page exists. Offset paging still
+    works on the same ordering, so the first page can be requested either way.
+    """
+
+    def __init__(self, *columns) -> None:
+        self.columns = columns
+
+    def apply(self, query, limit: int, offset: int = 0, cursor: Optional[str] = None):
+        query = query.order_by(*self.columns)
+        if cursor:
+            values = decode_cursor(cursor, len(self.columns))
+            if len(self.columns) == 1:
+                query = query.where(self.columns[0] > values[0])
+            else:
+                query = query.where(tuple_(*self.columns) > tuple_(*values))
+        elif offset:
+            query = query.offset(offset)
+        return query.limit(limit + 1)
+
+    @staticmethod
+    def page(
+        rows: Sequence[Any], limit: int, key: Callable[[Any], Sequence[Any]]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Trim the look-ahead row and build the cursor for the next page.
+        """
+        rows = list(rows)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(key(rows[-1]))
+
+
+class Explain(Executable, ClauseElement):
+    """
+    ``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def count_rows(session: Session, statement, mode: str = "exact") -> Optional[int]:
+    """
+    Total rows ``statement`` would return, according to ``mode``.
+
+    - ``exact``: ``SELECT count(*)`` over the filtered query.
+    - ``estimate``: the planner's row estimate on Postgres; elsewhere a count
+      that stops at ``ESTIMATE_CAP`` rows.
+    - ``none``: no count at all, returns None.
+    """
+    if mode == "none":
+        return None
+
+    statement = statement.order_by(None)
+    if mode == "estimate":
+        if session.get_bind().dialect.name == "postgresql":
+            plan = session.execute(Explain(statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        statement = statement.limit(ESTIMATE_CAP)
+
+    return session.scalar(select(func.count()).select_from(statement.subquery()))
+
+
+async def acount_rows(session, statement, mode: str = "exact") -> Optional[int]:
+    """
+    Async variant of count_rows.
+    """
+    return await session.run_sync(count_rows, statement, mode)
+
+
+def pagination_meta(
+    total_records: Optional[int],
+    limit: int,
+    offset: int,
+    cursor: Optional[str] = None,
+    next_cursor: Optional[str] = None,
+    count: str = "exact",
+) -> dict:
+    """
+    Pagination metadata for either mode; page numbers only apply to offsets.
+    """
+    return {
+        "total_records": total_records,
+        "limit": limit,
+        "offset": None if cursor else offset,
+        "current_page": None if cursor else offset // limit + 1,
+        "total_pages": (
+            None
+            if total_records is None
+            else (total_records + limit - 1) // limit  # Ceiling division
+        ),
+        "next_cursor": next_cursor,
+        "count": count,
+    }
@@ -0,0 +1,107 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from opentelemetry import metrics
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    OpenTelemetry metrics for the process-wide connection pools.
+
+    Checked-out and overflow counts are read from the pools whenever the
+    meter collects. The time a request waits for a connection is recorded by
+    ``get_session`` as a histogram, and checkouts that hit ``pool_timeout``
+    are counted separately. Nothing is exported unless a MeterProvider is
+    configured (``[tool.userverse.config.telemetry]``).
+    """
+
+    def __init__(self, meter: metrics.Meter = None) -> None:
+        self._lock = threading.Lock()
+        self._engines = {}
+
+        meter = meter or metrics.get_meter("app.database")
+        meter.create_observable_gauge(
+            "db.client.connection.count",
+            callbacks=[self._observe_connections],
+            description="Connections held by the pool, by state.",
+        )
+        meter.create_observable_gauge(
+            "db.client.connection.overflow",
+            callbacks=[self._observe_overflow],
+            description="Connections opened above pool_size.",
+        )
+        self._wait_histogram = meter.create_histogram(
+            "db.client.connection.wait_time",
+            unit="s",
+            description="Time spent waiting for a pooled connection.",
+        )
+        self._timeout_counter = meter.create_counter(
+            "db.client.connection.timeouts",
+            description="Checkouts that gave up after pool_timeout.",
+        )
+
+    def track(self, name: str, engine) -> None:
+        with self._lock:
+            self._engines[name] = engine
+
+    def untrack(self) -> None:
+        with self._lock:
+            self._engines = {}
+
+    def observe_wait(self, seconds: float, pool_name: str = "async") -> None:
+        self._wait_histogram.record(seconds, {"pool.name": pool_name})
+
+    def record_timeout(self, pool_name: str = "async") -> None:
+        self._timeout_counter.add(1, {"pool.name": pool_name})
+
+    @contextmanager
+    def time_checkout(self, pool_name: str = "async"):
+        """
+        Time the block as a connection checkout from ``pool_name``.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except PoolTimeoutError:
+            self.record_timeout(pool_name)
+            raise
+        self.observe_wait(time.perf_counter() - started, pool_name)
+
+    def health(self) -> dict:
+        """
+        Whether any queue pool has every connection it may open checked out.
+
+        Safe to serve without authentication: pool sizes and wait times are
+        only exported as OpenTelemetry metrics.
+        """
+        saturated = any(
+            pool.checkedout() >= pool.size() + max(pool._max_overflow, 0)
+            for _, pool in self._queue_pools()
+        )
+        return {"status": "saturated" if saturated else "ok"}
+
+    def _queue_pools(self):
+        with self._lock:
+            engines = dict(self._engines)
+        for name, engine in engines.items():
+            if isinstance(engine.pool, QueuePool):
+                yield name, engine.pool
+
+    def _observe_connections(self, options):
+        for name, pool in self._queue_pools():
+            yield metrics.Observation(
+                pool.checkedout(), {"pool.name": name, "state": "used"}
+            )
+            yield metrics.Observation(
+                pool.checkedin(), {"pool.name": name, "state": "idle"}
+            )
+
+    def _observe_overflow(self, options):
+        for name, pool in self._queue_pools():
+            yield metrics.Observation(max(pool.overflow(), 0), {"pool.name": name})
+
+
+pool_metrics = PoolMetrics()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, select, update
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.orm.exc import NoResultFound
@@ -9,7 +9,11 @@ from app.models.company.response_messages import (
     CompanyUserResponseMessages,
 )
 from app.models.user.user import UserRead
+from app.security.membership import membership_cache, membership_changed
+from app.utils.ttl_cache import MISSING
 from app.utils.app_error import AppError
+from .association_user_company import AssociationUserCompany
+from .audit_event import AuditEvent
 from .base_model import BaseModel
 
 
@@ -40,6 +44,10 @@ class Role(BaseModel):
         Returns:
             bool: True if the role belongs to the company, False otherwise.
         """
+        key = (int(company_id), role_name)
+        if membership_cache.get("roles", key) is True:
+            return True
+
         role = (
             session.query(cls)
             .filter_by(
@@ -51,7 +59,9 @@ class Role(BaseModel):
         )
 
         if role:
-            return cls.to_dict(role)
+            # only active roles are cached; deletes and renames invalidate them
+            membership_cache.roles.set(key, True)
+            return True
 
         raise AppError(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -79,7 +89,10 @@ class Role(BaseModel):
             if new_description:
                 role.description = new_description
 
-            session.commit()
+            session.flush()
+            if new_name:
+                # members' role names changed
+                membership_changed(session, company_id=company_id)
             return cls.to_dict(role)
 
         except NoResultFound:
@@ -96,29 +109,17 @@ class Role(BaseModel):
         column_name: str,
         key: str,
         value: any,
-    ):
+    ) -> dict:
         """
         Update a key in a JSON field using (company_id, name) as composite key.
         """
-        role = (
-            session.query(cls).filter_by(company_id=company_id, name=name).one_or_none()
+        role = cls.patch_json_field(
+            session, {"company_id": company_id, "name": name}, column_name, key, value
         )
-        if not role:
+        if role is None:
             raise ValueError(
                 f"Role with company_id={company_id} and name='{name}' not found."
             )
-
-        if not hasattr(role, column_name):
-            raise ValueError(f"Column '{column_name}' does not exist on Role.")
-
-        json_column = getattr(role, column_name)
-        if not isinstance(json_column, dict):
-            raise ValueError(f"Column '{column_name}' is not a JSON field.")
-
-        json_column[key] = value
-        setattr(role, column_name, json_column)
-
-        session.commit()
         return role
 
     @classmethod
@@ -133,6 +134,11 @@ class Role(BaseModel):
         """
         Delete a role and reassign its users to a replacement role.
 
+        Members are moved with one ``UPDATE`` on ``association_user_company``
+        and the role is soft deleted in the same transaction, so no
+        association rows are loaded whatever the role's size. The deletion
+        is recorded as a ``role.deleted`` audit event in the same flush.
+
         Args:
             session: SQLAlchemy session.
             company_id: ID of the company.
@@ -147,44 +153,48 @@ class Role(BaseModel):
         if name_to_delete == replacement_name:
             raise ValueError("Cannot replace a role with itself.")
 
-        role_to_delete = (
-            session.query(cls)
-            .filter_by(company_id=company_id, name=name_to_delete)
-            .one_or_none()
-        )
-
+        roles = {
+            role.name: role
+            for role in session.scalars(
+                select(cls).where(
+                    cls.company_id == company_id,
+                    cls.name.in_([name_to_delete, replacement_name]),
+                    cls._closed_at.is_(None),
+                )
+            )
+        }
+        role_to_delete = roles.get(name_to_delete)
         if not role_to_delete:
             raise ValueError(f"Role '{name_to_delete}' not found.")
-
-        replacement_role = (
-            session.query(cls)
-            .filter_by(company_id=company_id, name=replacement_name)
-            .one_or_none()
-        )
-
-        if not replacement_role:
+        if replacement_name not in roles:
             raise ValueError(f"Replacement role '{replacement_name}' not found.")
 
         # Reassign users to the replacement role
-        reassigned_count = 0
-        for user_link in role_to_delete.users:
-            user_link.role = replacement_role
-            reassigned_count += 1
+        reassigned_count = session.execute(
+            update(AssociationUserCompany)
+            .where(
+                AssociationUserCompany.company_id == company_id,
+                AssociationUserCompany.role_name == name_to_delete,
+            )
+            .values(role_name=replacement_name)
+        ).rowcount
 
-        # Delete the original role
         # Soft delete the role
         role_to_delete._closed_at = func.now()
-        session.add(role_to_delete)
-        session.commit()
-        role_to_delete.update_json_field(
-            session=session,
+        AuditEvent.record(
+            session,
+            AuditEvent.ROLE_DELETED,
+            actor=deleted_by,
+            target_type="role",
+            target_id=name_to_delete,
             company_id=company_id,
-            name=name_to_delete,
-            column_name="primary_meta_data",
-            key="deleted_by",
-            value=deleted_by.model_dump(),
+            payload={
+                "replacement_name": replacement_name,
+                "users_reassigned": reassigned_count,
+            },
         )
-        session.refresh(role_to_delete)
+        session.flush()
+        membership_changed(session, company_id=company_id)
 
         return {
             "message": f"Role '{name_to_delete}' soft deleted and users reassigned to '{replacement_name}'.",
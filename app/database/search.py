@@ -0,0 +1,184 @@
+from sqlalchemy import DDL, Boolean, Index, bindparam, event, func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement, column, table
+
+from . import Base
+
+# the trigram indexes need the extension when create_all builds a Postgres schema
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class TextSearch:
+    """
+    Indexed substring search (``ILIKE '%term%'``) over text columns of a table.
+
+    Declared on the model next to its columns::
+
+        search = TextSearch("user", "first_name", "last_name", "email")
+        __table_args__ = search.indexes()
+
+    and used in queries as ``User.search.contains(User.email, term)``.
+    Columns listed in ``prefix`` also get a ``lower(column)`` index for
+    typeahead lookups with ``starts_with``.
+
+    - Postgres: the filter stays a plain ``ILIKE``, served by the pg_trgm GIN
+      indexes from ``indexes()`` (created by ``create_all`` or the Alembic
+      migrations).
+    - SQLite: ``create_all`` adds an FTS5 shadow table ``<table>_search``
+      using the trigram tokenizer, kept in sync by triggers, and the filter
+      becomes ``id IN (SELECT rowid FROM <table>_search WHERE col LIKE ...)``,
+      which FTS5 answers from its index for terms of three or more characters.
+    - Anything else falls back to ``ILIKE``.
+    """
+
+    def __init__(
+        self, table_name: str, *columns: str, key: str = "id", prefix: tuple = ()
+    ) -> None:
+        self.table_name = table_name
+        self.name = f"{table_name}_search"
+        self.columns = columns
+        self.prefix = prefix
+        self.key = key
+        self.shadow = table(
+            self.name, column("rowid"), *(column(name) for name in columns)
+        )
+        event.listen(Base.metadata, "after_create", self._create_shadow)
+        event.listen(Base.metadata, "before_drop", self._drop_shadow)
+
+    def indexes(self) -> tuple:
+        """
+        Trigram GIN indexes, one per column, only emitted on Postgres; plus a
+        ``lower(column)`` index per ``prefix`` column (``text_pattern_ops`` on
+        Postgres so ``LIKE 'abc%'`` can use it).
+        """
+        trigram = tuple(
+            Index(
+                f"ix_{self.table_name}_{name}_trgm",
+                name,
+                postgresql_using="gin",
+                postgresql_ops={name: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for name in self.columns
+        )
+        prefix = tuple(
+            Index(
+                f"ix_{self.table_name}_{name}_prefix",
+                func.lower(column(name)).label(f"{name}_lower"),
+                postgresql_ops={f"{name}_lower": "text_pattern_ops"},
+            )
+            for name in self.prefix
+        )
+        return trigram + prefix
+
+    def contains(self, mapped_column, term: str) -> ColumnElement:
+        """
+        Case-insensitive "column contains term" filter.
+        """
+        if mapped_column.key not in self.columns:
+            raise ValueError(f"'{mapped_column.key}' is not searchable")
+        return _Contains(self, mapped_column, term)
+
+    def starts_with(self, mapped_column, prefix: str) -> ColumnElement:
+        """
+        Case-insensitive "column starts with prefix" filter on ``lower(column)``.
+        """
+        if mapped_column.key not in self.prefix:
+            raise ValueError(f"'{mapped_column.key}' has no prefix index")
+        return _StartsWith(mapped_column, prefix)
+
+    def sqlite_ddl(self) -> list:
+        quoted = f'"{self.table_name}"'
+        columns = ", ".join(self.columns)
+        new = ", ".join(f"new.{name}" for name in self.columns)
+        old = ", ".join(f"old.{name}" for name in self.columns)
+        insert = (
+            f"INSERT INTO {self.name}(rowid, {columns}) VALUES (new.{self.key}, {new});"
+        )
+        delete = (
+            f"INSERT INTO {self.name}({self.name}, rowid, {columns}) "
+            f"VALUES ('delete', old.{self.key}, {old});"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE {self.name} USING fts5({columns}, "
+            f"content='{self.table_name}', content_rowid='{self.key}', "
+            f"tokenize='trigram')",
+            f"CREATE TRIGGER {self.name}_ai AFTER INSERT ON {quoted} BEGIN {insert} END",
+            f"CREATE TRIGGER {self.name}_ad AFTER DELETE ON {quoted} BEGIN {delete} END",
+            f"CREATE TRIGGER {self.name}_au AFTER UPDATE ON {quoted} "
+            f"BEGIN {delete} {insert} END",
+            # index rows that existed before the shadow table
+            f"INSERT INTO {self.name}({self.name}) VALUES ('rebuild')",
+        ]
+
+    def _create_shadow(self, target, connection, **kw) -> None:
+        if connection.dialect.name != "sqlite":
+            return
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": self.name},
+        ).first()
+        if exists:
+            return
+        for statement in self.sqlite_ddl():
+            connection.exec_driver_sql(statement)
+
+    def _drop_shadow(self, target, connection, **kw) -> None:
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {self.name}")
+
+
+class _Contains(ColumnElement):
+    type = Boolean()
+    inherit_cache = False
+
+    def __init__(self, search: TextSearch, mapped_column, term: str) -> None:
+        self.search = search
+        self.column = mapped_column.expression
+        self.pattern = f"%{term}%"
+
+
+@compiles(_Contains)
+def _compile_contains(element, compiler, **kw):
+    return compiler.process(element.column.ilike(element.pattern), **kw)
+
+
+@compiles(_Contains, "sqlite")
+def _compile_contains_sqlite(element, compiler, **kw):
+    search = element.search
+    matches = select(search.shadow.c.rowid).where(
+        search.shadow.c[element.column.key].like(element.pattern)
+    )
+    key = element.column.table.c[search.key]
+    return compiler.process(key.in_(matches), **kw)
+
+
+class _StartsWith(ColumnElement):
+    type = Boolean()
+    inherit_cache = False
+
+    def __init__(self, mapped_column, prefix: str) -> None:
+        self.column = mapped_column.expression
+        self.prefix = prefix.lower()
+
+
+@compiles(_StartsWith)
+def _compile_starts_with(element, compiler, **kw):
+    escaped = (
+        element.prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    # Rendered inline so the planner sees a constant pattern and can use the
+    # text_pattern_ops index even for prepared statements
+    pattern = bindparam("prefix", escaped + "%", unique=True, literal_execute=True)
+    return compiler.process(func.lower(element.column).like(pattern, escape="\\"), **kw)
+
+
+@compiles(_StartsWith, "sqlite")
+def _compile_starts_with_sqlite(element, compiler, **kw):
+    # SQLite cannot use an expression index for LIKE, but can for a range
+    lowered = func.lower(element.column)
+    upper = element.prefix + "\U0010ffff"
+    return compiler.process((lowered >= element.prefix) & (lowered < upper), **kw)
@@ -2,10 +2,19 @@ from sqlalchemy import Column, String, Integer
 from sqlalchemy.orm import relationship, backref, Session
 from sqlalchemy.exc import NoResultFound
 from .base_model import BaseModel
+from .search import TextSearch
 
 
 class User(BaseModel):
     __tablename__ = "user"
+    search = TextSearch(
+        "user",
+        "first_name",
+        "last_name",
+        "email",
+        prefix=("first_name", "last_name", "email"),
+    )
+    __table_args__ = search.indexes()
 
     id = Column(Integer, nullable=False, primary_key=True, autoincrement=True)
     first_name = Column(String(255), nullable=True)
@@ -1,4 +1,5 @@
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.models.company.user import CompanyUserAdd, CompanyUserRead
@@ -7,13 +8,14 @@ from app.utils.app_error import AppError
 
 # service and repository
 from app.logic.company.user import CompanyUserService
+from app.logic.company.repository.audit import AuditEventRepository
 from app.logic.company.repository.company import CompanyRepository
 
 # database
-from app.database import DatabaseSessionManager
 from app.database.association_user_company import AssociationUserCompany
 
 # models
+from app.models.company.audit import AuditEventQueryParams, AuditEventRead
 from app.models.company.company import (
     CompanyCreate,
     CompanyUpdate,
@@ -31,13 +33,15 @@ from app.models.company.response_messages import CompanyResponseMessages
 class CompanyService:
 
     @staticmethod
-    def create_company(payload: CompanyCreate, created_by: UserRead) -> CompanyRead:
+    async def create_company(
+        session: AsyncSession, payload: CompanyCreate, created_by: UserRead
+    ) -> CompanyRead:
         """
         Create a new company and store its address in primary_meta_data.
         Also sets up default roles (Administrator, Viewer).
         """
-        company_repository = CompanyRepository()
-        company = company_repository.create_company(payload, created_by)
+        company_repository = CompanyRepository(session)
+        company = await company_repository.create_company(payload, created_by)
         if not company:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,8 +50,8 @@ class CompanyService:
         return company
 
     @staticmethod
-    def get_company(
-        user: UserRead, company_id: str = None, email: str = None
+    async def get_company(
+        session: AsyncSession, user: UserRead, company_id: str = None, email: str = None
     ) -> CompanyRead:
         """
         Get a company by its ID.
@@ -57,39 +61,64 @@ class CompanyService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=CompanyResponseMessages.COMPANY_ID_OR_EMAIL_REQUIRED.value,
             )
-        company_repository = CompanyRepository()
+        company_repository = CompanyRepository(session)
         company = None
         if company_id:
-            company = company_repository.get_company_by_id(company_id)
+            company = await company_repository.get_company_by_id(company_id)
 
         if email:
-            company = company_repository.get_company_by_email(email)
+            company = await company_repository.get_company_by_email(email)
 
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=user.id,
+            memberships=user.memberships,
             company_id=company.id,
         )
 
         return company
 
     @staticmethod
-    def update_company(
-        payload: CompanyUpdate, company_id: str, user: UserRead
+    async def update_company(
+        session: AsyncSession, payload: CompanyUpdate, company_id: str, user: UserRead
     ) -> CompanyRead:
         """
         Update a company by its ID.
         """
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=user.id,
+            memberships=user.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
 
-        company_repository = CompanyRepository()
-        company = company_repository.update_company(payload, company_id, user)
+        company_repository = CompanyRepository(session)
+        company = await company_repository.update_company(payload, company_id, user)
         if not company:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=CompanyResponseMessages.COMPANY_UPDATE_FAILED.value,
             )
         return company
+
+    @staticmethod
+    async def get_company_audit_events(
+        session: AsyncSession,
+        company_id: int,
+        params: AuditEventQueryParams,
+        user: UserRead,
+    ) -> PaginatedResponse[AuditEventRead]:
+        """
+        Get a page of the company's audit trail. Administrators only.
+        """
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
+            user_id=user.id,
+            memberships=user.memberships,
+            company_id=company_id,
+            role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
+        )
+        return await AuditEventRepository(session).get_company_events(
+            company_id=company_id, params=params
+        )
@@ -0,0 +1,59 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# database
+from app.database.audit_event import AuditEvent
+from app.database.pagination import Keyset, acount_rows, pagination_meta
+
+# models
+from app.models.company.audit import AuditEventQueryParams, AuditEventRead
+from app.models.generic_pagination import PaginatedResponse, PaginationMeta
+
+
+class AuditEventRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_company_events(
+        self, company_id: int, params: AuditEventQueryParams
+    ) -> PaginatedResponse[AuditEventRead]:
+        """
+        A company's audit events, oldest first, paged by id along the
+        ``(company_id, id)`` index (or the target index when a target is
+        given) instead of scanning metadata documents.
+        """
+        query = select(AuditEvent).where(AuditEvent.company_id == company_id)
+        if params.action:
+            query = query.where(AuditEvent.action == params.action)
+        if params.actor_id is not None:
+            query = query.where(AuditEvent.actor_id == params.actor_id)
+        if params.target_type:
+            query = query.where(AuditEvent.target_type == params.target_type)
+        if params.target_id is not None:
+            query = query.where(AuditEvent.target_id == params.target_id)
+
+        total = await acount_rows(self.session, query, params.count)
+
+        keyset = Keyset(AuditEvent.id)
+        results = await self.session.scalars(
+            keyset.apply(
+                query, params.limit, offset=params.offset, cursor=params.cursor
+            )
+        )
+        events, next_cursor = keyset.page(
+            results, params.limit, key=lambda event: [event.id]
+        )
+
+        return PaginatedResponse[AuditEventRead](
+            records=[AuditEventRead(**AuditEvent.to_dict(event)) for event in events],
+            pagination=PaginationMeta(
+                **pagination_meta(
+                    total,
+                    params.limit,
+                    params.offset,
+                    params.cursor,
+                    next_cursor,
+                    params.count,
+                )
+            ),
+        )
@@ -1,13 +1,14 @@
 from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.utils.app_error import AppError
 
 # database
-from app.database import DatabaseSessionManager
 from app.database.company import Company
-from app.database.role import Role
 from app.database.association_user_company import AssociationUserCompany
+from app.database.pagination import Keyset, acount_rows, pagination_meta
 from sqlalchemy.orm import joinedload
 
 # models
@@ -24,169 +25,168 @@ from app.models.generic_pagination import PaginatedResponse, PaginationMeta
 
 
 class CompanyRepository:
-    def __init__(self):
-        self.db_manager = DatabaseSessionManager()
-
-    def create_company(self, payload: CompanyCreate, created_by) -> CompanyRead:
-        with self.db_manager.session_object() as session:
-            company = self._create_company_record(session, payload)
-            company_id = company["id"]
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_company(self, payload: CompanyCreate, created_by) -> CompanyRead:
+        """
+        Create the company, its default roles and the creator's Administrator
+        link in one flush; the caller's commit makes them visible together.
+        """
+        company = await self.session.run_sync(
+            Company.register,
+            data=payload.model_dump(exclude={"address"}),
+            address=payload.address.model_dump() if payload.address else None,
+            roles=[(role.name_value, role.description) for role in CompanyDefaultRoles],
+            admin_role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
+            created_by=created_by,
+        )
 
-            if payload.address:
-                self._add_company_address(session, company_id, payload.address)
+        return CompanyRead(**self._with_address(company))
 
-            self._create_default_roles(session, company_id)
+    async def get_company_by_id(self, company_id: str) -> CompanyRead:
+        company = await self._get_registered_company(company_id)
 
-            AssociationUserCompany.link_user(
-                session,
-                user_id=created_by.id,
-                company_id=company_id,
-                role_name=CompanyDefaultRoles.ADMINISTRATOR.name_value,
-                added_by=created_by,
+        if not company:
+            raise AppError(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=CompanyResponseMessages.COMPANY_NOT_FOUND.value,
             )
 
-            registered_company = self._get_registered_company(session, company_id)
-            return CompanyRead(**registered_company)
-
-    def get_company_by_id(self, company_id: str) -> CompanyRead:
-        with self.db_manager.session_object() as session:
-            company = self._get_registered_company(session, company_id)
+        return CompanyRead(**company)
 
-            if not company:
-                raise AppError(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    message=CompanyResponseMessages.COMPANY_NOT_FOUND.value,
-                )
-
-            return CompanyRead(**company)
-
-    def get_company_by_email(self, email: str) -> CompanyRead:
-        with self.db_manager.session_object() as session:
-            company = Company.get_company_by_email(session, email)
+    async def get_company_by_email(self, email: str) -> CompanyRead:
+        company = await self.session.run_sync(Company.get_company_by_email, email)
 
-            if not company:
-                raise AppError(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    message=CompanyResponseMessages.COMPANY_NOT_FOUND.value,
-                )
+        if not company:
+            raise AppError(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=CompanyResponseMessages.COMPANY_NOT_FOUND.value,
+            )
 
-            return CompanyRead(**self._get_registered_company(session, company["id"]))
+        return CompanyRead(**await self._get_registered_company(company["id"]))
 
-    def update_company(
+    async def update_company(
         self, payload: CompanyUpdate, company_id: str, user
     ) -> CompanyRead:
-        with self.db_manager.session_object() as session:
-            company = Company.update(session, company_id, **payload.model_dump())
+        company = await Company.aupdate(
+            self.session, company_id, **payload.model_dump()
+        )
 
-            if payload.address:
-                self._add_company_address(session, company_id, payload.address)
+        if payload.address:
+            await self._add_company_address(company_id, payload.address)
 
-            if not company:
-                raise AppError(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=CompanyResponseMessages.COMPANY_UPDATE_FAILED.value,
-                )
+        if not company:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=CompanyResponseMessages.COMPANY_UPDATE_FAILED.value,
+            )
 
-            return CompanyRead(**self._get_registered_company(session, company["id"]))
+        return CompanyRead(**await self._get_registered_company(company["id"]))
+
+    async def get_user_memberships(self, user_id: int) -> dict:
+        """
+        Active memberships of a user as ``{company_id: role_name}``.
+        """
+        rows = await self.session.execute(
+            select(AssociationUserCompany.company_id, AssociationUserCompany.role_name)
+            .join(AssociationUserCompany.company)
+            .where(
+                AssociationUserCompany.user_id == user_id,
+                AssociationUserCompany._closed_at.is_(None),
+                Company._closed_at.is_(None),
+            )
+        )
+        return {company_id: role_name for company_id, role_name in rows}
 
-    def get_user_companies(
+    async def get_user_companies(
         self, user_id: int, params: CompanyQueryParams
     ) -> PaginatedResponse[CompanyRead]:
-        with self.db_manager.session_object() as session:
-            query = (
-                session.query(AssociationUserCompany)
-                .join(AssociationUserCompany.company)
-                .filter(
-                    AssociationUserCompany.user_id == user_id,
-                    AssociationUserCompany._closed_at.is_(None),
-                    Company._closed_at.is_(None),
-                )
+        query = (
+            select(AssociationUserCompany)
+            .join(AssociationUserCompany.company)
+            .where(
+                AssociationUserCompany.user_id == user_id,
+                AssociationUserCompany._closed_at.is_(None),
+                Company._closed_at.is_(None),
             )
+        )
 
-            if params.role_name:
-                query = query.filter(
-                    AssociationUserCompany.role_name.ilike(f"%{params.role_name}%")
-                )
-            if params.name:
-                query = query.filter(Company.name.ilike(f"%{params.name}%"))
-            if params.description:
-                query = query.filter(
-                    Company.description.ilike(f"%{params.description}%")
-                )
-            if params.industry:
-                query = query.filter(Company.industry.ilike(f"%{params.industry}%"))
-            if params.email:
-                query = query.filter(Company.email.ilike(f"%{params.email}%"))
-
-            total = query.count()
-
-            results = (
-                query.options(joinedload(AssociationUserCompany.company))
-                .offset(params.offset)
-                .limit(params.limit)
-                .all()
+        if params.role_name:
+            query = query.where(
+                AssociationUserCompany.role_name.ilike(f"%{params.role_name}%")
             )
-
-            companies = []
-            for assoc in results:
-                registered_company = Company.to_dict(assoc.company)
-                if "primary_meta_data" in registered_company:
-                    primary_meta_data = registered_company.get("primary_meta_data")
-                    if "address" in primary_meta_data:
-                        address = primary_meta_data.get("address")
-                        registered_company["address"] = address
-
-                companies.append(CompanyRead(**registered_company))
-
-            return PaginatedResponse[CompanyRead](
-                records=companies,
-                pagination=PaginationMeta(
-                    total_records=total,
-                    limit=params.limit,
-                    offset=params.offset,
-                    current_page=params.offset // params.limit + 1,
-                    total_pages=(total + params.limit - 1) // params.limit,
-                ),
+        if params.name:
+            query = query.where(Company.search.contains(Company.name, params.name))
+        if params.description:
+            query = query.where(
+                Company.search.contains(Company.description, params.description)
             )
-
-    def _create_company_record(self, session, payload: CompanyCreate) -> dict:
-        company = Company.create(session, **payload.model_dump(exclude={"address"}))
-
-        if not company:
-            raise AppError(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message=CompanyResponseMessages.COMPANY_CREATION_FAILED.value,
+        if params.industry:
+            query = query.where(
+                Company.search.contains(Company.industry, params.industry)
             )
+        if params.email:
+            query = query.where(Company.search.contains(Company.email, params.email))
+
+        total = await acount_rows(self.session, query, params.count)
+
+        keyset = Keyset(AssociationUserCompany.company_id)
+        results = await self.session.scalars(
+            keyset.apply(
+                query.options(joinedload(AssociationUserCompany.company)),
+                params.limit,
+                offset=params.offset,
+                cursor=params.cursor,
+            )
+        )
+        links, next_cursor = keyset.page(
+            results, params.limit, key=lambda assoc: [assoc.company_id]
+        )
 
-        return company
+        companies = []
+        for assoc in links:
+            registered_company = Company.to_dict(assoc.company)
+            if "primary_meta_data" in registered_company:
+                primary_meta_data = registered_company.get("primary_meta_data")
+                if "address" in primary_meta_data:
+                    address = primary_meta_data.get("address")
+                    registered_company["address"] = address
+
+            companies.append(CompanyRead(**registered_company))
+
+        return PaginatedResponse[CompanyRead](
+            records=companies,
+            pagination=PaginationMeta(
+                **pagination_meta(
+                    total,
+                    params.limit,
+                    params.offset,
+                    params.cursor,
+                    next_cursor,
+                    params.count,
+                )
+            ),
+        )
 
-    def _add_company_address(
-        self, session, company_id: str, address: CompanyAddress
+    async def _add_company_address(
+        self, company_id: str, address: CompanyAddress
     ) -> None:
-        Company.update_json_field(
-            session,
+        await Company.aupdate_json_field(
+            self.session,
             record_id=company_id,
             column_name="primary_meta_data",
             key="address",
             value=address.model_dump(),
         )
 
-    def _create_default_roles(self, session, company_id: str) -> None:
-        for role in CompanyDefaultRoles:
-            Role.create(
-                session,
-                company_id=company_id,
-                name=role.name_value,
-                description=role.description,
-            )
-
-    def _get_registered_company(self, session, company_id: str) -> dict:
-        registered_company = Company.get_by_id(session, company_id)
+    async def _get_registered_company(self, company_id: str) -> dict:
+        registered_company = await Company.aget_by_id(self.session, company_id)
+        return self._with_address(registered_company)
 
-        if "primary_meta_data" in registered_company:
-            primary_meta_data = registered_company.get("primary_meta_data")
-            if "address" in primary_meta_data:
-                address = primary_meta_data.get("address")
-                registered_company["address"] = address
-
-        return registered_company
+    @staticmethod
+    def _with_address(company: dict) -> dict:
+        primary_meta_data = company.get("primary_meta_data") or {}
+        if "address" in primary_meta_data:
+            company["address"] = primary_meta_data.get("address")
+        return company
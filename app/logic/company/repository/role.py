@@ -1,13 +1,15 @@
 from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.utils.app_error import AppError
 
 # database
-from app.database import DatabaseSessionManager
 from app.database.company import Company
 from app.database.role import Role
 from app.database.association_user_company import AssociationUserCompany
+from app.database.audit_event import AuditEvent
 
 # models
 from app.models.company.roles import (
@@ -26,11 +28,11 @@ from app.models.company.response_messages import (
 
 class RoleRepository:
 
-    def __init__(self, company_id: int):
+    def __init__(self, session: AsyncSession, company_id: int):
+        self.session = session
         self.company_id = company_id
-        self.db_manager = DatabaseSessionManager()
 
-    def get_roles(
+    async def get_roles(
         self,
         payload: RoleQueryParams,
     ) -> dict:
@@ -38,75 +40,74 @@ class RoleRepository:
         Get paginated roles for the company with optional filtering.
         Excludes soft-deleted roles (_closed_at is not null).
         """
-        with self.db_manager.session_object() as session:
-            try:
-                filters = {
-                    "company_id": Role.company_id == self.company_id,
-                    "_closed_at": Role._closed_at.is_(None),
-                }
-                if payload.name:
-                    filters["name"] = Role.name.ilike(f"%{payload.name}%")
-                if payload.description:
-                    filters["description"] = Role.description.ilike(
-                        f"%{payload.description}%"
-                    )
-
-                return Role.get_all(
-                    session=session,
-                    filters=filters,
-                    limit=payload.limit,
-                    offset=payload.offset,
-                )
-            except Exception as e:
-                raise AppError(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=CompanyRoleResponseMessages.ROLE_NOT_FOUND.value,
-                    error=str(e),
+        try:
+            filters = {
+                "company_id": Role.company_id == self.company_id,
+                "_closed_at": Role._closed_at.is_(None),
+            }
+            if payload.name:
+                filters["name"] = Role.name.ilike(f"%{payload.name}%")
+            if payload.description:
+                filters["description"] = Role.description.ilike(
+                    f"%{payload.description}%"
                 )
 
-    def delete_role(self, payload: RoleDelete, deleted_by: UserRead) -> dict:
+            return await Role.aget_all(
+                self.session,
+                filters=filters,
+                limit=payload.limit,
+                offset=payload.offset,
+                cursor=payload.cursor,
+                count=payload.count,
+            )
+        except Exception as e:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=CompanyRoleResponseMessages.ROLE_NOT_FOUND.value,
+                error=str(e),
+            )
+
+    async def delete_role(self, payload: RoleDelete, deleted_by: UserRead) -> dict:
         """
         Delete role from a company
         """
-        with self.db_manager.session_object() as session:
-            try:
-                updated = Role.delete_role_and_reassign_users(
-                    session=session,
-                    company_id=self.company_id,
-                    name_to_delete=payload.role_name_to_delete,
-                    replacement_name=payload.replacement_role_name,
-                    deleted_by=deleted_by,
-                )
-                return updated
-            except Exception as e:
-                raise AppError(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=CompanyRoleResponseMessages.ROLE_UPDATE_FAILED.value,
-                    error=str(e),
-                )
+        try:
+            updated = await self.session.run_sync(
+                Role.delete_role_and_reassign_users,
+                company_id=self.company_id,
+                name_to_delete=payload.role_name_to_delete,
+                replacement_name=payload.replacement_role_name,
+                deleted_by=deleted_by,
+            )
+            return updated
+        except Exception as e:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=CompanyRoleResponseMessages.ROLE_UPDATE_FAILED.value,
+                error=str(e),
+            )
 
-    def update_role(self, name: str, payload: RoleUpdate) -> RoleRead:
+    async def update_role(self, name: str, payload: RoleUpdate) -> RoleRead:
         """
         Update the description of a role for this company.
         """
-        with self.db_manager.session_object() as session:
-            try:
-                updated = Role.update_role(
-                    session,
-                    company_id=self.company_id,
-                    name=name,
-                    new_description=payload.description,
-                    new_name=payload.name,
-                )
-                return RoleRead(**updated)
-            except Exception as e:
-                raise AppError(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=CompanyRoleResponseMessages.ROLE_UPDATE_FAILED.value,
-                    error=str(e),
-                )
+        try:
+            updated = await self.session.run_sync(
+                Role.update_role,
+                company_id=self.company_id,
+                name=name,
+                new_description=payload.description,
+                new_name=payload.name,
+            )
+            return RoleRead(**updated)
+        except Exception as e:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=CompanyRoleResponseMessages.ROLE_UPDATE_FAILED.value,
+                error=str(e),
+            )
 
-    def create_role(
+    async def create_role(
         self,
         payload: RoleCreate,
         created_by: UserRead,
@@ -125,23 +126,21 @@ class RoleRepository:
         Raises:
             AppError: If role creation fails
         """
-        with self.db_manager.session_object() as session:
-            # 1. Create the role
-            role = self._create_role_record(session, payload, created_by)
+        # 1. Create the role
+        role = await self._create_role_record(payload, created_by)
 
-            # 2. Get the registered role with complete data
-            registered_role = self._get_registered_role(session, role["name"])
+        # 2. Get the registered role with complete data
+        registered_role = await self._get_registered_role(role["name"])
 
-            return RoleRead(**registered_role)
+        return RoleRead(**registered_role)
 
-    def _create_role_record(
-        self, session, payload: RoleCreate, created_by: UserRead
+    async def _create_role_record(
+        self, payload: RoleCreate, created_by: UserRead
     ) -> dict:
         """
         Create a new role record in the database.
 
         Args:
-            session: The database session
             payload: The role data to be created
             created_by: The user who is creating the role
             company_id: The ID of the company
@@ -155,17 +154,17 @@ class RoleRepository:
                 description=payload.description,
                 company_id=self.company_id,
             )
-            session.add(new_role)
-            session.commit()
-            new_role.update_json_field(
-                session=session,
-                company_id=new_role.company_id,
-                name=new_role.name,
-                column_name="primary_meta_data",
-                key="created_by",
-                value=created_by.model_dump(),
+            self.session.add(new_role)
+            AuditEvent.record(
+                self.session,
+                AuditEvent.ROLE_CREATED,
+                actor=created_by,
+                target_type="role",
+                target_id=payload.name,
+                company_id=self.company_id,
+                payload={"description": payload.description},
             )
-            session.refresh(new_role)
+            await self.session.flush()
             return new_role.to_dict(new_role)
         except Exception as e:
             raise AppError(
@@ -174,12 +173,11 @@ class RoleRepository:
                 error=str(e),
             ) from e
 
-    def _get_registered_role(self, session, role_name: str) -> dict:
+    async def _get_registered_role(self, role_name: str) -> dict:
         """
         Get the registered role with complete data.
 
         Args:
-            session: The database session
             role_id: The ID of the role
 
         Returns:
@@ -187,7 +185,7 @@ class RoleRepository:
         """
         try:
 
-            role = session.query(Role).filter(Role.name == role_name).first()
+            role = await self.session.scalar(select(Role).where(Role.name == role_name))
             if not role:
                 raise AppError(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -1,15 +1,27 @@
+from typing import List, Tuple
+
 from fastapi import status
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
-from app.models.company.user import CompanyUserAdd, CompanyUserRead
+from app.models.company.user import (
+    CompanyUserAdd,
+    CompanyUserBulkAddOutcome,
+    CompanyUserBulkAddResult,
+    CompanyUserLookup,
+    CompanyUserLookupParams,
+    CompanyUserRead,
+)
 from app.models.generic_pagination import PaginatedResponse, PaginationMeta
 from app.utils.app_error import AppError
 
 # database
-from app.database import DatabaseSessionManager
 from app.database.user import User
 from app.database.role import Role
 from app.database.association_user_company import AssociationUserCompany
+from app.database.base_model import chunked
+from app.database.pagination import Keyset, acount_rows, pagination_meta
 from sqlalchemy.orm import joinedload
 
 # models
@@ -18,95 +30,205 @@ from app.models.company.response_messages import CompanyResponseMessages
 
 
 class CompanyUserRepository:
-    def __init__(self):
-        self.db_manager = DatabaseSessionManager()
+    def __init__(self, session: AsyncSession):
+        self.session = session
 
-    def add_user_to_company(
+    async def add_user_to_company(
         self, company_id: int, payload: CompanyUserAdd, added_by
     ) -> CompanyUserRead:
-        with self.db_manager.session_object() as session:
-            user = User.get_user_by_email(session=session, email=payload.email)
-            user_id = user.get("id")
+        user = await self.session.run_sync(User.get_user_by_email, email=payload.email)
+        user_id = user.get("id")
+
+        role = await self.session.run_sync(
+            Role.role_belongs_to_company, company_id=company_id, role_name=payload.role
+        )
+        if not role:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Role: {payload.role} is not linked to company",
+            )
 
-            role = Role.role_belongs_to_company(
-                session=session, company_id=company_id, role_name=payload.role
+        assoc = await self.session.run_sync(
+            AssociationUserCompany.link_user,
+            company_id=company_id,
+            user_id=user_id,
+            role_name=payload.role,
+            added_by=added_by,
+        )
+
+        return CompanyUserRead(**user, role_name=assoc.role_name)
+
+    async def add_users_to_company(
+        self, company_id: int, payloads: List[CompanyUserAdd], added_by
+    ) -> Tuple[CompanyUserBulkAddResult, List[Tuple[CompanyUserLookup, str]]]:
+        """
+        Add many users at once, reporting an outcome for every entry.
+
+        Users and roles are resolved with one ``IN`` query each and the new
+        links are written by ``AssociationUserCompany.link_users``. Returns
+        the report and the added users with their roles (for the invites).
+        """
+        emails = {payload.email for payload in payloads if payload.email}
+        users = {}
+        for chunk in chunked(list(emails)):
+            rows = await self.session.execute(
+                select(User.id, User.first_name, User.last_name, User.email).where(
+                    User.email.in_(chunk), User._closed_at.is_(None)
+                )
             )
-            if not role:
-                raise AppError(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Role: {payload.role} is not linked to company",
+            users.update((row.email, CompanyUserLookup(**row._mapping)) for row in rows)
+
+        role_names = {payload.role for payload in payloads}
+        roles = set(
+            await self.session.scalars(
+                select(Role.name).where(
+                    Role.company_id == company_id,
+                    Role.name.in_(role_names),
+                    Role._closed_at.is_(None),
                 )
-
-            assoc = AssociationUserCompany.link_user(
-                session=session,
-                company_id=company_id,
-                user_id=user_id,
-                role_name=role.get("name"),
-                added_by=added_by,
             )
-
-            return CompanyUserRead(**user, role_name=assoc.role_name)
-
-    def remove_user_from_company(
+        )
+
+        outcomes, members, seen = [], {}, set()
+        for payload in payloads:
+            user = users.get(payload.email)
+            outcome = CompanyUserBulkAddOutcome(
+                email=payload.email,
+                role=payload.role,
+                status="added",
+                user_id=user.id if user else None,
+            )
+            if user is None:
+                outcome.status = "user_not_found"
+            elif payload.role not in roles:
+                outcome.status = "role_not_found"
+            elif user.id in seen:
+                outcome.status = "duplicate"
+            else:
+                seen.add(user.id)
+                members[user.id] = payload.role
+            outcomes.append(outcome)
+
+        linked = await self.session.run_sync(
+            AssociationUserCompany.link_users,
+            company_id=company_id,
+            members=members,
+            added_by=added_by,
+        )
+
+        added = []
+        for outcome in outcomes:
+            if outcome.status != "added":
+                continue
+            if outcome.user_id in linked:
+                added.append((users[outcome.email], outcome.role))
+            else:
+                outcome.status = "already_member"
+
+        return (
+            CompanyUserBulkAddResult(
+                added=len(added), failed=len(outcomes) - len(added), results=outcomes
+            ),
+            added,
+        )
+
+    async def remove_user_from_company(
         self, company_id: int, user_id: int, removed_by
     ) -> CompanyUserRead:
-        with self.db_manager.session_object() as session:
-            assoc = AssociationUserCompany.unlink_user(
-                session=session,
-                company_id=company_id,
-                user_id=user_id,
-                removed_by=removed_by,
-            )
+        assoc = await self.session.run_sync(
+            AssociationUserCompany.unlink_user,
+            company_id=company_id,
+            user_id=user_id,
+            removed_by=removed_by,
+        )
 
-            user = User.get_by_id(session=session, record_id=user_id)
-            return CompanyUserRead(**user, role_name=assoc.role_name)
+        user = await User.aget_by_id(self.session, record_id=user_id)
+        return CompanyUserRead(**user, role_name=assoc.role_name)
 
-    def get_company_users(
+    async def get_company_users(
         self, company_id: int, params: UserQueryParams
     ) -> PaginatedResponse[CompanyUserRead]:
-        with self.db_manager.session_object() as session:
-            query = (
-                session.query(AssociationUserCompany)
-                .join(AssociationUserCompany.user)
-                .filter(
-                    AssociationUserCompany.company_id == company_id,
-                    AssociationUserCompany._closed_at.is_(None),
-                    User._closed_at.is_(None),
-                )
+        query = (
+            select(AssociationUserCompany)
+            .join(AssociationUserCompany.user)
+            .where(
+                AssociationUserCompany.company_id == company_id,
+                AssociationUserCompany._closed_at.is_(None),
+                User._closed_at.is_(None),
             )
+        )
 
-            if params.role_name:
-                query = query.filter(
-                    AssociationUserCompany.role_name.ilike(f"%{params.role_name}%")
-                )
-            if params.first_name:
-                query = query.filter(User.first_name.ilike(f"%{params.first_name}%"))
-            if params.last_name:
-                query = query.filter(User.last_name.ilike(f"%{params.last_name}%"))
-            if params.email:
-                query = query.filter(User.email.ilike(f"%{params.email}%"))
-
-            total = query.count()
-
-            results = (
-                query.options(joinedload(AssociationUserCompany.user))
-                .offset(params.offset)
-                .limit(params.limit)
-                .all()
+        if params.role_name:
+            query = query.where(
+                AssociationUserCompany.role_name.ilike(f"%{params.role_name}%")
             )
-
-            users = [
-                CompanyUserRead(**User.to_dict(assoc.user), role_name=assoc.role_name)
-                for assoc in results
-            ]
-
-            return PaginatedResponse[CompanyUserRead](
-                records=users,
-                pagination=PaginationMeta(
-                    total_records=total,
-                    limit=params.limit,
-                    offset=params.offset,
-                    current_page=params.offset // params.limit + 1,
-                    total_pages=(total + params.limit - 1) // params.limit,
+        if params.first_name:
+            query = query.where(
+                User.search.contains(User.first_name, params.first_name)
+            )
+        if params.last_name:
+            query = query.where(User.search.contains(User.last_name, params.last_name))
+        if params.email:
+            query = query.where(User.search.contains(User.email, params.email))
+
+        total = await acount_rows(self.session, query, params.count)
+
+        keyset = Keyset(AssociationUserCompany.user_id)
+        results = await self.session.scalars(
+            keyset.apply(
+                query.options(joinedload(AssociationUserCompany.user)),
+                params.limit,
+                offset=params.offset,
+                cursor=params.cursor,
+            )
+        )
+        links, next_cursor = keyset.page(
+            results, params.limit, key=lambda assoc: [assoc.user_id]
+        )
+
+        users = [
+            CompanyUserRead(**User.to_dict(assoc.user), role_name=assoc.role_name)
+            for assoc in links
+        ]
+
+        return PaginatedResponse[CompanyUserRead](
+            records=users,
+            pagination=PaginationMeta(
+                **pagination_meta(
+                    total,
+                    params.limit,
+                    params.offset,
+                    params.cursor,
+                    next_cursor,
+                    params.count,
+                )
+            ),
+        )
+
+    async def lookup_company_users(
+        self, company_id: int, params: CompanyUserLookupParams
+    ) -> List[CompanyUserLookup]:
+        """
+        Top ``params.limit`` members whose first name, last name or email
+        starts with ``params.q``, ordered by email. Only the lowercase prefix
+        indexes are used; there is no count and no ORM loading.
+        """
+        prefix = params.q
+        query = (
+            select(User.id, User.first_name, User.last_name, User.email)
+            .join(AssociationUserCompany, AssociationUserCompany.user_id == User.id)
+            .where(
+                AssociationUserCompany.company_id == company_id,
+                AssociationUserCompany._closed_at.is_(None),
+                User._closed_at.is_(None),
+                or_(
+                    User.search.starts_with(User.first_name, prefix),
+                    User.search.starts_with(User.last_name, prefix),
+                    User.search.starts_with(User.email, prefix),
                 ),
             )
+            .order_by(func.lower(User.email))
+            .limit(params.limit)
+        )
+        rows = await self.session.execute(query)
+        return [CompanyUserLookup(**row._mapping) for row in rows]
@@ -1,4 +1,5 @@
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.logic.company.user import CompanyUserService
@@ -8,7 +9,6 @@ from app.utils.app_error import AppError
 # repository
 from app.logic.company.repository.role import RoleRepository
 
-
 # models
 from app.models.company.roles import CompanyDefaultRoles, RoleDelete, RoleQueryParams
 from app.models.company.roles import (
@@ -26,19 +26,25 @@ from app.models.company.response_messages import (
 class RoleService:
 
     @staticmethod
-    def update_role(
-        company_id: int, updated_by: UserRead, name: str, payload: RoleUpdate
+    async def update_role(
+        session: AsyncSession,
+        company_id: int,
+        updated_by: UserRead,
+        name: str,
+        payload: RoleUpdate,
     ) -> RoleRead:
         """
         Update the description of a role for a company.
         """
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=updated_by.id,
+            memberships=updated_by.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        role_repository = RoleRepository(company_id=company_id)
-        role = role_repository.update_role(
+        role_repository = RoleRepository(session, company_id=company_id)
+        role = await role_repository.update_role(
             name=name,
             payload=payload,
         )
@@ -50,19 +56,24 @@ class RoleService:
         return role
 
     @staticmethod
-    def create_role(
-        payload: RoleCreate, created_by: UserRead, company_id: int
+    async def create_role(
+        session: AsyncSession,
+        payload: RoleCreate,
+        created_by: UserRead,
+        company_id: int,
     ) -> RoleRead:
         """
         Create a new company role and store its creator in primary_meta_data.
         """
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=created_by.id,
+            memberships=created_by.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        role_repository = RoleRepository(company_id=company_id)
-        role = role_repository.create_role(payload, created_by)
+        role_repository = RoleRepository(session, company_id=company_id)
+        role = await role_repository.create_role(payload, created_by)
         if not role:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -71,29 +82,38 @@ class RoleService:
         return role
 
     @staticmethod
-    def delete_role(payload: RoleDelete, deleted_by: UserRead, company_id: int) -> dict:
-        CompanyUserService.check_if_user_is_in_company(
+    async def delete_role(
+        session: AsyncSession,
+        payload: RoleDelete,
+        deleted_by: UserRead,
+        company_id: int,
+    ) -> dict:
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=deleted_by.id,
+            memberships=deleted_by.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        role_repository = RoleRepository(company_id=company_id)
-        return role_repository.delete_role(payload=payload, deleted_by=deleted_by)
+        role_repository = RoleRepository(session, company_id=company_id)
+        return await role_repository.delete_role(payload=payload, deleted_by=deleted_by)
 
     @staticmethod
-    def get_company_roles(
-        payload: RoleQueryParams, company_id: int, user: UserRead
+    async def get_company_roles(
+        session: AsyncSession, payload: RoleQueryParams, company_id: int, user: UserRead
     ) -> PaginatedResponse[RoleRead]:
         """
         Get company roles with pagination and optional filtering.
         """
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=user.id,
+            memberships=user.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        role_repository = RoleRepository(company_id=company_id)
-        result = role_repository.get_roles(payload=payload)
+        role_repository = RoleRepository(session, company_id=company_id)
+        result = await role_repository.get_roles(payload=payload)
 
         return PaginatedResponse[RoleRead](
             records=[RoleRead(**role) for role in result["records"]],
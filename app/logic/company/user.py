@@ -1,17 +1,27 @@
+from typing import List
+
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.logic.company.repository.company import CompanyRepository
 from app.logic.mailer import MailService
-from app.models.company.user import CompanyUserAdd, CompanyUserRead
+from app.models.company.user import (
+    CompanyUserAdd,
+    CompanyUserBulkAdd,
+    CompanyUserBulkAddResult,
+    CompanyUserLookup,
+    CompanyUserLookupParams,
+    CompanyUserRead,
+)
 from app.models.generic_pagination import PaginatedResponse
+from app.security.membership import MembershipClaim
 from app.utils.app_error import AppError
 
 # repository
 from app.logic.company.repository.user import CompanyUserRepository
 
 # database
-from app.database import DatabaseSessionManager
 from app.database.association_user_company import AssociationUserCompany
 
 
@@ -29,21 +39,30 @@ class CompanyUserService:
     COMPANY_REGISTRATION_SUBJECT = "Company Invite"
 
     @classmethod
-    def add_user_to_company(
-        cls, company_id: int, payload: CompanyUserAdd, added_by: UserRead
+    async def add_user_to_company(
+        cls,
+        session: AsyncSession,
+        company_id: int,
+        payload: CompanyUserAdd,
+        added_by: UserRead,
     ) -> CompanyUserRead:
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=added_by.id,
+            memberships=added_by.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        repository = CompanyUserRepository()
-        user = repository.add_user_to_company(
+        repository = CompanyUserRepository(session)
+        user = await repository.add_user_to_company(
             company_id=company_id, payload=payload, added_by=added_by
         )
-        company = CompanyRepository().get_company_by_id(company_id=company_id)
+        company = await CompanyRepository(session).get_company_by_id(
+            company_id=company_id
+        )
         # Send invite email,
-        MailService.send_template_email(
+        await MailService.enqueue_template_email(
+            session,
             to=user.email,
             subject=cls.COMPANY_REGISTRATION_SUBJECT,
             template_name=cls.COMPANY_REGISTRATION_TEMPLATE,
@@ -55,61 +74,143 @@ class CompanyUserService:
         )
         return user
 
+    @classmethod
+    async def add_users_to_company(
+        cls,
+        session: AsyncSession,
+        company_id: int,
+        payload: CompanyUserBulkAdd,
+        added_by: UserRead,
+    ) -> CompanyUserBulkAddResult:
+        """
+        Add many users to a company; entries that cannot be added are
+        reported instead of failing the request. Invites for the added users
+        are queued together.
+        """
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
+            user_id=added_by.id,
+            memberships=added_by.memberships,
+            company_id=company_id,
+            role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
+        )
+        result, added = await CompanyUserRepository(session).add_users_to_company(
+            company_id=company_id, payloads=payload.users, added_by=added_by
+        )
+        if added:
+            company = await CompanyRepository(session).get_company_by_id(
+                company_id=company_id
+            )
+            await MailService.enqueue_template_emails(
+                session,
+                [
+                    {
+                        "to": user.email,
+                        "subject": cls.COMPANY_REGISTRATION_SUBJECT,
+                        "template_name": cls.COMPANY_REGISTRATION_TEMPLATE,
+                        "context": {
+                            "invitee": " ".join(
+                                name
+                                for name in (user.first_name, user.last_name)
+                                if name
+                            )
+                            or user.email,
+                            "company": company.name,
+                            "role": role_name,
+                        },
+                    }
+                    for user, role_name in added
+                ],
+            )
+        return result
+
     @staticmethod
-    def remove_user_from_company(
+    async def remove_user_from_company(
+        session: AsyncSession,
         company_id: int,
         user_id: int,
         removed_by: UserRead,
     ) -> CompanyUserRead:
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=removed_by.id,
+            memberships=removed_by.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        repository = CompanyUserRepository()
-        return repository.remove_user_from_company(
+        repository = CompanyUserRepository(session)
+        return await repository.remove_user_from_company(
             company_id=company_id,
             user_id=user_id,
             removed_by=removed_by,
         )
 
     @staticmethod
-    def get_company_user(
+    async def get_company_user(
+        session: AsyncSession,
         company_id: int,
         params: UserQueryParams,
         user: UserRead,
     ) -> PaginatedResponse[CompanyUserRead]:
-        CompanyUserService.check_if_user_is_in_company(
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
             user_id=user.id,
+            memberships=user.memberships,
             company_id=company_id,
             role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
         )
-        repository = CompanyUserRepository()
-        return repository.get_company_users(
+        repository = CompanyUserRepository(session)
+        return await repository.get_company_users(
             company_id=company_id,
             params=params,
         )
 
     @staticmethod
-    def check_if_user_is_in_company(
-        user_id: str, company_id: str, role: str = None
+    async def lookup_company_users(
+        session: AsyncSession,
+        company_id: int,
+        params: CompanyUserLookupParams,
+        user: UserRead,
+    ) -> List[CompanyUserLookup]:
+        await CompanyUserService.check_if_user_is_in_company(
+            session,
+            user_id=user.id,
+            memberships=user.memberships,
+            company_id=company_id,
+            role=CompanyDefaultRoles.ADMINISTRATOR.name_value,
+        )
+        repository = CompanyUserRepository(session)
+        return await repository.lookup_company_users(
+            company_id=company_id, params=params
+        )
+
+    @staticmethod
+    async def check_if_user_is_in_company(
+        session: AsyncSession,
+        user_id: str,
+        company_id: str,
+        role: str = None,
+        memberships: MembershipClaim = None,
     ) -> bool:
         """
         Check if the user is linked to the company.
         If a role is provided, check if the user has that role.
+        A fresh membership claim from the access token answers without a query.
         """
-        with DatabaseSessionManager().session_object() as session:
-            # Check if the user is linked to the company
-            linked_company = AssociationUserCompany.is_user_linked_to_company(
-                session=session,
-                user_id=int(user_id),
-                company_id=int(company_id),
-                role_name=role,
+        if memberships is not None and memberships.grants(user_id, company_id, role):
+            return True
+
+        # Check if the user is linked to the company
+        linked_company = await session.run_sync(
+            AssociationUserCompany.is_user_linked_to_company,
+            user_id=int(user_id),
+            company_id=int(company_id),
+            role_name=role,
+        )
+        if not linked_company:
+            raise AppError(
+                status_code=status.HTTP_403_FORBIDDEN,
+                message=CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value,
             )
-            if not linked_company:
-                raise AppError(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    message=CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value,
-                )
 
-            return linked_company
+        return linked_company
@@ -1,9 +1,193 @@
-from app.utils.email.renderer import render_email_template
-from app.utils.email.sender import send_email
+import asyncio
+from typing import List, Mapping, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.database import DatabaseSessionManager
+from app.database.email_outbox import EmailOutbox
+from app.utils.config.loader import ConfigLoader
+from app.utils.email.renderer import render_email
+from app.utils.email.sender import send_email, send_emails
+from app.utils.logging import logger
 
 
 class MailService:
     @staticmethod
     def send_template_email(to: str, subject: str, template_name: str, context: dict):
-        html_body = render_email_template(template_name, context)
-        send_email(to=to, subject=subject, html_body=html_body)
+        email = render_email(template_name, context)
+        send_email(to=to, subject=subject, html_body=email.html, text_body=email.text)
+
+    @staticmethod
+    def send_template_emails(emails: List[dict]) -> List[Optional[Exception]]:
+        """
+        Render and send many emails (``to``, ``subject``, ``template_name``,
+        ``context``) over one pooled SMTP session; returns None or the error
+        for each, in order.
+        """
+        results: List[Optional[Exception]] = [None] * len(emails)
+        rendered, positions = [], []
+        for position, email in enumerate(emails):
+            try:
+                body = render_email(email["template_name"], email["context"])
+            except Exception as e:
+                results[position] = e
+                continue
+            rendered.append((email["to"], email["subject"], body.html, body.text))
+            positions.append(position)
+
+        for position, error in zip(positions, send_emails(rendered)):
+            results[position] = error
+        return results
+
+    @staticmethod
+    async def enqueue_template_email(
+        session: AsyncSession, to: str, subject: str, template_name: str, context: dict
+    ) -> dict:
+        """
+        Queue an email in the outbox as part of the caller's transaction.
+
+        Nothing is sent until the transaction commits and ``EmailDispatcher``
+        picks the row up, so request latency never includes SMTP.
+        """
+        return await EmailOutbox.acreate(
+            session,
+            recipient=to,
+            subject=subject,
+            template_name=template_name,
+            context=context,
+        )
+
+    @staticmethod
+    async def enqueue_template_emails(session: AsyncSession, emails: List[dict]) -> int:
+        """
+        Queue many emails (``to``, ``subject``, ``template_name``, ``context``)
+        in the caller's transaction with one bulk insert.
+        """
+        if not emails:
+            return 0
+        await EmailOutbox.abulk_create(
+            session,
+            [
+                {
+                    "recipient": email["to"],
+                    "subject": email["subject"],
+                    "template_name": email["template_name"],
+                    "context": email["context"],
+                }
+                for email in emails
+            ],
+        )
+        return len(emails)
+
+
+class EmailDispatcher:
+    """
+    Sends the emails queued in ``email_outbox``.
+
+    Each round claims a batch of due emails (committing the claim), sends
+    them over one pooled SMTP session and records each outcome. Failed sends
+    are retried after ``backoff * 2 ** (attempts - 1)`` seconds, capped at
+    ``backoff_max``, and abandoned after ``max_attempts``. Settings come from
+    the ``OUTBOX_*`` keys of the ``email`` config section.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        poll_interval: float = 2,
+        max_attempts: int = 8,
+        backoff: float = 10,
+        backoff_max: float = 3600,
+        lease: float = 300,
+    ) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.lease = lease
+
+    @classmethod
+    def from_config(cls, email_config: Mapping = None) -> "EmailDispatcher":
+        if email_config is None:
+            email_config = ConfigLoader().get_config().get("email", {})
+        return cls(
+            batch_size=email_config.get("OUTBOX_BATCH_SIZE", 50),
+            poll_interval=email_config.get("OUTBOX_POLL_INTERVAL", 2),
+            max_attempts=email_config.get("OUTBOX_MAX_ATTEMPTS", 8),
+            backoff=email_config.get("OUTBOX_BACKOFF", 10),
+            backoff_max=email_config.get("OUTBOX_BACKOFF_MAX", 3600),
+        )
+
+    @staticmethod
+    def runs_in_process(email_config: Mapping = None) -> bool:
+        """
+        Whether API workers run a dispatcher (``OUTBOX_DISPATCHER``, default
+        true); turn it off when ``python -m app.main send-emails`` runs instead.
+        """
+        if email_config is None:
+            email_config = ConfigLoader().get_config().get("email", {})
+        return bool(email_config.get("OUTBOX_DISPATCHER", True))
+
+    def retry_delay(self, attempts: int) -> float:
+        return min(self.backoff * 2 ** max(attempts - 1, 0), self.backoff_max)
+
+    async def dispatch_once(self) -> int:
+        """
+        Send one batch of due emails; returns how many were claimed.
+        """
+        async with DatabaseSessionManager().async_session_object() as session:
+            emails = await session.run_sync(
+                EmailOutbox.claim_due, limit=self.batch_size, lease=self.lease
+            )
+            await session.commit()
+
+            if not emails:
+                return 0
+
+            # one SMTP session for the whole batch
+            results = await run_in_threadpool(
+                MailService.send_template_emails,
+                [
+                    {
+                        "to": email.recipient,
+                        "subject": email.subject,
+                        "template_name": email.template_name,
+                        "context": email.context,
+                    }
+                    for email in emails
+                ],
+            )
+            for email, error in zip(emails, results):
+                if error is None:
+                    email.mark_sent()
+                    continue
+                logger.warning(
+                    "Sending email %s failed (attempt %s): %s",
+                    email.id,
+                    email.attempts,
+                    error,
+                )
+                email.mark_failed(
+                    str(error), self.retry_delay(email.attempts), self.max_attempts
+                )
+            await session.commit()
+
+        return len(emails)
+
+    async def run(self) -> None:
+        """
+        Dispatch until cancelled; full batches are followed immediately.
+        """
+        logger.info("Email outbox dispatcher started")
+        while True:
+            try:
+                claimed = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Email outbox dispatch failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,168 @@
+import csv
+import json
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+
+from app.database import DatabaseSessionManager
+from app.database.user import User
+from app.logic.mailer import MailService
+from app.logic.user.user import UserService
+from app.models.user.user import (
+    UserCreate,
+    UserImportIssue,
+    UserImportSummary,
+    UserLogin,
+)
+
+
+def read_user_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, dict]]:
+    """
+    Yield ``(line, row)`` from a CSV (with a header row) or NDJSON stream,
+    one row at a time. Rows that are not JSON objects are yielded as an
+    error string for the importer to report.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # empty cells are missing values, not empty strings
+            yield reader.line_num, {
+                key.strip(): value.strip() or None
+                for key, value in row.items()
+                if key and value is not None
+            }
+    elif fmt == "ndjson":
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as e:
+                row = f"Invalid JSON: {e}"
+            if not isinstance(row, (dict, str)):
+                row = "Expected a JSON object"
+            yield line, row
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+class UserImporter:
+    """
+    Creates users from a stream of rows (``email``, ``password``,
+    ``first_name``, ``last_name``, ``phone_number``), ``chunk_size`` rows at
+    a time.
+
+    Each chunk is validated with ``UserLogin``/``UserCreate``, inserted with
+    one multi-row insert that skips existing emails, has its registration
+    emails queued, and is committed in its own session, so memory stays flat
+    whatever the input size. Rows that are not imported are passed to
+    ``on_issue``: ``invalid`` rows, ``duplicate`` emails within a chunk, and
+    emails that ``exists`` already (including ones imported by an earlier
+    chunk of the same file).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        send_emails: bool = True,
+        on_issue: Optional[Callable[[UserImportIssue], None]] = None,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.send_emails = send_emails
+        self.on_issue = on_issue or (lambda issue: None)
+
+    async def run(self, rows: Iterable[Tuple[int, dict]]) -> UserImportSummary:
+        summary = UserImportSummary()
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return summary
+            await self.import_chunk(chunk, summary)
+
+    def _issue(
+        self, summary: UserImportSummary, line: int, status: str, email=None, error=None
+    ) -> None:
+        setattr(summary, status, getattr(summary, status) + 1)
+        self.on_issue(
+            UserImportIssue(line=line, email=email, status=status, error=error)
+        )
+
+    def validate(
+        self, chunk: List[Tuple[int, dict]], summary: UserImportSummary
+    ) -> List[Tuple[int, dict]]:
+        records, emails = [], set()
+        for line, row in chunk:
+            summary.rows += 1
+            if isinstance(row, str):
+                self._issue(summary, line, "invalid", error=row)
+                continue
+            email = row.get("email")
+            try:
+                credentials = UserLogin(email=email, password=row.get("password"))
+                user_data = UserCreate(
+                    first_name=row.get("first_name"),
+                    last_name=row.get("last_name"),
+                    phone_number=row.get("phone_number"),
+                )
+            except ValidationError as e:
+                self._issue(summary, line, "invalid", email, error=_validation_error(e))
+                continue
+            if credentials.email in emails:
+                self._issue(summary, line, "duplicate", credentials.email)
+                continue
+            emails.add(credentials.email)
+            records.append(
+                (
+                    line,
+                    {
+                        "email": credentials.email,
+                        "password": credentials.password,
+                        "first_name": user_data.first_name,
+                        "last_name": user_data.last_name,
+                        "phone_number": user_data.phone_number,
+                    },
+                )
+            )
+        return records
+
+    async def import_chunk(
+        self, chunk: List[Tuple[int, dict]], summary: UserImportSummary
+    ) -> None:
+        records = self.validate(chunk, summary)
+        if not records:
+            return
+
+        async with DatabaseSessionManager().async_session_object() as session:
+            created = await User.abulk_create_skip_conflicts(
+                session,
+                [record for _, record in records],
+                conflict_columns=["email"],
+                returning=["email"],
+            )
+            created = {row["email"] for row in created}
+            if self.send_emails and created:
+                await MailService.enqueue_template_emails(
+                    session,
+                    [
+                        UserService.registration_email(
+                            record["email"], record["first_name"], record["last_name"]
+                        )
+                        for _, record in records
+                        if record["email"] in created
+                    ],
+                )
+            await session.commit()
+
+        summary.created += len(created)
+        for line, record in records:
+            if record["email"] not in created:
+                self._issue(summary, line, "exists", record["email"])
@@ -1,4 +1,8 @@
-import string, random
+import secrets
+import string
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # models
 from app.logic.mailer import MailService
@@ -14,37 +18,58 @@ from app.models.user.response_messages import (
     UserResponseMessages,
 )
 from app.utils.app_error import AppError
+from app.utils.config.loader import ConfigLoader
 
 
 class UserPasswordService:
     SEND_OTP_EMAIL_TEMPLATE = "reset_user_password.html"
     OTP_EMAIL_SUBJECT = "Password Reset OTP"
+    OTP_TTL = timedelta(hours=1)
+    OTP_MAX_ATTEMPTS = 5
 
     @classmethod
     def generate_random_string(cls, length=10):
         characters = string.ascii_letters + string.digits
-        return "".join(random.choice(characters) for _ in range(length))
+        return "".join(secrets.choice(characters) for _ in range(length))
+
+    @staticmethod
+    def token_secret() -> bytes:
+        """
+        Key for the HMAC of stored OTPs: ``one_time_tokens.SECRET``, falling
+        back to the JWT secret.
+        """
+        configs = ConfigLoader().get_config()
+        secret = configs.get("one_time_tokens", {}).get("SECRET") or configs.get(
+            "jwt", {}
+        ).get("SECRET", "secret1234")
+        return secret.encode()
 
     @classmethod
-    def request_password_reset(cls, user_email: str) -> GenericResponseModel:
+    async def request_password_reset(
+        cls, session: AsyncSession, user_email: str
+    ) -> GenericResponseModel:
         """
         Request a password reset by sending an OTP to the user's email.
         """
         # check if user exists
-        user_repository = UserRepository()
-        user = user_repository.get_user_by_email(user_email)
+        user_repository = UserRepository(session)
+        user = await user_repository.get_user_by_email(user_email)
         if not user:
             raise ValueError(UserResponseMessages.USER_NOT_FOUND.value)
         # reset token
         token = cls.generate_random_string(length=6)
         # populate the token in the database for the user
-        user_password_repository = UserPasswordRepository()
-        user_password_repository.update_password_reset_token(
-            user_email=user.email,
+        user_password_repository = UserPasswordRepository(session)
+        await user_password_repository.update_password_reset_token(
+            user_id=user.id,
             token=token,
+            secret=cls.token_secret(),
+            ttl=cls.OTP_TTL,
+            max_attempts=cls.OTP_MAX_ATTEMPTS,
         )
         # send email
-        MailService.send_template_email(
+        await MailService.enqueue_template_email(
+            session,
             to=user.email,
             subject=cls.OTP_EMAIL_SUBJECT,
             template_name=cls.SEND_OTP_EMAIL_TEMPLATE,
@@ -60,27 +85,28 @@ class UserPasswordService:
         )
 
     @classmethod
-    def validate_otp_and_change_password(
-        cls, user_email: str, otp: str, new_password
+    async def validate_otp_and_change_password(
+        cls, session: AsyncSession, user_email: str, otp: str, new_password
     ) -> GenericResponseModel:
         """
         Validate the OTP sent to the user's email. Ensure that the OTP is valid and not expired.
         Return token for the next step(Change Password).
         """
         # check if user exists
-        user_repository = UserRepository()
-        user = user_repository.get_user_by_email(user_email)
+        user_repository = UserRepository(session)
+        user = await user_repository.get_user_by_email(user_email)
         if not user:
             raise ValueError(UserResponseMessages.USER_NOT_FOUND.value)
 
         # populate the token in the database for the user
-        user_password_repository = UserPasswordRepository()
-        if user_password_repository.verify_password_reset_token(
-            user_email=user.email,
+        user_password_repository = UserPasswordRepository(session)
+        if await user_password_repository.verify_password_reset_token(
+            user_id=user.id,
             token=otp,
+            secret=cls.token_secret(),
         ):
             # OTP is valid, proceed to change password
-            user_password_repository.update_password(
+            await user_password_repository.update_password(
                 user_email=user.email,
                 new_password=new_password,
             )
@@ -1,11 +1,14 @@
 from fastapi import status
-from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import timedelta
 
 # utils
 from app.utils.app_error import AppError
 
 # database
 from app.database import DatabaseSessionManager
+from app.database.one_time_token import OneTimeToken
 from app.database.user import User
 
 # models
@@ -19,72 +22,60 @@ class UserPasswordRepository:
     verifying, resetting, and changing passwords.
     """
 
-    def __init__(self):
-        self.db_manager = DatabaseSessionManager()
+    def __init__(self, session: AsyncSession):
+        self.session = session
 
-    def update_password_reset_token(self, user_email: str, token: str) -> None:
+    async def update_password_reset_token(
+        self,
+        user_id: int,
+        token: str,
+        secret: bytes,
+        ttl: timedelta,
+        max_attempts: int,
+    ) -> None:
         """
-        Update the password reset token for a user.
+        Store the password reset token for a user, replacing any earlier one.
         """
-        with self.db_manager.session_object() as session:
-            user = session.query(User).filter(User.email == user_email).first()
-            if not user:
-                raise AppError(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    message=UserResponseMessages.USER_NOT_FOUND.value,
-                )
+        await self.session.run_sync(
+            OneTimeToken.issue,
+            user_id=user_id,
+            purpose=OneTimeToken.PASSWORD_RESET,
+            token=token,
+            secret=secret,
+            ttl=ttl,
+            max_attempts=max_attempts,
+        )
 
-            user.update_json_field(
-                session=session,
-                record_id=user.id,
-                column_name="primary_meta_data",
-                key="password_reset",
-                value={
-                    "password_reset_token": token,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-            session.commit()
-
-    def verify_password_reset_token(self, user_email: str, token: str) -> bool:
+    async def verify_password_reset_token(
+        self, user_id: int, token: str, secret: bytes
+    ) -> bool:
         """
-        Verify the password reset token for a user.
-        """
-        with self.db_manager.session_object() as session:
-            user = session.query(User).filter(User.email == user_email).first()
-            if not user:
-                raise AppError(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    message=UserResponseMessages.USER_NOT_FOUND.value,
-                )
-
-            # Check if the token is valid and not expired
-            password_reset_data = user.primary_meta_data.get("password_reset", {})
-            if password_reset_data.get(
-                "password_reset_token"
-            ) == token and datetime.fromisoformat(
-                password_reset_data.get("created_at")
-            ) + timedelta(
-                hours=1
-            ) > datetime.now(
-                timezone.utc
-            ):
-                return True
+        Verify the password reset token for a user; a valid token is used up.
 
-            return False
+        The attempt is committed in its own short transaction, so it counts
+        even when the request then fails and its unit of work is rolled back.
+        """
+        async with DatabaseSessionManager().async_session_object() as session:
+            valid = await session.run_sync(
+                OneTimeToken.verify,
+                user_id=user_id,
+                purpose=OneTimeToken.PASSWORD_RESET,
+                token=token,
+                secret=secret,
+            )
+            await session.commit()
+        return valid
 
-    def update_password(self, user_email: str, new_password: str) -> None:
+    async def update_password(self, user_email: str, new_password: str) -> None:
         """
         Update the password for a user.
         """
-        with self.db_manager.session_object() as session:
-            user = session.query(User).filter(User.email == user_email).first()
-            if not user:
-                raise AppError(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    message=UserResponseMessages.USER_NOT_FOUND.value,
-                )
+        user = await self.session.scalar(select(User).where(User.email == user_email))
+        if not user:
+            raise AppError(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=UserResponseMessages.USER_NOT_FOUND.value,
+            )
 
-            user.password = new_password
-            session.commit()
-            session.refresh(user)
+        user.password = new_password
+        await self.session.flush()
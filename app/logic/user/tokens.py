@@ -0,0 +1,79 @@
+import asyncio
+from datetime import timedelta
+from typing import Mapping
+
+from app.database import DatabaseSessionManager
+from app.database.email_outbox import EmailOutbox, utcnow
+from app.database.one_time_token import OneTimeToken
+from app.utils.config.loader import ConfigLoader
+from app.utils.logging import logger
+
+
+class TokenSweeper:
+    """
+    Deletes expired one-time tokens, and outbox emails finished more than
+    ``outbox_retention`` seconds ago, in the background.
+
+    Expired tokens are already rejected by ``OneTimeToken.verify``; sweeping
+    only keeps the tables small. Each batch is its own short transaction, so
+    a sweep never holds locks for long and several workers may sweep at once.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        interval: float = 300,
+        outbox_retention: float = 7 * 24 * 3600,
+    ) -> None:
+        self.batch_size = batch_size
+        self.interval = interval
+        self.outbox_retention = outbox_retention
+
+    @classmethod
+    def from_config(
+        cls, token_config: Mapping = None, email_config: Mapping = None
+    ) -> "TokenSweeper":
+        configs = ConfigLoader().get_config()
+        if token_config is None:
+            token_config = configs.get("one_time_tokens", {})
+        if email_config is None:
+            email_config = configs.get("email", {})
+        return cls(
+            batch_size=token_config.get("SWEEP_BATCH_SIZE", 1000),
+            interval=token_config.get("SWEEP_INTERVAL", 300),
+            outbox_retention=email_config.get("OUTBOX_RETENTION", 7 * 24 * 3600),
+        )
+
+    async def sweep_once(self) -> int:
+        """
+        Delete one batch of expired tokens and one of old outbox emails;
+        returns the larger count, so a full batch of either is followed
+        immediately.
+        """
+        async with DatabaseSessionManager().async_session_object() as session:
+            tokens = await session.run_sync(OneTimeToken.sweep, limit=self.batch_size)
+            await session.commit()
+        async with DatabaseSessionManager().async_session_object() as session:
+            emails = await session.run_sync(
+                EmailOutbox.purge,
+                before=utcnow() - timedelta(seconds=self.outbox_retention),
+                limit=self.batch_size,
+            )
+            await session.commit()
+        return max(tokens, emails)
+
+    async def run(self) -> None:
+        """
+        Sweep until cancelled; full batches are followed immediately.
+        """
+        logger.info("One-time token sweeper started")
+        while True:
+            try:
+                deleted = await self.sweep_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("One-time token sweep failed")
+                deleted = 0
+            if deleted < self.batch_size:
+                await asyncio.sleep(self.interval)
@@ -1,4 +1,5 @@
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # utils
 from app.logic.company.repository.company import CompanyRepository
@@ -26,9 +27,11 @@ class UserService:
     ACCOUNT_REGISTRATION_SUBJECT = "User Account Registration"
 
     @staticmethod
-    def user_login(user_credentials: UserLogin) -> TokenResponseModel:
-        user_repository = UserRepository()
-        user = user_repository.get_user_by_email(
+    async def user_login(
+        session: AsyncSession, user_credentials: UserLogin
+    ) -> TokenResponseModel:
+        user_repository = UserRepository(session)
+        user = await user_repository.get_user_by_email(
             user_credentials.email, user_credentials.password
         )
         if not user:
@@ -36,23 +39,32 @@ class UserService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 message=UserResponseMessages.INVALID_CREDENTIALS.value,
             )
-        return JWTManager().sign_jwt(user)
+        jwt_manager = JWTManager.get_instance()
+        memberships = None
+        if jwt_manager.membership_claims_enabled:
+            memberships = await CompanyRepository(session).get_user_memberships(user.id)
+        return jwt_manager.sign_jwt(user, memberships=memberships)
 
     @staticmethod
-    def get_user_companies(
+    async def get_user_companies(
+        session: AsyncSession,
         params: CompanyQueryParams,
         user: UserRead,
     ):
-        company_repository = CompanyRepository()
-        return company_repository.get_user_companies(user_id=user.id, params=params)
+        company_repository = CompanyRepository(session)
+        return await company_repository.get_user_companies(
+            user_id=user.id, params=params
+        )
 
     @staticmethod
-    def get_user(user_id: int = None, user_email: str = None) -> UserRead:
-        user_repository = UserRepository()
+    async def get_user(
+        session: AsyncSession, user_id: int = None, user_email: str = None
+    ) -> UserRead:
+        user_repository = UserRepository(session)
         if user_id:
-            return user_repository.get_user_by_id(user_id)
+            return await user_repository.get_user_by_id(user_id)
         elif user_email:
-            return user_repository.get_user_by_email(user_email)
+            return await user_repository.get_user_by_email(user_email)
         else:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -60,10 +72,10 @@ class UserService:
             )
 
     @classmethod
-    def create_user(
-        cls, user_credentials: UserLogin, user_data: UserCreate
+    async def create_user(
+        cls, session: AsyncSession, user_credentials: UserLogin, user_data: UserCreate
     ) -> UserRead:
-        user_repository = UserRepository()
+        user_repository = UserRepository(session)
         data = {
             "first_name": user_data.first_name,
             "last_name": user_data.last_name,
@@ -71,25 +83,39 @@ class UserService:
             "phone_number": user_data.phone_number,
             "password": user_credentials.password,
         }
-        user = user_repository.create_user(data)
+        user = await user_repository.create_user(data)
+        # send email
+        await MailService.enqueue_template_email(
+            session,
+            **cls.registration_email(user.email, user.first_name, user.last_name),
+        )
+
+        return user
+
+    @classmethod
+    def registration_email(
+        cls, email: str, first_name: str = None, last_name: str = None
+    ) -> dict:
+        """
+        The account registration email, as MailService.enqueue_template_email
+        arguments.
+        """
         # TODO: User verification functionality
         verification_link = "https://github.com/SoftwareVerse"
-        # send email
-        MailService.send_template_email(
-            to=user.email,
-            subject=cls.ACCOUNT_REGISTRATION_SUBJECT,
-            template_name=cls.ACCOUNT_REGISTRATION_TEMPLATE,
-            context={
+        return {
+            "to": email,
+            "subject": cls.ACCOUNT_REGISTRATION_SUBJECT,
+            "template_name": cls.ACCOUNT_REGISTRATION_TEMPLATE,
+            "context": {
                 "template_name": cls.ACCOUNT_REGISTRATION_SUBJECT,
-                "user_name": user.first_name + " " + user.last_name,
+                "user_name": " ".join(name for name in (first_name, last_name) if name)
+                or email,
                 "verification_link": verification_link,
             },
-        )
-
-        return user
+        }
 
     @classmethod
-    def update_user(cls, user_id, user_data: UserUpdate):
+    async def update_user(cls, session: AsyncSession, user_id, user_data: UserUpdate):
         data = {}
         if user_data.first_name:
             data["first_name"] = user_data.first_name
@@ -105,5 +131,5 @@ class UserService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=UserResponseMessages.INVALID_REQUEST_MESSAGE.value,
             )
-        user_repository = UserRepository()
-        return user_repository.update_user(user_id, data)
+        user_repository = UserRepository(session)
+        return await user_repository.update_user(user_id, data)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import traceback
 import logging
@@ -8,7 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from uvicorn.config import Config
 from uvicorn.server import Server
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 
 from app.middleware.otel import setup_otel
@@ -23,6 +24,15 @@ from app.routers.user import password
 from app.routers.company import company
 from app.routers.company import roles
 from app.routers.company import users as company_users
+
+# security
+from app.routers.security import jwks
+from app.database import DatabaseSessionManager
+from app.database.pool_metrics import pool_metrics
+from app.logic.mailer import EmailDispatcher
+from app.logic.user.tokens import TokenSweeper
+from app.utils.email.renderer import compile_email_templates
+from app.utils.email.sender import close_smtp_pools
 from app.utils.config.loader import ConfigLoader
 from app.utils.logging import logger, get_uvicorn_log_config
 import logging.config
@@ -32,7 +42,26 @@ import logging.config
 async def lifespan(app: FastAPI):
     logger.info("🚀 Application starting up")
     # Optionally: setup_otel(app)
+    # one engine and connection pool per worker process
+    DatabaseSessionManager.initialize()
+    # email templates are compiled once, not per send
+    compile_email_templates()
+    dispatcher = None
+    if EmailDispatcher.runs_in_process():
+        # sends the emails requests queue in the outbox
+        dispatcher = asyncio.create_task(EmailDispatcher.from_config().run())
+    # deletes expired OTPs and finished outbox emails
+    sweeper = asyncio.create_task(TokenSweeper.from_config().run())
     yield
+    sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await sweeper
+    if dispatcher is not None:
+        dispatcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await dispatcher
+    close_smtp_pools()
+    await DatabaseSessionManager.dispose_async()
     logger.info("🛑 Application shutting down")
 
 
@@ -55,7 +84,18 @@ def create_app() -> FastAPI:
         openapi_tags=UserverseApiTag.list(),
     )
 
-    # setup_otel(app)
+    telemetry = configs.get("telemetry", {})
+    if telemetry.get("ENABLED", False):
+        setup_otel(
+            app,
+            service_name=telemetry.get("SERVICE_NAME", configs.get("name")),
+            collector_endpoint=telemetry.get(
+                "TRACES_ENDPOINT", "http://otel-collector:4318/v1/traces"
+            ),
+            metrics_endpoint=telemetry.get(
+                "METRICS_ENDPOINT", "http://otel-collector:4318/v1/metrics"
+            ),
+        )
     app.add_middleware(LogMiddleware)
     app.add_middleware(
         CORSMiddleware,
@@ -70,6 +110,7 @@ def create_app() -> FastAPI:
     app.include_router(company.router)
     app.include_router(roles.router)
     app.include_router(company_users.router)
+    app.include_router(jwks.router)
 
     @app.get("/")
     async def root():
@@ -89,6 +130,19 @@ def create_app() -> FastAPI:
                 },
             )
 
+    @app.get("/health/database")
+    async def database_pool_health():
+        # pool internals are exported through OTel (telemetry.ENABLED), not here
+        health = pool_metrics.health()
+        return JSONResponse(
+            status_code=(
+                status.HTTP_200_OK
+                if health["status"] == "ok"
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
+            content=health,
+        )
+
     @app.exception_handler(Exception)
     async def app_error_handler(request: Request, exc: Exception):
         logger.error(
@@ -110,7 +164,7 @@ def create_app() -> FastAPI:
     return app
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--port", default=8500, type=int, help="Port to run the server on.")
 @click.option("--host", default="0.0.0.0", type=str, help="Host to run the server on.")
 @click.option(
@@ -132,8 +186,15 @@ def create_app() -> FastAPI:
     type=click.Path(exists=True, dir_okay=False, readable=True),
     help="Path to a custom JSON configuration file.",
 )
+@click.option(
+    "--bootstrap-db",
+    is_flag=True,
+    help="Create the database and migrate its schema once before serving.",
+)
 @click.option("--verbose", is_flag=True, help="Enable verbose logging.")
+@click.pass_context
 def main(
+    ctx: click.Context,
     port: int,
     host: str,
     env: str,
@@ -141,7 +202,10 @@ def main(
     workers: int,
     verbose: bool,
     json_config_path: str | None,
+    bootstrap_db: bool,
 ):
+    if ctx.invoked_subcommand is not None:
+        return
 
     os.environ["ENV"] = env
     if json_config_path:
@@ -163,6 +227,11 @@ def main(
     #
     logging_config = get_uvicorn_log_config(reload=reload, verbose=verbose)
     logging.config.dictConfig(logging_config)
+    if bootstrap_db:
+        from app.database.bootstrap import bootstrap_database
+
+        # once, in the parent, before any worker starts
+        bootstrap_database()
     if reload:
         uvicorn.run(
             "app.main:create_app",
@@ -186,5 +255,168 @@ def main(
         server.run()
 
 
+@main.command()
+@click.option(
+    "--env",
+    default="development",
+    type=click.Choice(["development", "production", "testing"]),
+    help="Environment whose database to migrate.",
+)
+@click.option(
+    "--json_config_path",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    help="Path to a custom JSON configuration file.",
+)
+@click.option("--revision", default="head", help="Alembic revision to upgrade to.")
+@click.option(
+    "--create-all",
+    is_flag=True,
+    default=None,
+    help=(
+        "Create tables from the models and stamp the revision "
+        "(default on SQLite and on databases without tables)."
+    ),
+)
+def migrate(env: str, json_config_path: str | None, revision: str, create_all: bool):
+    """
+    Create the database if needed and bring its schema up to date.
+    """
+    os.environ["ENV"] = env
+    if json_config_path:
+        os.environ["JSON_CONFIG_PATH"] = json_config_path
+
+    from app.database.bootstrap import bootstrap_database
+
+    bootstrap_database(revision=revision, create_all=create_all)
+    logger.info(f"✅ Database schema is at revision '{revision}'")
+
+
+@main.command("send-emails")
+@click.option(
+    "--env",
+    default="development",
+    type=click.Choice(["development", "production", "testing"]),
+    help="Environment whose outbox to send.",
+)
+@click.option(
+    "--json_config_path",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    help="Path to a custom JSON configuration file.",
+)
+@click.option("--once", is_flag=True, help="Send one batch of due emails and exit.")
+def send_emails(env: str, json_config_path: str | None, once: bool):
+    """
+    Run the email outbox dispatcher as a standalone worker.
+    """
+    os.environ["ENV"] = env
+    if json_config_path:
+        os.environ["JSON_CONFIG_PATH"] = json_config_path
+
+    async def dispatch():
+        DatabaseSessionManager.initialize()
+        compile_email_templates()
+        dispatcher = EmailDispatcher.from_config()
+        try:
+            if once:
+                claimed = await dispatcher.dispatch_once()
+                logger.info(f"📧 Processed {claimed} queued email(s)")
+            else:
+                await dispatcher.run()
+        finally:
+            close_smtp_pools()
+            await DatabaseSessionManager.dispose_async()
+
+    asyncio.run(dispatch())
+
+
+@main.command("generate-jwt-key")
+@click.option(
+    "--algorithm",
+    default="EdDSA",
+    type=click.Choice(["EdDSA", "ES256", "ES384", "ES512"]),
+    help="Signing algorithm the key is for.",
+)
+def generate_jwt_key(algorithm: str):
+    """
+    Print a new private key (PEM) to add to the JWT key ring.
+    """
+    from app.security.keys import generate_private_key_pem
+
+    click.echo(generate_private_key_pem(algorithm), nl=False)
+
+
+@main.command("import-users")
+@click.argument("file", type=click.File("r", encoding="utf-8-sig"))
+@click.option(
+    "--env",
+    default="development",
+    type=click.Choice(["development", "production", "testing"]),
+    help="Environment whose database to import into.",
+)
+@click.option(
+    "--json_config_path",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    help="Path to a custom JSON configuration file.",
+)
+@click.option(
+    "--format",
+    "fmt",
+    default=None,
+    type=click.Choice(["csv", "ndjson"]),
+    help="Input format (default: from the file extension, else csv).",
+)
+@click.option(
+    "--chunk-size", default=500, show_default=True, help="Rows per insert/commit."
+)
+@click.option("--no-emails", is_flag=True, help="Do not queue registration emails.")
+@click.option(
+    "--report",
+    default="-",
+    type=click.File("w"),
+    help="Where to write rows that were not imported, as NDJSON (default: stdout).",
+)
+def import_users(
+    file,
+    env: str,
+    json_config_path: str | None,
+    fmt: str | None,
+    chunk_size: int,
+    no_emails: bool,
+    report,
+):
+    """
+    Create users from a CSV or NDJSON FILE ('-' for stdin).
+
+    Columns: email, password, first_name, last_name, phone_number.
+    """
+    os.environ["ENV"] = env
+    if json_config_path:
+        os.environ["JSON_CONFIG_PATH"] = json_config_path
+
+    from app.logic.user.importer import UserImporter, read_user_rows
+
+    if fmt is None:
+        fmt = "ndjson" if file.name.endswith((".ndjson", ".jsonl")) else "csv"
+
+    importer = UserImporter(
+        chunk_size=chunk_size,
+        send_emails=not no_emails,
+        on_issue=lambda issue: report.write(issue.model_dump_json() + "\n"),
+    )
+
+    async def run():
+        DatabaseSessionManager.initialize()
+        try:
+            return await importer.run(read_user_rows(file, fmt))
+        finally:
+            await DatabaseSessionManager.dispose_async()
+
+    summary = asyncio.run(run())
+    logger.info(f"👥 Imported users: {summary.model_dump_json()}")
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,10 @@
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
@@ -11,11 +14,13 @@ def setup_otel(
     app,
     service_name: str = "fastapi-app",
     collector_endpoint="http://otel-collector:4318/v1/traces",
+    metrics_endpoint="http://otel-collector:4318/v1/metrics",
 ):
     """
     Initializes OpenTelemetry tracing and instrumentation for a FastAPI app.
     - service_name: name to appear in OpenSearch traces
     - collector_endpoint: your OTEL collector (HTTP OTLP)
+    - metrics_endpoint: OTLP endpoint for metrics such as the database pool stats
     """
 
     resource = Resource(attributes={SERVICE_NAME: service_name})
@@ -27,6 +32,13 @@ def setup_otel(
     tracer_provider.add_span_processor(span_processor)
     trace.set_tracer_provider(tracer_provider)
 
+    metric_reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=metrics_endpoint)
+    )
+    metrics.set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=[metric_reader])
+    )
+
     # Instrument FastAPI and Requests
     FastAPIInstrumentor.instrument_app(app)
     RequestsInstrumentor().instrument()
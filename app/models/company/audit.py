@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.generic_pagination import CountMode
+
+
+class AuditEventRead(BaseModel):
+    id: int
+    occurred_at: datetime
+    actor_id: Optional[int] = None
+    action: str
+    company_id: Optional[int] = None
+    target_type: str
+    target_id: str
+    payload: Dict[str, Any] = {}
+
+
+class AuditEventQueryParams(BaseModel):
+    limit: int = Field(10, ge=1, le=100)
+    offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page; replaces offset"
+    )
+    count: CountMode = Field(
+        "exact", description="Total records: exact, estimate or none (skip)"
+    )
+    action: Optional[str] = Field(
+        None, description="Filter by action, e.g. company.member_added"
+    )
+    actor_id: Optional[int] = Field(None, description="Filter by acting user")
+    target_type: Optional[str] = Field(
+        None, description="Filter by target type: company, user or role"
+    )
+    target_id: Optional[str] = Field(
+        None, description="Filter by target id; use with target_type"
+    )
@@ -1,6 +1,7 @@
 import re
 from typing import Optional, Literal
 from app.models.company.address import CompanyAddress
+from app.models.generic_pagination import CountMode
 from pydantic import BaseModel, EmailStr, field_validator, Field
 from app.models.phone_number import validate_phone_number_format
 
@@ -43,6 +44,12 @@ class CompanyCreate(BaseModel):
 class CompanyQueryParams(BaseModel):
     limit: int = Field(10, ge=1, le=100)
     offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page; replaces offset"
+    )
+    count: CountMode = Field(
+        "exact", description="Total records: exact, estimate or none (skip)"
+    )
     role_name: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
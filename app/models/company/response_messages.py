@@ -25,11 +25,15 @@ class CompanyResponseMessages(str, Enum):
     COMPANY_DELETED = "Company has been deleted successfully."
     COMPANY_DELETION_FAILED = "Unable to delete company. Please try again later."
 
+    # Company audit trail
+    GET_COMPANY_AUDIT_EVENTS = "Company audit events retrieved successfully."
+
 
 class CompanyUserResponseMessages(str, Enum):
     # Company users
     GET_COMPANY_USERS = "Company users retrieved successfully."
     GET_USER_COMPANIES = "Associated companies retrieved successfully."
+    LOOKUP_COMPANY_USERS = "Matching company users retrieved successfully."
 
     # Add user
     ADD_USER_SUCCESS = "User has been successfully added to the company."
@@ -37,6 +41,7 @@ class CompanyUserResponseMessages(str, Enum):
     ADD_EXISTING_USER_FAILED = (
         "This user is already associated with the specified company."
     )
+    BULK_ADD_USERS = "Bulk add processed; see the outcome of each user."
 
     # Remove user
     REMOVE_USER_SUCCESS = "User has been successfully removed from the company."
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from app.models.company.roles import CompanyDefaultRoles
 from app.models.user.user import UserRead
 
@@ -10,3 +12,55 @@ class CompanyUserRead(UserRead):
 class CompanyUserAdd(BaseModel):
     email: EmailStr = Field(None, example="user.one@email.com")
     role: str = Field(CompanyDefaultRoles.VIEWER.name_value, example="Viewer")
+
+
+class CompanyUserLookup(BaseModel):
+    id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: EmailStr
+
+
+class CompanyUserLookupParams(BaseModel):
+    q: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Prefix of the member's first name, last name or email",
+    )
+    limit: int = Field(10, ge=1, le=50, description="Maximum matches to return")
+
+    @field_validator("q")
+    def strip_query(cls, v: str) -> str:
+        # a blank prefix would match every member
+        v = v.strip()
+        if not v:
+            raise ValueError("q must contain a non-whitespace character")
+        return v
+
+
+class CompanyUserBulkAdd(BaseModel):
+    users: List[CompanyUserAdd] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Email and role of each user to add",
+    )
+
+
+BulkAddStatus = Literal[
+    "added", "already_member", "user_not_found", "role_not_found", "duplicate"
+]
+
+
+class CompanyUserBulkAddOutcome(BaseModel):
+    email: Optional[str] = None
+    role: str
+    status: BulkAddStatus
+    user_id: Optional[int] = None
+
+
+class CompanyUserBulkAddResult(BaseModel):
+    added: int
+    failed: int
+    results: List[CompanyUserBulkAddOutcome]
@@ -1,11 +1,19 @@
 # app/models/generic_pagination.py
-from typing import Generic, List, TypeVar, Optional
+from typing import Generic, List, Literal, TypeVar, Optional
 from pydantic import BaseModel, Field
 
+CountMode = Literal["exact", "estimate", "none"]
+
 
 class PaginationParams(BaseModel):
     limit: int = Field(10, ge=1, le=10)
     offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page; replaces offset"
+    )
+    count: CountMode = Field(
+        "exact", description="Total records: exact, estimate or none (skip)"
+    )
 
 
 T = TypeVar("T")
@@ -13,11 +21,15 @@ T = TypeVar("T")
 
 class PaginationMeta(BaseModel):
 
-    total_records: int
+    # total_records and total_pages are None when count="none"
+    total_records: Optional[int] = None
     limit: int
-    offset: int
-    current_page: int
-    total_pages: int
+    # offset and current_page are None when paging by cursor
+    offset: Optional[int] = None
+    current_page: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    count: CountMode = "exact"
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
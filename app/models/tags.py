@@ -16,6 +16,10 @@ class UserverseApiTag(Enum):
         "Company Role Management",
         "Manage roles and permissions for company users",
     )
+    SECURITY = (
+        "Security",
+        "Public keys for verifying Userverse tokens",
+    )
 
     def __init__(self, name: str, description: str):
         self._name = name
@@ -1,6 +1,7 @@
 import re
-from typing import Optional, Literal
-from pydantic import BaseModel, EmailStr, field_validator, Field
+from typing import Any, Optional, Literal
+from app.models.generic_pagination import CountMode
+from pydantic import BaseModel, EmailStr, field_validator, Field, PrivateAttr
 from app.utils.hash_password import hash_password
 from app.models.phone_number import validate_phone_number_format
 
@@ -45,6 +46,12 @@ class UserRead(BaseModel):
     last_name: Optional[str] = None
     email: EmailStr
     phone_number: Optional[str] = Field(None, example="1236547899")
+    # membership claim from the access token, never serialized
+    _memberships: Any = PrivateAttr(default=None)
+
+    @property
+    def memberships(self):
+        return self._memberships
 
 
 class TokenResponseModel(BaseModel):
@@ -65,7 +72,28 @@ class TokenResponseModel(BaseModel):
 class UserQueryParams(BaseModel):
     limit: int = Field(10, ge=1, le=100)
     offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page; replaces offset"
+    )
+    count: CountMode = Field(
+        "exact", description="Total records: exact, estimate or none (skip)"
+    )
     role_name: Optional[str] = Field(None, description="Filter by role name")
     first_name: Optional[str] = Field(None, description="Filter by user first name")
     last_name: Optional[str] = Field(None, description="Filter by user last name")
     email: Optional[str] = Field(None, description="Filter by user email")
+
+
+class UserImportIssue(BaseModel):
+    line: int = Field(..., description="Line of the row in the import file")
+    email: Optional[str] = None
+    status: Literal["invalid", "duplicate", "exists"]
+    error: Optional[str] = None
+
+
+class UserImportSummary(BaseModel):
+    rows: int = 0
+    created: int = 0
+    invalid: int = 0
+    duplicate: int = 0
+    exists: int = 0
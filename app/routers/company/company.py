@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, status, Query, Path
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Models
+from app.models.company.audit import AuditEventQueryParams, AuditEventRead
 from app.models.company.user import CompanyUserRead
 from app.models.generic_pagination import PaginatedResponse
 from app.models.generic_response import GenericResponseModel
@@ -21,6 +23,9 @@ from app.models.user.user import UserQueryParams, UserRead
 from app.logic.company.company import CompanyService
 from app.logic.company.user import CompanyUserService
 
+# Database
+from app.database import get_session
+
 # Utils
 from app.utils.app_error import AppError
 
@@ -38,9 +43,10 @@ tag = UserverseApiTag.COMPANY_MANAGEMENT.name
         500: {"model": AppErrorResponseModel},
     },
 )
-def create_company_api(
+async def create_company_api(
     payload: CompanyCreate,
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Create a new company and initialize default roles.
@@ -51,7 +57,9 @@ def create_company_api(
     - **Returns**: Created company data
     """
     try:
-        response = CompanyService().create_company(payload, created_by=user)
+        response = await CompanyService().create_company(
+            session, payload, created_by=user
+        )
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=GenericResponseModel(
@@ -74,10 +82,11 @@ def create_company_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_company_api(
+async def get_company_api(
     email: str = Query(None, description="(Optional) Company email address"),
     company_id: int = Query(None, description="(Optional) Company ID"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Retrieve a company by email or company ID.
@@ -88,9 +97,13 @@ def get_company_api(
     """
     try:
         if email:
-            company = CompanyService().get_company(user=user, email=email)
+            company = await CompanyService().get_company(
+                session, user=user, email=email
+            )
         elif company_id:
-            company = CompanyService().get_company(user=user, company_id=company_id)
+            company = await CompanyService().get_company(
+                session, user=user, company_id=company_id
+            )
         else:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -118,10 +131,11 @@ def get_company_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def update_company_api(
+async def update_company_api(
     company_updates: CompanyUpdate,
     company_id: int = Path(..., description="ID of the company to update"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Update company details by its ID.
@@ -130,7 +144,8 @@ def update_company_api(
     - **Returns**: Updated company data
     """
     try:
-        response = CompanyService().update_company(
+        response = await CompanyService().update_company(
+            session,
             payload=company_updates,
             company_id=company_id,
             user=user,
@@ -157,10 +172,11 @@ def update_company_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_company_users_api(
+async def get_company_users_api(
     company_id: int = Path(..., description="Company ID"),
     params: UserQueryParams = Depends(),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Get paginated list of users belonging to a company.
@@ -170,7 +186,8 @@ def get_company_users_api(
     - **Returns**: List of company users
     """
     try:
-        response = CompanyUserService().get_company_user(
+        response = await CompanyUserService().get_company_user(
+            session,
             company_id=company_id,
             params=params,
             user=user,
@@ -184,3 +201,43 @@ def get_company_users_api(
         )
     except (AppError, Exception) as e:
         raise e
+
+
+@router.get(
+    "/company/{company_id}/audit",
+    tags=[tag],
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"model": GenericResponseModel[PaginatedResponse[AuditEventRead]]},
+        400: {"model": AppErrorResponseModel},
+        403: {"model": AppErrorResponseModel},
+        500: {"model": AppErrorResponseModel},
+    },
+)
+async def get_company_audit_events_api(
+    company_id: int = Path(..., description="Company ID"),
+    params: AuditEventQueryParams = Depends(),
+    user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
+):
+    """
+    Get the paginated audit trail of a company: its creation, members added
+    and removed, and roles created and deleted.
+
+    - **Supports**: Filtering by action, actor and target; pagination
+    - **Requires**: Authenticated administrator of the company
+    - **Returns**: Audit events, oldest first
+    """
+    try:
+        response = await CompanyService.get_company_audit_events(
+            session, company_id=company_id, params=params, user=user
+        )
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=GenericResponseModel(
+                message=CompanyResponseMessages.GET_COMPANY_AUDIT_EVENTS.value,
+                data=response.model_dump(mode="json"),
+            ).model_dump(),
+        )
+    except (AppError, Exception) as e:
+        raise e
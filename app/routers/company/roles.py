@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, status, Query, Path
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Models
 from app.models.generic_pagination import PaginatedResponse
@@ -25,6 +26,9 @@ from app.models.user.user import UserRead
 # Business Logic
 from app.logic.company.role import RoleService
 
+# Database
+from app.database import get_session
+
 # Utilities
 from app.utils.app_error import AppError
 
@@ -42,10 +46,11 @@ tag = UserverseApiTag.COMPANY_MANAGEMENT.name
         500: {"model": AppErrorResponseModel},
     },
 )
-def create_role_api(
+async def create_role_api(
     payload: RoleCreate,
     company_id: int = Path(..., description="The unique identifier of the company"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Create a new role for the specified company.
@@ -55,8 +60,8 @@ def create_role_api(
     """
     try:
         role_service = RoleService()
-        response = role_service.create_role(
-            payload=payload, created_by=user, company_id=company_id
+        response = await role_service.create_role(
+            session, payload=payload, created_by=user, company_id=company_id
         )
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
@@ -80,11 +85,12 @@ def create_role_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def update_role_api(
+async def update_role_api(
     payload: RoleUpdate,
     company_id: int = Path(..., description="The company ID associated with the role"),
     name: str = Path(..., description="The name of the role to update"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Update a role's description by its name.
@@ -94,8 +100,8 @@ def update_role_api(
     """
     try:
         role_service = RoleService()
-        response = role_service.update_role(
-            updated_by=user, company_id=company_id, name=name, payload=payload
+        response = await role_service.update_role(
+            session, updated_by=user, company_id=company_id, name=name, payload=payload
         )
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
@@ -119,10 +125,11 @@ def update_role_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def delete_role_api(
+async def delete_role_api(
     payload: RoleDelete,
     company_id: int = Path(..., description="Company ID to delete role from"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Delete a role from a company and reassign affected users to a replacement role.
@@ -131,8 +138,8 @@ def delete_role_api(
     - **Returns**: Success message with result info
     """
     try:
-        response = RoleService.delete_role(
-            payload=payload, deleted_by=user, company_id=company_id
+        response = await RoleService.delete_role(
+            session, payload=payload, deleted_by=user, company_id=company_id
         )
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
@@ -155,10 +162,11 @@ def delete_role_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_company_roles_api(
+async def get_company_roles_api(
     company_id: int = Path(..., description="ID of the company whose roles to fetch"),
     query_params: RoleQueryParams = Depends(),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Get a paginated list of all roles associated with a specific company.
@@ -167,8 +175,8 @@ def get_company_roles_api(
     - **Requires**: Authenticated user
     """
     try:
-        response = RoleService.get_company_roles(
-            payload=query_params, company_id=company_id, user=user
+        response = await RoleService.get_company_roles(
+            session, payload=query_params, company_id=company_id, user=user
         )
         return JSONResponse(
             status_code=status.HTTP_200_OK,
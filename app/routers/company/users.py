@@ -1,8 +1,18 @@
-from fastapi import APIRouter, Depends, status, Path
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status, Path
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Models
-from app.models.company.user import CompanyUserAdd, CompanyUserRead
+from app.models.company.user import (
+    CompanyUserAdd,
+    CompanyUserBulkAdd,
+    CompanyUserBulkAddResult,
+    CompanyUserLookup,
+    CompanyUserLookupParams,
+    CompanyUserRead,
+)
 from app.models.generic_pagination import PaginatedResponse
 from app.models.generic_response import GenericResponseModel
 from app.models.company.company import CompanyRead
@@ -17,6 +27,9 @@ from app.models.user.user import UserQueryParams, UserRead
 # Logic layer
 from app.logic.company.user import CompanyUserService
 
+# Database
+from app.database import get_session
+
 # Utilities
 from app.utils.app_error import AppError
 
@@ -36,10 +49,11 @@ company_id_description = "The ID of the company"
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_company_users_api(
+async def get_company_users_api(
     company_id: int = Path(..., description=company_id_description),
     params: UserQueryParams = Depends(),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Get a paginated list of users associated with a specific company.
@@ -49,8 +63,8 @@ def get_company_users_api(
     """
     try:
         service = CompanyUserService()
-        response = service.get_company_user(
-            company_id=company_id, params=params, user=user
+        response = await service.get_company_user(
+            session, company_id=company_id, params=params, user=user
         )
 
         return JSONResponse(
@@ -64,6 +78,47 @@ def get_company_users_api(
         raise e
 
 
+@router.get(
+    "/company/{company_id}/users/lookup",
+    tags=[tag],
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"model": GenericResponseModel[List[CompanyUserLookup]]},
+        400: {"model": AppErrorResponseModel},
+        403: {"model": AppErrorResponseModel},
+        500: {"model": AppErrorResponseModel},
+    },
+)
+async def lookup_company_users_api(
+    company_id: int = Path(..., description=company_id_description),
+    # a query model, so its validators answer 422 like the field constraints
+    params: CompanyUserLookupParams = Query(),
+    user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
+):
+    """
+    Typeahead lookup of company members by name or email prefix.
+
+    - **Requires**: Authenticated user
+    - **Returns**: id, first name, last name and email of the top matches,
+      without pagination or counts
+    """
+    try:
+        matches = await CompanyUserService.lookup_company_users(
+            session, company_id=company_id, params=params, user=user
+        )
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=GenericResponseModel(
+                message=CompanyUserResponseMessages.LOOKUP_COMPANY_USERS.value,
+                data=[match.model_dump() for match in matches],
+            ).model_dump(),
+        )
+    except (AppError, Exception) as e:
+        raise e
+
+
 @router.post(
     "/company/{company_id}/users",
     tags=[tag],
@@ -74,10 +129,11 @@ def get_company_users_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def add_user_to_company_api(
+async def add_user_to_company_api(
     company_id: int = Path(..., description=company_id_description),
     payload: CompanyUserAdd = ...,
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Add a user to a company with a specified role.
@@ -86,8 +142,8 @@ def add_user_to_company_api(
     - **Returns**: The updated company info or user assignment info
     """
     try:
-        response = CompanyUserService().add_user_to_company(
-            company_id=company_id, payload=payload, added_by=user
+        response = await CompanyUserService().add_user_to_company(
+            session, company_id=company_id, payload=payload, added_by=user
         )
 
         return JSONResponse(
@@ -101,6 +157,47 @@ def add_user_to_company_api(
         raise e
 
 
+@router.post(
+    "/company/{company_id}/users/bulk",
+    tags=[tag],
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"model": GenericResponseModel[CompanyUserBulkAddResult]},
+        400: {"model": AppErrorResponseModel},
+        403: {"model": AppErrorResponseModel},
+        500: {"model": AppErrorResponseModel},
+    },
+)
+async def add_users_to_company_api(
+    company_id: int = Path(..., description=company_id_description),
+    payload: CompanyUserBulkAdd = ...,
+    user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
+):
+    """
+    Add many users to a company, each with a specified role.
+
+    - **Requires**: Authenticated user
+    - **Returns**: The outcome for every entry (added, already a member,
+      unknown user or role, or repeated in the request); invites are sent to
+      the added users
+    """
+    try:
+        response = await CompanyUserService.add_users_to_company(
+            session, company_id=company_id, payload=payload, added_by=user
+        )
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=GenericResponseModel(
+                message=CompanyUserResponseMessages.BULK_ADD_USERS.value,
+                data=response.model_dump(),
+            ).model_dump(),
+        )
+    except (AppError, Exception) as e:
+        raise e
+
+
 @router.delete(
     "/company/{company_id}/user/{user_id}",
     tags=[tag],
@@ -111,10 +208,11 @@ def add_user_to_company_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def delete_user_from_company_api(
+async def delete_user_from_company_api(
     company_id: int = Path(..., description=company_id_description),
     user_id: int = Path(..., description="The ID of the user to remove"),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Remove a specific user from a company.
@@ -123,8 +221,8 @@ def delete_user_from_company_api(
     - **Returns**: The removed user's data
     """
     try:
-        response = CompanyUserService().remove_user_from_company(
-            company_id=company_id, user_id=user_id, removed_by=user
+        response = await CompanyUserService().remove_user_from_company(
+            session, company_id=company_id, user_id=user_id, removed_by=user
         )
 
         return JSONResponse(
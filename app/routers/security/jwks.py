@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Header, Response, status
+
+# Tags
+from app.models.tags import UserverseApiTag
+
+# Auth
+from app.security.jwt import JWTManager
+
+router = APIRouter()
+tag = UserverseApiTag.SECURITY.name
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    tags=[tag],
+    status_code=status.HTTP_200_OK,
+    responses={304: {"description": "JWKS unchanged since the given ETag"}},
+)
+async def jwks_api(if_none_match: str | None = Header(None)):
+    """
+    Public keys for verifying Userverse access tokens locally.
+
+    - **Matches**: the ``kid`` header of each token to a key
+    - **Returns**: A JSON Web Key Set (empty when tokens use a shared HMAC secret)
+    """
+    jwt_manager = JWTManager.get_instance()
+    key_ring = jwt_manager.key_ring
+    headers = {
+        "Cache-Control": f"public, max-age={jwt_manager.JWKS_MAX_AGE}",
+        "ETag": key_ring.jwks_etag,
+    }
+    if if_none_match == key_ring.jwks_etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=key_ring.jwks_json,
+        media_type="application/jwk-set+json",
+        headers=headers,
+    )
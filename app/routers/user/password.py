@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Tags & Models
 from app.models.app_error import AppErrorResponseModel
@@ -12,6 +13,9 @@ from app.models.user.password import PasswordResetRequest, OTPValidationRequest
 from app.security.basic_auth import get_basic_auth_credentials
 from app.logic.user.password import UserPasswordService
 
+# Database
+from app.database import get_session
+
 # Error Handling
 from app.utils.app_error import AppError
 
@@ -28,8 +32,9 @@ tag = UserverseApiTag.USER_PASSWORD_MANAGEMENT.name
         500: {"model": AppErrorResponseModel},
     },
 )
-def password_reset_request_api(
+async def password_reset_request_api(
     input: PasswordResetRequest,
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Trigger a password reset request.
@@ -38,7 +43,9 @@ def password_reset_request_api(
     - **Returns**: Success message
     """
     try:
-        response = UserPasswordService().request_password_reset(input.email)
+        response = await UserPasswordService().request_password_reset(
+            session, input.email
+        )
         return JSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content=response.model_dump(),
@@ -56,9 +63,10 @@ def password_reset_request_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def password_reset_validate_otp_api(
+async def password_reset_validate_otp_api(
     input: OTPValidationRequest,
     credentials: UserLogin = Depends(get_basic_auth_credentials),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Validate OTP and reset password.
@@ -68,7 +76,8 @@ def password_reset_validate_otp_api(
     - **Returns**: Success message
     """
     try:
-        response = UserPasswordService().validate_otp_and_change_password(
+        response = await UserPasswordService().validate_otp_and_change_password(
+            session,
             user_email=credentials.email,
             new_password=credentials.password,
             otp=input.otp,
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Tags & Models
 from app.models.tags import UserverseApiTag
@@ -25,6 +26,9 @@ from app.security.basic_auth import get_basic_auth_credentials
 from app.security.jwt import get_current_user_from_jwt_token
 from app.utils.app_error import AppError
 
+# Database
+from app.database import get_session
+
 # Logic
 from app.logic.user.user import UserService
 
@@ -42,8 +46,9 @@ tag = UserverseApiTag.USER_MANAGEMENT.name
         500: {"model": AppErrorResponseModel},
     },
 )
-def user_login_api(
+async def user_login_api(
     credentials: UserLogin = Depends(get_basic_auth_credentials),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Authenticate user using basic auth credentials.
@@ -51,7 +56,7 @@ def user_login_api(
     - **Returns**: Access token for future authenticated requests
     """
     try:
-        response = UserService().user_login(user_credentials=credentials)
+        response = await UserService().user_login(session, user_credentials=credentials)
         return JSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
@@ -73,9 +78,10 @@ def user_login_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def create_user_api(
+async def create_user_api(
     user: UserCreate,
     credentials: UserLogin = Depends(get_basic_auth_credentials),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Create a new user account.
@@ -84,7 +90,8 @@ def create_user_api(
     - **Returns**: Created user details
     """
     try:
-        response = UserService().create_user(
+        response = await UserService().create_user(
+            session,
             user_credentials=credentials,
             user_data=user,
         )
@@ -109,14 +116,15 @@ def create_user_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_user_api(
+async def get_user_api(
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Retrieve current authenticated user's details.
     """
     try:
-        response = UserService().get_user(user_email=user.email)
+        response = await UserService().get_user(session, user_email=user.email)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={
@@ -138,16 +146,18 @@ def get_user_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def update_user_api(
+async def update_user_api(
     user_updates: UserUpdate,
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Update current authenticated user's profile.
     """
     try:
-        user_db = UserService().get_user(user_email=user.email)
-        response = UserService().update_user(
+        user_db = await UserService().get_user(session, user_email=user.email)
+        response = await UserService().update_user(
+            session,
             user_id=user_db.id,
             user_data=user_updates,
         )
@@ -173,9 +183,10 @@ def update_user_api(
         500: {"model": AppErrorResponseModel},
     },
 )
-def get_user_companies_api(
+async def get_user_companies_api(
     params: CompanyQueryParams = Depends(),
     user: UserRead = Depends(get_current_user_from_jwt_token),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ):
     """
     Get all companies the authenticated user is associated with.
@@ -184,7 +195,9 @@ def get_user_companies_api(
     - **Returns**: Paginated list of companies
     """
     try:
-        response = UserService().get_user_companies(params=params, user=user)
+        response = await UserService().get_user_companies(
+            session, params=params, user=user
+        )
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content=GenericResponseModel(
@@ -1,4 +1,5 @@
 import jwt
+import threading
 import traceback
 from datetime import datetime, timedelta, timezone
 from fastapi import status, Security
@@ -8,21 +9,66 @@ from fastapi.security import APIKeyHeader
 from app.utils.config.loader import ConfigLoader
 from app.models.security_messages import SecurityResponseMessages
 from app.models.user.user import TokenResponseModel, UserRead
+from app.security.keys import KeyRing
+from app.security.membership import MembershipClaim
+from app.security.token_cache import TokenCache
 from app.utils.app_error import AppError
 
 
 class JWTManager:
+    _instance = None
+    _lock = threading.Lock()
+
     def __init__(self):
         # load configs
         loader = ConfigLoader()
         configs = loader.get_config()
         jwt_config = configs.get("jwt", {})
+        self._configs = configs
         self.JWT_SECRET = jwt_config.get("SECRET", "secret1234")
         self.JWT_ALGORITHM = jwt_config.get("ALGORITHM", "HS256")
         self.SESSION_TIMEOUT = int(jwt_config.get("IMEOUT", 15))
         self.REFRESH_TIMEOUT = int(jwt_config.get("REFRESH_TIMEOUT", 60))
-
-    def sign_jwt(self, user: UserRead) -> TokenResponseModel:
+        self.JWKS_MAX_AGE = int(jwt_config.get("JWKS_MAX_AGE", 300))
+        # trusted for the access token's lifetime unless lowered; 0 disables
+        # the company membership claim in access tokens
+        self.MEMBERSHIP_CLAIM_MAX_AGE = int(
+            jwt_config.get("MEMBERSHIP_CLAIM_MAX_AGE", self.SESSION_TIMEOUT * 60)
+        )
+        self.MEMBERSHIP_CLAIM_LIMIT = int(jwt_config.get("MEMBERSHIP_CLAIM_LIMIT", 50))
+        self.key_ring = KeyRing.from_config(jwt_config)
+        self.token_cache = TokenCache(int(jwt_config.get("CACHE_SIZE", 1024)))
+
+    @classmethod
+    def get_instance(cls) -> "JWTManager":
+        """
+        Process-wide manager, rebuilt only when the loaded configuration changes.
+
+        Reusing it keeps the key material and the verified-token cache warm
+        across requests.
+        """
+        instance = cls._instance
+        if instance is None or instance._configs is not ConfigLoader().get_config():
+            with cls._lock:
+                instance = cls._instance
+                if (
+                    instance is None
+                    or instance._configs is not ConfigLoader().get_config()
+                ):
+                    instance = cls._instance = cls()
+        return instance
+
+    @property
+    def membership_claims_enabled(self) -> bool:
+        return self.MEMBERSHIP_CLAIM_MAX_AGE > 0
+
+    def sign_jwt(self, user: UserRead, memberships: dict = None) -> TokenResponseModel:
+        """
+        Sign an access/refresh token pair for ``user``.
+
+        ``memberships`` (company_id -> role_name) is embedded in the access
+        token when membership claims are enabled and it is small enough.
+        """
         now = datetime.now(timezone.utc)
         access_expire = now + timedelta(minutes=self.SESSION_TIMEOUT)
         refresh_expire = now + timedelta(minutes=self.REFRESH_TIMEOUT)
@@ -32,6 +78,13 @@ class JWTManager:
             "type": "access",
             "exp": access_expire,
         }
+        if (
+            memberships is not None
+            and self.membership_claims_enabled
+            and len(memberships) <= self.MEMBERSHIP_CLAIM_LIMIT
+        ):
+            claim = MembershipClaim(memberships, int(now.timestamp()))
+            access_payload.update(claim.to_payload())
 
         refresh_payload = {
             "user": user.model_dump(),
@@ -39,15 +92,19 @@ class JWTManager:
             "exp": refresh_expire,
         }
 
+        signing_key = self.key_ring.active
+        headers = {"kid": signing_key.kid} if signing_key.kid else None
         access_token = jwt.encode(
             payload=access_payload,
-            key=self.JWT_SECRET,
-            algorithm=self.JWT_ALGORITHM,
+            key=signing_key.private_key,
+            algorithm=signing_key.algorithm,
+            headers=headers,
         )
         refresh_token = jwt.encode(
             payload=refresh_payload,
-            key=self.JWT_SECRET,
-            algorithm=self.JWT_ALGORITHM,
+            key=signing_key.private_key,
+            algorithm=signing_key.algorithm,
+            headers=headers,
         )
 
         return TokenResponseModel(
@@ -58,9 +115,19 @@ class JWTManager:
         )
 
     def decode_token(self, token: str) -> UserRead:
+        # a token verified before skips signature checks and model validation
+        cache_key = self.token_cache.digest(token)
+        cached_user = self.token_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+
         try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            verification_key = self.key_ring.verification_key(kid)
             decoded = jwt.decode(
-                token, self.JWT_SECRET, algorithms=[self.JWT_ALGORITHM]
+                token,
+                verification_key.public_key,
+                algorithms=[verification_key.algorithm],
             )
             user = decoded.get("user")
             if not user:
@@ -74,7 +141,14 @@ class JWTManager:
                     message=SecurityResponseMessages.INVALID_TOKEN.value
                     + " for access token",
                 )
-            return UserRead(**user)
+            current_user = UserRead(**user)
+            if self.membership_claims_enabled:
+                current_user._memberships = MembershipClaim.from_payload(
+                    decoded, self.MEMBERSHIP_CLAIM_MAX_AGE
+                )
+            if decoded.get("exp") is not None:
+                self.token_cache.put(cache_key, current_user, decoded["exp"])
+            return current_user
 
         except jwt.ExpiredSignatureError:
             raise AppError(
@@ -148,6 +222,6 @@ async def get_current_user_from_jwt_token(
             error=str(e),
         )
 
-    current_user = JWTManager().decode_token(TOKEN)
+    current_user = JWTManager.get_instance().decode_token(TOKEN)
 
     return current_user
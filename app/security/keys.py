@@ -0,0 +1,154 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Mapping, Optional
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt.algorithms import get_default_algorithms
+
+from app.utils.logging import logger
+
+HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "ES256", "ES384", "ES512", "RS256")
+
+
+class SigningKey:
+    """
+    One entry of the key ring.
+
+    ``private_key`` is None for retired keys that are only kept so tokens
+    signed before a rotation still verify until they expire.
+    """
+
+    def __init__(self, kid: Optional[str], algorithm: str, private_key, public_key):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.private_key = private_key
+        self.public_key = public_key
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm in HMAC_ALGORITHMS
+
+    def to_jwk(self) -> dict:
+        jwk = get_default_algorithms()[self.algorithm].to_jwk(
+            self.public_key, as_dict=True
+        )
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class KeyRing:
+    """
+    Signing and verification keys, looked up by ``kid``.
+
+    Built from the ``[tool.userverse.config.jwt]`` section. With an HMAC
+    ``ALGORITHM`` the shared ``SECRET`` is the only key and nothing is
+    published. With an asymmetric algorithm ``KEYS`` lists the key pairs::
+
+        ALGORITHM = "EdDSA"
+        ACTIVE_KID = "2025-06"
+        KEYS = [
+            { KID = "2025-06", PRIVATE_KEY_PATH = "keys/2025-06.pem" },
+            { KID = "2025-01", PUBLIC_KEY_PATH = "keys/2025-01.pub.pem" },
+        ]
+
+    To rotate, add the new pair, point ``ACTIVE_KID`` at it and keep the
+    previous key (its public half is enough) until the tokens it signed have
+    expired. Every key with a public half is published in the JWKS document.
+    """
+
+    def __init__(self, keys: list, active_kid: Optional[str] = None) -> None:
+        if not keys:
+            raise ValueError("The JWT key ring needs at least one key")
+
+        self.keys = {key.kid: key for key in keys}
+        self.active = self.keys[active_kid] if active_kid else keys[0]
+        if self.active.private_key is None:
+            raise ValueError(f"Active JWT key '{self.active.kid}' has no private key")
+
+        self.jwks = {
+            "keys": [key.to_jwk() for key in keys if not key.is_symmetric],
+        }
+        self.jwks_json = json.dumps(self.jwks, sort_keys=True).encode()
+        self.jwks_etag = '"%s"' % hashlib.sha256(self.jwks_json).hexdigest()[:32]
+
+    @classmethod
+    def from_config(cls, jwt_config: Mapping) -> "KeyRing":
+        algorithm = jwt_config.get("ALGORITHM", "HS256")
+        if algorithm in HMAC_ALGORITHMS:
+            secret = jwt_config.get("SECRET", "secret1234")
+            return cls([SigningKey(jwt_config.get("KID"), algorithm, secret, secret)])
+
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm: '{algorithm}'")
+
+        keys = [
+            cls._load_key(entry, entry.get("ALGORITHM", algorithm))
+            for entry in jwt_config.get("KEYS", ())
+        ]
+        logger.info(
+            "Loaded %s JWT key(s), signing with '%s'",
+            len(keys),
+            jwt_config.get("ACTIVE_KID") or (keys[0].kid if keys else None),
+        )
+        return cls(keys, jwt_config.get("ACTIVE_KID"))
+
+    @staticmethod
+    def _read_pem(entry: Mapping, name: str) -> Optional[bytes]:
+        if entry.get(name):
+            return entry[name].encode()
+        if entry.get(f"{name}_PATH"):
+            return Path(entry[f"{name}_PATH"]).read_bytes()
+        return None
+
+    @classmethod
+    def _load_key(cls, entry: Mapping, algorithm: str) -> SigningKey:
+        kid = entry.get("KID")
+        if not kid:
+            raise ValueError("Every JWT key needs a KID")
+
+        private_pem = cls._read_pem(entry, "PRIVATE_KEY")
+        public_pem = cls._read_pem(entry, "PUBLIC_KEY")
+        private_key = (
+            serialization.load_pem_private_key(private_pem, password=None)
+            if private_pem
+            else None
+        )
+        if public_pem:
+            public_key = serialization.load_pem_public_key(public_pem)
+        elif private_key is not None:
+            public_key = private_key.public_key()
+        else:
+            raise ValueError(f"JWT key '{kid}' has neither a private nor public key")
+
+        return SigningKey(kid, algorithm, private_key, public_key)
+
+    def verification_key(self, kid: Optional[str]) -> SigningKey:
+        if kid is None:
+            return self.active
+        key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown key id '{kid}'")
+        return key
+
+
+def generate_private_key_pem(algorithm: str) -> str:
+    """
+    Generate a new private key for ``algorithm`` as an unencrypted PKCS#8 PEM.
+    """
+    curves = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm in curves:
+        private_key = ec.generate_private_key(curves[algorithm]())
+    else:
+        raise ValueError(f"Cannot generate keys for '{algorithm}'")
+
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
@@ -0,0 +1,186 @@
+import threading
+import time
+from typing import Any, Hashable, Mapping, Optional
+
+from opentelemetry import metrics
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.utils.ttl_cache import MISSING, TTLCache
+
+_meter = metrics.get_meter("app.security")
+_lookups = _meter.create_counter(
+    "auth.membership_cache.lookups",
+    description="Membership/role cache lookups, by cache and result.",
+)
+
+
+class MembershipClaim:
+    """
+    Compact ``company_id -> role_name`` claim carried in access tokens.
+
+    The claim is stamped with the time it was read from the database
+    (``version``) and is trusted for at most ``max_age`` seconds
+    (``jwt.MEMBERSHIP_CLAIM_MAX_AGE``, by default the access token lifetime,
+    since tokens are not re-issued when memberships change). It goes stale
+    earlier when this process records a membership or role change for the
+    user or company after the stamp (see ``MembershipChanges``); a change
+    made by another worker is only seen once the claim ages out, which is
+    the price of skipping the database. Only positive answers are taken from
+    the claim; anything it cannot confirm is checked against the database.
+    """
+
+    CLAIM = "mbr"
+
+    def __init__(
+        self, roles: Mapping[int, str], version: int, max_age: int = 60
+    ) -> None:
+        self.roles = {int(company_id): role for company_id, role in roles.items()}
+        self.version = int(version)
+        self.max_age = max_age
+
+    @classmethod
+    def from_payload(
+        cls, payload: dict, max_age: int = 60
+    ) -> Optional["MembershipClaim"]:
+        claim = payload.get(cls.CLAIM)
+        if not isinstance(claim, dict) or "v" not in claim:
+            return None
+        return cls(claim.get("r", {}), claim["v"], max_age)
+
+    def to_payload(self) -> dict:
+        # JSON object keys are strings
+        return {
+            self.CLAIM: {
+                "v": self.version,
+                "r": {str(company_id): role for company_id, role in self.roles.items()},
+            }
+        }
+
+    def is_fresh(self, user_id: int, company_id: int) -> bool:
+        if time.time() - self.version > self.max_age:
+            return False
+        return not membership_changes.changed_since(user_id, company_id, self.version)
+
+    def grants(self, user_id: int, company_id: int, role_name: str = None) -> bool:
+        """
+        True when the fresh claim shows the user in the company (with the role).
+        """
+        role = self.roles.get(int(company_id))
+        if role is None or (role_name and role != role_name):
+            return False
+        return self.is_fresh(int(user_id), int(company_id))
+
+
+class MembershipChanges:
+    """
+    When this process last changed a user's memberships or a company's roles.
+
+    Marks only matter while a claim issued before them could still be
+    trusted, so anything older than ``horizon`` seconds is pruned.
+    """
+
+    def __init__(self, horizon: int = 3600) -> None:
+        self.horizon = horizon
+        self._users = {}
+        self._companies = {}
+        self._lock = threading.Lock()
+
+    def user_changed(self, user_id: int) -> None:
+        self._mark(self._users, int(user_id))
+
+    def company_changed(self, company_id: int) -> None:
+        self._mark(self._companies, int(company_id))
+
+    def changed_since(self, user_id: int, company_id: int, version: int) -> bool:
+        return (
+            self._users.get(user_id, 0) >= version
+            or self._companies.get(company_id, 0) >= version
+        )
+
+    def _mark(self, marks: dict, key: int) -> None:
+        now = time.time()
+        with self._lock:
+            marks[key] = now
+            if len(marks) > 1024:
+                cutoff = now - self.horizon
+                for stale in [k for k, v in marks.items() if v < cutoff]:
+                    del marks[stale]
+
+
+membership_changes = MembershipChanges()
+
+
+class MembershipCache:
+    """
+    In-process TTL+LRU cache for authorization lookups.
+
+    ``links`` maps ``(user_id, company_id)`` to the member's role name (None
+    when not linked); ``roles`` maps ``(company_id, role_name)`` to True for
+    active roles. Writes invalidate through ``membership_changed``; the TTL
+    bounds how long another worker's change can go unseen.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 30) -> None:
+        self.links = TTLCache(max_size, ttl)
+        self.roles = TTLCache(max_size, ttl)
+
+    def get(self, cache_name: str, key: Hashable) -> Any:
+        value = getattr(self, cache_name).get(key)
+        result = "miss" if value is MISSING else "hit"
+        _lookups.add(1, {"cache": cache_name, "result": result})
+        return value
+
+    def invalidate_user(self, user_id: int) -> None:
+        self.links.invalidate(lambda key: key[0] == user_id)
+
+    def invalidate_company(self, company_id: int) -> None:
+        self.links.invalidate(lambda key: key[1] == company_id)
+        self.roles.invalidate(lambda key: key[0] == company_id)
+
+    def clear(self) -> None:
+        self.links.clear()
+        self.roles.clear()
+
+    def stats(self) -> dict:
+        return {"links": self.links.stats(), "roles": self.roles.stats()}
+
+
+membership_cache = MembershipCache()
+
+_PENDING = "membership_changes"
+
+
+def membership_changed(
+    session: Session, user_id: int = None, company_id: int = None
+) -> None:
+    """
+    Record a membership or role write made in ``session``.
+
+    Token claims issued before now go stale and cached lookups are dropped,
+    immediately and again when the transaction ends, so nothing read from the
+    uncommitted (or rolled back) state outlives it.
+    """
+    change = (
+        None if user_id is None else int(user_id),
+        None if company_id is None else int(company_id),
+    )
+    session.info.setdefault(_PENDING, set()).add(change)
+    _apply(change)
+
+
+def _apply(change: tuple) -> None:
+    user_id, company_id = change
+    if user_id is not None:
+        membership_changes.user_changed(user_id)
+        membership_cache.invalidate_user(user_id)
+    if company_id is not None:
+        membership_changes.company_changed(company_id)
+        membership_cache.invalidate_company(company_id)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_pending(session: Session) -> None:
+    for change in session.info.pop(_PENDING, ()):
+        _apply(change)
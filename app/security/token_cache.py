@@ -0,0 +1,41 @@
+import hashlib
+import time
+from typing import Optional
+
+from opentelemetry import metrics
+
+from app.models.user.user import UserRead
+from app.utils.ttl_cache import MISSING, TTLCache
+
+_meter = metrics.get_meter("app.security")
+_lookups = _meter.create_counter(
+    "auth.token_cache.lookups",
+    description="Verified-token cache lookups, by result (hit or miss).",
+)
+
+
+class TokenCache(TTLCache):
+    """
+    Bounded LRU cache of already verified access tokens.
+
+    Keys are SHA-256 digests of the raw token, so bearer tokens are never held
+    in memory longer than the request. Entries expire with the token's ``exp``
+    claim; the least recently used entry is evicted once ``max_size`` is
+    reached. Cached ``UserRead`` objects are shared between requests and must
+    be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__(max_size)
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[UserRead]:
+        user = super().get(key)
+        _lookups.add(1, {"result": "miss" if user is MISSING else "hit"})
+        return None if user is MISSING else user
+
+    def put(self, key: bytes, user: UserRead, expires_at: float) -> None:
+        self.set(key, user, ttl=expires_at - time.time())
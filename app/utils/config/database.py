@@ -7,6 +7,21 @@ class DatabaseConfig:
     """
 
     REQUIRED_FIELDS = ["TYPE", "HOST", "PORT", "USER", "PASSWORD", "NAME"]
+    # sync driver -> asyncio driver used by the request path
+    ASYNC_DRIVERS = {
+        "postgresql": "postgresql+asyncpg",
+        "postgresql+psycopg2": "postgresql+asyncpg",
+        "sqlite": "sqlite+aiosqlite",
+    }
+    # [tool.userverse.config.database] key -> create_engine() keyword
+    POOL_OPTIONS = {
+        "POOL_SIZE": ("pool_size", int, 5),
+        "MAX_OVERFLOW": ("max_overflow", int, 10),
+        "POOL_TIMEOUT": ("pool_timeout", float, 30.0),
+        "POOL_RECYCLE": ("pool_recycle", int, -1),
+        "POOL_USE_LIFO": ("pool_use_lifo", bool, False),
+        "POOL_PRE_PING": ("pool_pre_ping", bool, True),
+    }
 
     @classmethod
     def get_connection_string(
@@ -60,3 +75,56 @@ class DatabaseConfig:
                 f"Unsupported database type: '{db_type}'. Falling back to SQLite."
             )
             return f"sqlite:///{environment}.db"
+
+    @classmethod
+    def get_async_connection_string(cls, connection_string: str) -> str:
+        """
+        Returns the asyncio equivalent of a sync connection string.
+
+        Args:
+            connection_string (str): Sync connection string, e.g. from get_connection_string.
+
+        Returns:
+            str: Connection string using the asyncpg / aiosqlite driver.
+        """
+        scheme, separator, rest = connection_string.partition("://")
+        async_scheme = cls.ASYNC_DRIVERS.get(scheme.lower())
+        if not async_scheme:
+            if scheme not in cls.ASYNC_DRIVERS.values():
+                # e.g. mysql: name an installed asyncio driver in the URL
+                logger.warning(f"No asyncio driver known for '{scheme}'.")
+            return connection_string
+        return f"{async_scheme}{separator}{rest}"
+
+    @classmethod
+    def get_pool_options(cls, configs: dict) -> dict:
+        """
+        Returns the connection pool settings for the database.
+
+        These size the async engine that serves requests. Every worker process
+        gets its own pool, plus a sync pool of at most three connections for
+        scripts and migrations, so a deployment can open up to
+        ``workers * (POOL_SIZE + MAX_OVERFLOW + 3)`` connections; keep that
+        below the server's ``max_connections``. Setting ``POOL_PRE_PING`` to
+        false trades the per-checkout ping for relying on ``POOL_RECYCLE``.
+
+        Args:
+            configs (dict): Configuration data.
+
+        Returns:
+            dict: Keyword arguments for ``create_engine``.
+        """
+        db_config = configs.get("database", {})
+        options = {}
+        for key, (option, cast, default) in cls.POOL_OPTIONS.items():
+            value = db_config.get(key, default)
+            try:
+                if cast is bool and isinstance(value, str):
+                    value = value.strip().lower() in ("1", "true", "yes", "on")
+                options[option] = cast(value)
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Invalid database config value {key}={value!r}. Using {default}."
+                )
+                options[option] = default
+        return options
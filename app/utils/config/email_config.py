@@ -9,6 +9,11 @@ class EmailSettings(BaseModel):
     port: int = Field(..., alias="PORT")
     username: EmailStr = Field(..., alias="USERNAME")
     password: str = Field(..., alias="PASSWORD")
+    # SMTP connection pool (app.utils.email.sender.SMTPConnectionPool)
+    pool_size: int = Field(4, alias="POOL_SIZE")
+    keepalive: float = Field(30, alias="KEEPALIVE")
+    max_idle: float = Field(300, alias="MAX_IDLE")
+    timeout: float = Field(30, alias="TIMEOUT")
 
 
 class EmailConfig:
@@ -1,10 +1,12 @@
 import os
 import sys
 import json
+import threading
 from pathlib import Path
 from app.utils.config.cors import CorsConfig
 from app.utils.config.database import DatabaseConfig
 from app.utils.config.environment import EnvironmentManager
+from app.utils.config.settings import AppSettings
 from app.utils.logging import logger
 
 if sys.version_info >= (3, 11):
@@ -17,12 +19,45 @@ class ConfigLoader:
     """
     Loads application configuration from JSON or pyproject.toml.
     Falls back to default test config if no valid configuration is found.
+
+    The file is read once per process (per environment / config path) and the
+    resulting frozen ``AppSettings`` is shared, so constructing a loader on a
+    hot path is only a cache lookup. Call ``ConfigLoader.reload()`` to pick up
+    changes, e.g. between tests.
     """
 
+    _cache = {}
+    _lock = threading.Lock()
+
     def __init__(self, environment: str = None):
-        self.json_config_path = self._resolve_json_path(os.getenv("JSON_CONFIG_PATH"))
         self.environment = environment
-        self.config = self._load_config()
+        key = self._cache_key(environment)
+        config = self._cache.get(key)
+        if config is None:
+            with self._lock:
+                config = self._cache.get(key)
+                if config is None:
+                    self.json_config_path = self._resolve_json_path(
+                        os.getenv("JSON_CONFIG_PATH")
+                    )
+                    config = self._cache[key] = self._load_config()
+        self.config = config
+
+    @staticmethod
+    def _cache_key(environment: str = None) -> tuple:
+        # everything _load_config reads from the process environment
+        return (environment,) + tuple(
+            os.getenv(name)
+            for name in ("JSON_CONFIG_PATH", "TEST_ENVIRONMENT", "env", "environment")
+        )
+
+    @classmethod
+    def reload(cls) -> None:
+        """
+        Drop the cached settings; the next ``ConfigLoader()`` reads them again.
+        """
+        with cls._lock:
+            cls._cache.clear()
 
     def _resolve_json_path(self, path_str):
         if not path_str:
@@ -70,9 +105,9 @@ class ConfigLoader:
         )
         project_config = pyproject_data.get("project", {})
 
-        logger.info("📦 [project] section loaded from pyproject.toml:")
+        logger.debug("📦 [project] section loaded from pyproject.toml:")
         for key, val in project_config.items():
-            logger.info(f"  {key} = {val}")
+            logger.debug(f"  {key} = {val}")
 
         # Merge configuration
         config_data = {
@@ -84,31 +119,34 @@ class ConfigLoader:
             "cor_origins": userverse_config.get("cor_origins", {}),
             "jwt": userverse_config.get("jwt", {}),
             "email": userverse_config.get("email", {}),
+            "one_time_tokens": userverse_config.get("one_time_tokens", {}),
+            "telemetry": userverse_config.get("telemetry", {}),
         }
 
         return self._build_config_dict(config_data)
 
-    def _build_config_dict(self, config_data: dict):
+    def _build_config_dict(self, config_data: dict) -> AppSettings:
         if not isinstance(config_data, dict):
             raise TypeError("Expected config_data to be a dict")
 
         environment = self._set_environment(config_data)
-        return {
-            "environment": environment,
-            "database_url": DatabaseConfig.get_connection_string(
-                config_data, environment
-            ),
-            "cor_origins": CorsConfig.get_cors(config_data, environment),
-            "jwt": config_data.get("jwt", {}),
-            "email": config_data.get("email", {}),
-            "name": config_data.get("name", "Userverse"),
-            "version": config_data.get("version", "0.1.0"),
-            "description": config_data.get("description", "Userverse backend API"),
-        }
+        return AppSettings(
+            environment=environment,
+            database_url=DatabaseConfig.get_connection_string(config_data, environment),
+            database_pool=DatabaseConfig.get_pool_options(config_data),
+            cor_origins=CorsConfig.get_cors(config_data, environment),
+            jwt=config_data.get("jwt", {}),
+            email=config_data.get("email", {}),
+            one_time_tokens=config_data.get("one_time_tokens", {}),
+            telemetry=config_data.get("telemetry", {}),
+            name=config_data.get("name", "Userverse"),
+            version=config_data.get("version", "0.1.0"),
+            description=config_data.get("description", "Userverse backend API"),
+        )
 
     def _default_test_config(self):
         logger.info("Using default test configuration")
         return self._build_config_dict({})
 
-    def get_config(self):
+    def get_config(self) -> AppSettings:
         return self.config
@@ -0,0 +1,60 @@
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class AppSettings(BaseModel):
+    """
+    Immutable application configuration, built once per process by ConfigLoader.
+
+    Supports attribute access (``settings.jwt``) as well as the mapping style
+    (``settings["database_url"]``, ``settings.get("email", {})``) used by
+    existing callers. Nested sections are read-only mappings.
+    """
+
+    model_config = ConfigDict(frozen=True, validate_default=True)
+
+    environment: str
+    database_url: str
+    database_pool: Mapping[str, Any] = {}
+    cor_origins: Mapping[str, Any] = {}
+    jwt: Mapping[str, Any] = {}
+    email: Mapping[str, Any] = {}
+    one_time_tokens: Mapping[str, Any] = {}
+    telemetry: Mapping[str, Any] = {}
+    name: Optional[str] = "Userverse"
+    version: Optional[str] = "0.1.0"
+    description: Optional[str] = "Userverse backend API"
+    repository: Optional[str] = None
+    documentation: Optional[str] = None
+
+    @field_validator(
+        "database_pool",
+        "cor_origins",
+        "jwt",
+        "email",
+        "one_time_tokens",
+        "telemetry",
+        mode="after",
+    )
+    @classmethod
+    def _freeze_section(cls, value: Mapping[str, Any]) -> Mapping[str, Any]:
+        return _freeze(value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in type(self).model_fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in type(self).model_fields else None
+        return default if value is None else value
@@ -1,16 +1,158 @@
-from fastapi.templating import Jinja2Templates
-from starlette.requests import Request
+import re
+import threading
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from jinja2 import Environment, FileSystemLoader, meta, nodes
+from markupsafe import escape
 
 templates_path = Path(__file__).resolve().parent / "templates"
-templates = Jinja2Templates(directory=str(templates_path))
+# templates ship with the code, so there is no need to stat them on every use
+environment = Environment(
+    loader=FileSystemLoader(str(templates_path)), autoescape=True, auto_reload=False
+)
+
+_MARKER = "@@{}@@"
+_MARKER_RE = re.compile(r"@@(\w+)@@")
+# nodes a template may contain and still be rendered by substitution: text,
+# bare {{ name }} outputs and the tags that stitch templates together
+_SUBSTITUTION_NODES = (
+    nodes.Output,
+    nodes.TemplateData,
+    nodes.Name,
+    nodes.Const,
+    nodes.Extends,
+    nodes.Block,
+    nodes.Include,
+)
+
+
+class RenderedEmail(NamedTuple):
+    html: str
+    text: str
+
+
+def html_to_text(html: str) -> str:
+    """
+    Plain-text alternative of an HTML email: visible text, one block per
+    line, with link targets kept next to their label.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["head", "style", "script"]):
+        tag.decompose()
+    for link in soup.find_all("a", href=True):
+        link.append(f" ({link['href']})")
+    return soup.get_text(separator="\n", strip=True)
+
+
+def _parse_with_references(env: Environment, name: str) -> Tuple[List, bool]:
+    """
+    Syntax trees of a template and every template it extends, includes or
+    imports, and whether all of those references are known before render.
+    """
+    trees, pending, seen, static = [], [name], {name}, True
+    while pending:
+        tree = env.parse(env.loader.get_source(env, pending.pop())[0])
+        trees.append(tree)
+        for referenced in meta.find_referenced_templates(tree):
+            if referenced is None:
+                static = False
+            elif referenced not in seen:
+                seen.add(referenced)
+                pending.append(referenced)
+    return trees, static
+
+
+class EmailTemplate:
+    """
+    An email template compiled once, with its plain-text alternative.
+
+    Templates that only output bare variables (``{{ name }}``, no attribute
+    access, filters, expressions or logic tags) are rendered once with a
+    marker per variable and split into
+    static parts, for both the HTML and the text version. Rendering then just
+    joins the static parts with the (HTML-escaped) values, without running
+    Jinja or parsing HTML per email. Parent and included templates are
+    checked the same way. Other templates are rendered by Jinja and
+    converted to text per email.
+    """
+
+    def __init__(self, name: str, env: Environment = environment) -> None:
+        self.name = name
+        self.template = env.get_template(name)
+        trees, static = _parse_with_references(env, name)
+        self.variables = sorted(
+            set().union(*(meta.find_undeclared_variables(tree) for tree in trees))
+        )
+        self.html_parts: Optional[List[str]] = None
+        self.text_parts: Optional[List[str]] = None
+        if static and all(
+            isinstance(node, _SUBSTITUTION_NODES)
+            for tree in trees
+            for node in tree.find_all(nodes.Node)
+        ):
+            markers = {name: _MARKER.format(name) for name in self.variables}
+            html = self.template.render(markers)
+            self.html_parts = _MARKER_RE.split(html)
+            self.text_parts = _MARKER_RE.split(html_to_text(html))
+
+    @staticmethod
+    def _join(parts: List[str], values: Dict[str, str]) -> str:
+        # split() alternates static text and variable names
+        return "".join(
+            part if i % 2 == 0 else values.get(part, "") for i, part in enumerate(parts)
+        )
+
+    def render(self, context: dict) -> RenderedEmail:
+        present = [name for name in self.variables if name in context]
+        # markup values add HTML of their own, which the text skeleton lacks
+        if self.html_parts is None or any(
+            hasattr(context[name], "__html__") for name in present
+        ):
+            html = self.template.render(context)
+            return RenderedEmail(html, html_to_text(html))
+
+        # same output as Jinja: missing variables render empty
+        values = {name: str(context[name]) for name in present}
+        escaped = {name: str(escape(values[name])) for name in present}
+        return RenderedEmail(
+            self._join(self.html_parts, escaped), self._join(self.text_parts, values)
+        )
+
+
+_compiled: Dict[str, EmailTemplate] = {}
+_lock = threading.Lock()
+
+
+def get_email_template(template_name: str) -> EmailTemplate:
+    template = _compiled.get(template_name)
+    if template is None:
+        with _lock:
+            template = _compiled.get(template_name)
+            if template is None:
+                template = _compiled[template_name] = EmailTemplate(template_name)
+    return template
+
+
+def compile_email_templates() -> None:
+    """
+    Compile every email template up front (called at startup).
+    """
+    for name in environment.list_templates(extensions=["html"]):
+        if name != "base.html":
+            get_email_template(name)
+
+
+def render_email(template_name: str, context: dict) -> RenderedEmail:
+    """
+    Render an email template to HTML and its plain-text alternative.
+    """
+    return get_email_template(template_name).render(context)
 
 
 def render_email_template(template_name: str, context: dict) -> str:
     """
     Render a Jinja2 HTML template for email.
     """
-    dummy_request = Request(scope={"type": "http"})
-    return templates.get_template(template_name).render(
-        {"request": dummy_request, **context}
-    )
+    return render_email(template_name, context).html
@@ -1,45 +1,265 @@
 import click
 import logging
-from bs4 import BeautifulSoup
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Tuple
 from email.message import EmailMessage
 import smtplib
 import socket
-from app.utils.config.email_config import EmailConfig
+from app.utils.config.email_config import EmailConfig, EmailSettings
+from app.utils.email.renderer import html_to_text
 
 logger = logging.getLogger(__name__)
 
 
-def send_email(to: str, subject: str, html_body: str):
-    email_settings = EmailConfig.load()
+def is_connection_error(error: Exception) -> bool:
+    """
+    Whether ``error`` left the SMTP session unusable. SMTPException derives
+    from OSError, so a refusal by the server has to be told apart.
+    """
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
 
-    if not email_settings:
-        soup = BeautifulSoup(html_body, "html.parser")
-        click.echo(
-            click.style("Email config not available. Showing plain text:", fg="yellow")
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of logged-in SMTP connections to one server.
+
+    At most ``max_size`` connections exist at a time; callers wait for a free
+    one. Idle connections are kept open: one idle for more than ``keepalive``
+    seconds is checked with ``NOOP`` before reuse, one idle for more than
+    ``max_idle`` seconds is closed. A connection that drops while sending is
+    replaced and the message retried once.
+    """
+
+    def __init__(
+        self,
+        settings: EmailSettings,
+        max_size: int = 4,
+        keepalive: float = 30,
+        max_idle: float = 300,
+        timeout: float = 30,
+    ) -> None:
+        self.settings = settings
+        self.max_size = max_size
+        self.keepalive = keepalive
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        logger.info(
+            f"Connecting to SMTP server at {self.settings.host}:{self.settings.port}"
         )
-        click.echo(soup.get_text(separator="\n", strip=True))
-        return
+        smtp = smtplib.SMTP_SSL(
+            self.settings.host, self.settings.port, timeout=self.timeout
+        )
+        try:
+            smtp.login(self.settings.username, self.settings.password)
+        except Exception:
+            self._discard(smtp)
+            raise
+        self.connects += 1
+        return smtp
+
+    @staticmethod
+    def _discard(smtp: Optional[smtplib.SMTP]) -> None:
+        if smtp is None:
+            return
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+    def _is_alive(self, smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _checkout(self) -> Tuple[smtplib.SMTP, bool]:
+        """
+        An idle connection that still works, else a new one; and whether
+        it was reused.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                smtp, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for > self.max_idle or (
+                idle_for > self.keepalive and not self._is_alive(smtp)
+            ):
+                self._discard(smtp)
+                continue
+            return smtp, True
+        return self._connect(), False
+
+    def _checkin(self, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((smtp, time.monotonic()))
+
+    @contextmanager
+    def _slot(self):
+        self._slots.acquire()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def send(self, message: EmailMessage) -> None:
+        (error,) = self.send_many([message])
+        if error is not None:
+            raise error
+
+    def send_many(self, messages: Iterable[EmailMessage]) -> List[Optional[Exception]]:
+        """
+        Send messages over one session; returns None or the error per message.
+
+        A refused message does not stop the batch. If the server cannot be
+        reached (or rejects the login) the remaining messages get that error.
+        """
+        messages = list(messages)
+        results = []
+        with self._slot():
+            smtp, reused = None, False
+            for message in messages:
+                error = fatal = None
+                for attempt in range(2):
+                    if smtp is None:
+                        try:
+                            smtp, reused = self._checkout()
+                        except Exception as e:
+                            fatal = e
+                            break
+                    try:
+                        smtp.send_message(message)
+                        error, reused = None, True
+                    except Exception as e:
+                        error = e
+                        if is_connection_error(e):
+                            self._discard(smtp)
+                            smtp = None
+                            if reused and attempt == 0:
+                                # the session went stale; retry on a new one
+                                continue
+                        elif not isinstance(e, smtplib.SMTPException):
+                            self._discard(smtp)
+                            smtp = None
+                        # else refused by the server; the session is still usable
+                    break
+                if fatal is not None:
+                    results.extend([fatal] * (len(messages) - len(results)))
+                    break
+                results.append(error)
+            if smtp is not None:
+                self._checkin(smtp)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                smtp.quit()
+            except Exception:
+                self._discard(smtp)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_smtp_pool(settings: EmailSettings) -> SMTPConnectionPool:
+    """
+    The process-wide pool for these settings.
+    """
+    key = (settings.host, settings.port, settings.username, settings.password)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SMTPConnectionPool(
+                settings,
+                max_size=settings.pool_size,
+                keepalive=settings.keepalive,
+                max_idle=settings.max_idle,
+                timeout=settings.timeout,
+            )
+        return pool
 
+
+def close_smtp_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def build_message(
+    settings: EmailSettings,
+    to: str,
+    subject: str,
+    html_body: str,
+    text_body: Optional[str] = None,
+) -> EmailMessage:
     msg = EmailMessage()
     msg["Subject"] = subject
-    msg["From"] = email_settings.username
+    msg["From"] = settings.username
     msg["To"] = to
-    msg.set_content("This email requires an HTML-compatible client.")
+    msg.set_content(text_body or "This email requires an HTML-compatible client.")
     msg.add_alternative(html_body, subtype="html")
+    return msg
+
+
+def _echo(html_body: str, text_body: Optional[str] = None) -> None:
+    click.echo(
+        click.style("Email config not available. Showing plain text:", fg="yellow")
+    )
+    click.echo(text_body if text_body is not None else html_to_text(html_body))
+
+
+def send_emails(emails: List[Tuple[str, ...]]) -> List[Optional[Exception]]:
+    """
+    Send ``(to, subject, html_body[, text_body])`` tuples over one pooled SMTP
+    session.
+
+    Returns None or the error for each email, in order.
+    """
+    email_settings = EmailConfig.load()
+
+    if not email_settings:
+        for email in emails:
+            _echo(*email[2:])
+        return [None] * len(emails)
+
+    pool = get_smtp_pool(email_settings)
+    results = pool.send_many(
+        [build_message(email_settings, *email) for email in emails]
+    )
+    for error in results:
+        if error is not None:
+            logger.error(f"SMTP error: {str(error)}")
+    return results
+
+
+def send_email(to: str, subject: str, html_body: str, text_body: Optional[str] = None):
+    email_settings = EmailConfig.load()
+
+    if not email_settings:
+        _echo(html_body, text_body)
+        return
+
+    msg = build_message(email_settings, to, subject, html_body, text_body)
 
     try:
-        logger.info(
-            f"Connecting to SMTP server at {email_settings.host}:{email_settings.port}"
-        )
-        with smtplib.SMTP_SSL(
-            email_settings.host,
-            email_settings.port,
-        ) as smtp:
-            smtp.login(
-                email_settings.username,
-                email_settings.password,
-            )
-            smtp.send_message(msg)
+        get_smtp_pool(email_settings).send(msg)
     except socket.timeout:
         logger.error(
             f"Timeout connecting to SMTP server at {email_settings.host}:{email_settings.port}"
@@ -0,0 +1,66 @@
+"""
+Microbenchmark of the per-email cost of rendering an email template.
+
+Compares the previous path (Jinja2Templates with a dummy Request, then
+BeautifulSoup for the plain-text part) with ``render_email`` from the
+precompiled templates.
+
+    python scripts/bench_email_render.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from fastapi.templating import Jinja2Templates  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from app.utils.email.renderer import (  # noqa: E402
+    compile_email_templates,
+    render_email,
+    templates_path,
+)
+
+CASES = {
+    "user_registration.html": {
+        "template_name": "Verify your email",
+        "user_name": "Sandile",
+        "verification_link": "https://example.com/verify?token=abc",
+    },
+    "reset_user_password.html": {"user_name": "Sandile", "otp": "123456"},
+    "company_invite.html": {
+        "invitee": "John",
+        "company": "Oxillium",
+        "role": "Engineer",
+    },
+}
+
+legacy_templates = Jinja2Templates(directory=str(templates_path))
+
+
+def legacy_render(template_name: str, context: dict) -> tuple:
+    dummy_request = Request(scope={"type": "http"})
+    html = legacy_templates.get_template(template_name).render(
+        {"request": dummy_request, **context}
+    )
+    text = BeautifulSoup(html, "html.parser").get_text(separator="\n", strip=True)
+    return html, text
+
+
+def main(iterations: int = 2000) -> None:
+    compile_email_templates()
+    print(f"{'template':<28}{'legacy µs':>12}{'compiled µs':>14}{'speedup':>10}")
+    for name, context in CASES.items():
+        legacy = timeit.timeit(lambda: legacy_render(name, context), number=iterations)
+        compiled = timeit.timeit(lambda: render_email(name, context), number=iterations)
+        print(
+            f"{name:<28}{legacy / iterations * 1e6:>12.1f}"
+            f"{compiled / iterations * 1e6:>14.1f}{legacy / compiled:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,60 @@
+-- Schema created by the baseline release (before alembic_version was stamped)
+CREATE TABLE user (
+	id INTEGER NOT NULL, 
+	first_name VARCHAR(255), 
+	last_name VARCHAR(255), 
+	email VARCHAR(255) NOT NULL, 
+	phone_number VARCHAR(255), 
+	password VARCHAR(255) NOT NULL, 
+	_created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	_updated_at DATETIME, 
+	_closed_at DATETIME, 
+	primary_meta_data JSON, 
+	secondary_meta_data JSON, 
+	PRIMARY KEY (id), 
+	UNIQUE (email)
+);
+
+CREATE TABLE company (
+	id INTEGER NOT NULL, 
+	name VARCHAR(256), 
+	description VARCHAR(512), 
+	industry VARCHAR(128), 
+	email VARCHAR(256) NOT NULL, 
+	phone_number VARCHAR(16), 
+	_created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	_updated_at DATETIME, 
+	_closed_at DATETIME, 
+	primary_meta_data JSON, 
+	secondary_meta_data JSON, 
+	PRIMARY KEY (id), 
+	UNIQUE (email)
+);
+
+CREATE TABLE role (
+	company_id INTEGER NOT NULL, 
+	name VARCHAR(256) NOT NULL, 
+	description VARCHAR(256), 
+	_created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	_updated_at DATETIME, 
+	_closed_at DATETIME, 
+	primary_meta_data JSON, 
+	secondary_meta_data JSON, 
+	PRIMARY KEY (company_id, name), 
+	FOREIGN KEY(company_id) REFERENCES company (id) ON DELETE CASCADE
+);
+
+CREATE TABLE association_user_company (
+	user_id INTEGER NOT NULL, 
+	company_id INTEGER NOT NULL, 
+	role_name VARCHAR(256) NOT NULL, 
+	_created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	_updated_at DATETIME, 
+	_closed_at DATETIME, 
+	primary_meta_data JSON, 
+	secondary_meta_data JSON, 
+	PRIMARY KEY (user_id, company_id), 
+	FOREIGN KEY(company_id, role_name) REFERENCES role (company_id, name) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES user (id), 
+	FOREIGN KEY(company_id) REFERENCES company (id)
+);
@@ -2,7 +2,8 @@ import pytest
 import json
 from unittest.mock import patch
 from app.utils.config.loader import ConfigLoader
-from app.database import DatabaseSessionManager
+from app.database import Base, DatabaseSessionManager
+from app.security.membership import membership_cache
 
 
 @pytest.fixture(scope="session")
@@ -49,7 +50,12 @@ def test_session():
             "description": "Mocked config for test",
         },
     ):
+        # start every test on a fresh in-memory engine and empty caches
+        DatabaseSessionManager.dispose()
+        membership_cache.clear()
         db_manager = DatabaseSessionManager()
+        Base.metadata.create_all(bind=db_manager.engine)
         session = db_manager.session_object()
         yield session
         session.close()
+        DatabaseSessionManager.dispose()
@@ -103,3 +103,15 @@ def test_update_json_field_record_not_found(test_session, test_user_data):
             json_update["key"],
             json_update["value"],
         )
+
+
+def test_create_conflict_leaves_the_rollback_to_the_caller(test_session):
+    User.create(test_session, email="conflict@example.com", password="x")
+
+    with pytest.raises(ValueError, match="Integrity error"):
+        User.create(test_session, email="conflict@example.com", password="x")
+
+    # the transaction cannot carry on as if only the failed insert was lost
+    with pytest.raises(ValueError, match="previous exception during flush"):
+        User.create(test_session, email="after@example.com", password="x")
+    test_session.rollback()
@@ -1,5 +1,10 @@
 import pytest
+from sqlalchemy import event, select
+from app.database.audit_event import AuditEvent
+from app.database.association_user_company import AssociationUserCompany
 from app.database.company import Company
+from app.database.user import User
+from app.models.user.user import UserRead
 from app.database.base_model import RecordNotFoundError
 from tests.database.conftest import test_company_data, test_session
 
@@ -68,3 +73,59 @@ def test_add_company_address(test_session, test_company_data):
         updated_company["primary_meta_data"]["address"]["country"]
         == company_address_data["value"]["country"]
     )
+
+
+def test_register_company_in_one_flush(test_session, test_company_data):
+    user = User.create(test_session, email="founder@example.com", password="x")
+    creator = UserRead(id=user["id"], email=user["email"])
+    test_session.commit()
+
+    statements = []
+    engine = test_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        company = Company.register(
+            test_session,
+            data=test_company_data["company_one"],
+            roles=[("Administrator", "All access"), ("Viewer", "Read only")],
+            admin_role="Administrator",
+            created_by=creator,
+            address={"city": "Durban"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # company, roles (one multi-row insert), the link and the audit event;
+    # nothing read back
+    assert [s.split()[:3] for s in statements] == [
+        ["INSERT", "INTO", "company"],
+        ["INSERT", "INTO", "role"],
+        ["INSERT", "INTO", "association_user_company"],
+        ["INSERT", "INTO", "audit_event"],
+    ]
+    assert company["email"] == test_company_data["company_one"]["email"]
+    assert company["primary_meta_data"] == {"address": {"city": "Durban"}}
+    assert company["_created_at"] is not None
+
+    link = test_session.get(AssociationUserCompany, (user["id"], company["id"]))
+    assert link.role_name == "Administrator"
+    audit = test_session.scalars(select(AuditEvent)).one()
+    assert (audit.action, audit.actor_id, audit.target_id) == (
+        AuditEvent.COMPANY_CREATED,
+        user["id"],
+        str(company["id"]),
+    )
+    assert {role.name for role in test_session.get(Company, company["id"]).roles} == {
+        "Administrator",
+        "Viewer",
+    }
+
+    with pytest.raises(ValueError):
+        Company.register(
+            test_session,
+            data=test_company_data["company_one"],
+            roles=[("Administrator", "All access")],
+            admin_role="Administrator",
+            created_by=creator,
+        )
@@ -1,7 +1,12 @@
 import pytest
+from sqlalchemy import event, insert, select
 from sqlalchemy.exc import IntegrityError
+from app.database.audit_event import AuditEvent
+from app.database.association_user_company import AssociationUserCompany
 from app.database.company import Company
 from app.database.role import Role
+from app.database.user import User
+from app.models.user.user import UserRead
 from tests.database.conftest import test_company_data, test_role_data, test_session
 
 
@@ -142,3 +147,69 @@ def test_delete_role_by_filters(test_session, test_company_data, test_role_data)
     )
 
     assert "deleted" in deleted["message"]
+
+
+def test_delete_role_reassigns_members_in_one_update(test_session, test_company_data):
+    company = Company.create(test_session, **test_company_data["company_one"])
+    for name in ("Admin", "Viewer"):
+        Role.create(test_session, company_id=company["id"], name=name)
+    users = [
+        User.create(test_session, email=f"member{i}@example.com", password="x")
+        for i in range(5)
+    ]
+    test_session.execute(
+        insert(AssociationUserCompany),
+        [
+            {"user_id": u["id"], "company_id": company["id"], "role_name": "Viewer"}
+            for u in users
+        ],
+    )
+    test_session.commit()
+    test_session.expunge_all()
+
+    statements = []
+    engine = test_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = Role.delete_role_and_reassign_users(
+            test_session,
+            company_id=company["id"],
+            name_to_delete="Viewer",
+            replacement_name="Admin",
+            deleted_by=UserRead(id=users[0]["id"], email=users[0]["email"]),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert result["users_reassigned"] == 5
+    # roles lookup, members update, role soft delete and audit event; members
+    # are never loaded
+    assert len(statements) == 4
+    assert not any(
+        s.lstrip().upper().startswith("SELECT") and "association_user_company" in s
+        for s in statements
+    )
+
+    roles = test_session.scalars(
+        select(AssociationUserCompany.role_name).where(
+            AssociationUserCompany.company_id == company["id"]
+        )
+    ).all()
+    assert roles == ["Admin"] * 5
+    viewer = test_session.get(Role, (company["id"], "Viewer"))
+    assert viewer._closed_at is not None
+    audit = test_session.scalars(
+        select(AuditEvent).where(AuditEvent.action == AuditEvent.ROLE_DELETED)
+    ).one()
+    assert (audit.actor_id, audit.target_id) == (users[0]["id"], "Viewer")
+    assert audit.payload == {"replacement_name": "Admin", "users_reassigned": 5}
+
+    with pytest.raises(ValueError):
+        Role.delete_role_and_reassign_users(
+            test_session,
+            company_id=company["id"],
+            name_to_delete="Admin",
+            replacement_name="Viewer",
+            deleted_by=UserRead(id=users[0]["id"], email=users[0]["email"]),
+        )
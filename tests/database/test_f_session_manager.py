@@ -0,0 +1,71 @@
+import asyncio
+import os
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select
+
+from app.database import Base, DatabaseSessionManager, get_session
+from app.database.user import User
+from tests.database.conftest import test_session, test_user_data
+
+
+def test_engine_is_shared_between_managers(test_session):
+    first = DatabaseSessionManager()
+    second = DatabaseSessionManager()
+
+    assert first.engine is second.engine
+    assert first.session_object().bind is second.session_object().bind
+
+
+def test_engine_is_rebuilt_after_fork(test_session):
+    parent_engine = DatabaseSessionManager().engine
+
+    with patch.object(os, "getpid", return_value=os.getpid() + 1):
+        child_engine = DatabaseSessionManager().engine
+
+    assert child_engine is not parent_engine
+
+
+def test_dispose_clears_registry(test_session):
+    DatabaseSessionManager()
+    DatabaseSessionManager.dispose()
+
+    assert DatabaseSessionManager._engine is None
+    assert DatabaseSessionManager._session_factory is None
+
+
+async def _run_get_session(user_data, error=None):
+    async_engine = DatabaseSessionManager().async_engine
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    dependency = get_session()
+    session = await anext(dependency)
+    await User.acreate(session, **user_data)
+    if error is None:
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+    else:
+        with pytest.raises(type(error)):
+            await dependency.athrow(error)
+
+    async with DatabaseSessionManager().async_session_object() as session:
+        return await session.scalar(
+            select(User).where(User.email == user_data["email"])
+        )
+
+
+def test_get_session_commits_once_on_success(test_session, test_user_data):
+    user = asyncio.run(_run_get_session(test_user_data["create_user"]))
+
+    assert user is not None
+
+
+def test_get_session_rolls_back_on_error(test_session, test_user_data):
+    user = asyncio.run(
+        _run_get_session(
+            test_user_data["create_user"], error=RuntimeError("handler failed")
+        )
+    )
+
+    assert user is None
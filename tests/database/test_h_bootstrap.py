@@ -0,0 +1,117 @@
+import io
+
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, create_mock_engine, inspect, text
+
+from app.database import Base, DatabaseSessionManager
+from app.database.bootstrap import (
+    BASELINE_REVISION,
+    alembic_config,
+    bootstrap_database,
+)
+
+
+def _configs(tmp_path):
+    return {"database_url": f"sqlite:///{tmp_path / 'bootstrap.db'}"}
+
+
+def test_initialize_issues_no_ddl(tmp_path):
+    configs = _configs(tmp_path)
+    DatabaseSessionManager.dispose()
+    try:
+        DatabaseSessionManager.initialize(configs)
+        tables = inspect(DatabaseSessionManager._engine).get_table_names()
+    finally:
+        DatabaseSessionManager.dispose()
+
+    assert tables == []
+
+
+def test_bootstrap_creates_schema_and_stamps_head(tmp_path):
+    configs = _configs(tmp_path)
+    bootstrap_database(configs)
+
+    engine = create_engine(configs["database_url"])
+    with engine.connect() as connection:
+        tables = set(inspect(connection).get_table_names())
+        version = connection.execute(
+            text("SELECT version_num FROM alembic_version")
+        ).scalar()
+    engine.dispose()
+
+    assert {"user", "company", "role", "association_user_company"} <= tables
+    assert version == ScriptDirectory.from_config(alembic_config()).get_current_head()
+    # SQLite gets FTS5 shadow tables for substring search
+    assert {"user_search", "company_search"} <= tables
+
+
+def test_bootstrap_is_idempotent(tmp_path):
+    configs = _configs(tmp_path)
+    bootstrap_database(configs)
+    bootstrap_database(configs)
+
+
+def test_bootstrap_stamps_unversioned_baseline_schema(tmp_path, monkeypatch):
+    """
+    Databases built by the baseline have tables but no alembic_version.
+    """
+    configs = _configs(tmp_path)
+    engine = create_engine(configs["database_url"])
+    with open("tests/data/database/baseline_schema.sql") as f, engine.begin() as c:
+        for statement in f.read().split(";"):
+            if statement.strip():
+                c.exec_driver_sql(statement)
+
+    # the later revisions are Postgres only; see where the upgrade starts
+    upgrades = []
+
+    def upgrade(config, revision):
+        connection = config.attributes["connection"]
+        current = connection.execute(text("SELECT version_num FROM alembic_version"))
+        upgrades.append((current.scalar(), revision))
+
+    monkeypatch.setattr(command, "upgrade", upgrade)
+    bootstrap_database(configs, create_all=False)
+    bootstrap_database(configs, create_all=False)
+    engine.dispose()
+
+    assert upgrades == [(BASELINE_REVISION, "head"), (BASELINE_REVISION, "head")]
+
+
+def test_postgres_schema_builds_from_models():
+    """
+    Empty Postgres databases are built with create_all, not the migrations.
+    """
+    statements = []
+    engine = create_mock_engine(
+        "postgresql+psycopg2://",
+        lambda sql, *args, **kwargs: statements.append(
+            str(sql.compile(dialect=engine.dialect))
+        ),
+    )
+    Base.metadata.create_all(engine, checkfirst=False)
+
+    created = {
+        s.split()[2].strip('"') for s in statements if s.startswith("\nCREATE TABLE")
+    }
+    assert set(Base.metadata.tables) <= created
+    # before the trigram indexes that need it
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+
+def test_postgres_upgrade_renders_offline():
+    """
+    Revisions written on top of the existing schema upgrade it on Postgres.
+    """
+    config = alembic_config()
+    config.set_main_option("sqlalchemy.url", "postgresql://")
+    config.output_buffer = io.StringIO()
+    command.upgrade(config, "9552b9fc884a:head", sql=True)
+
+    sql = config.output_buffer.getvalue()
+    assert "CREATE TABLE email_outbox" in sql
+    assert "CREATE TABLE audit_event" in sql
+    assert "CREATE TABLE one_time_token" in sql
+    head = ScriptDirectory.from_config(config).get_current_head()
+    assert f"UPDATE alembic_version SET version_num='{head}'" in sql
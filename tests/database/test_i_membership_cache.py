@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import event
+
+from app.database.association_user_company import AssociationUserCompany
+from app.database.company import Company
+from app.database.role import Role
+from app.database.user import User
+from app.models.user.user import UserRead
+from app.security.membership import membership_cache
+from app.utils.ttl_cache import MISSING
+from tests.database.conftest import (
+    test_company_data,
+    test_role_data,
+    test_session,
+    test_user_data,
+)
+
+
+@pytest.fixture
+def membership(test_session, test_company_data, test_user_data, test_role_data):
+    company = Company.create(test_session, **test_company_data["company_one"])
+    user = User.create(test_session, **test_user_data["create_user"])
+    for role in ("admin_role", "viewer_role"):
+        Role.create(
+            test_session,
+            company_id=company["id"],
+            name=test_role_data[role]["name"],
+            description=test_role_data[role]["description"],
+        )
+    test_session.commit()
+    return user, company
+
+
+@pytest.fixture
+def query_count(test_session):
+    counter = {"count": 0}
+
+    def count(*args):
+        counter["count"] += 1
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    yield counter
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def _is_linked(session, user, company, role_name=None):
+    return AssociationUserCompany.is_user_linked_to_company(
+        session, user_id=user["id"], company_id=company["id"], role_name=role_name
+    )
+
+
+def test_repeat_membership_check_is_served_from_cache(
+    test_session, membership, query_count
+):
+    user, company = membership
+
+    assert _is_linked(test_session, user, company) is False
+    assert _is_linked(test_session, user, company) is False
+
+    assert query_count["count"] == 1
+    assert membership_cache.stats()["links"]["hits"] == 1
+
+
+def test_link_and_unlink_invalidate_membership(test_session, membership):
+    user, company = membership
+    actor = UserRead(id=user["id"], email=user["email"])
+    assert _is_linked(test_session, user, company) is False
+
+    AssociationUserCompany.link_user(
+        test_session,
+        company_id=company["id"],
+        user_id=user["id"],
+        role_name="Admin",
+        added_by=UserRead(id=999, email="other@example.com"),
+    )
+    test_session.commit()
+    assert _is_linked(test_session, user, company, "Admin") is True
+    assert _is_linked(test_session, user, company, "Viewer") is False
+
+    AssociationUserCompany.unlink_user(
+        test_session, company_id=company["id"], user_id=user["id"], removed_by=actor
+    )
+    assert membership_cache.links.get((user["id"], company["id"])) is MISSING
+
+
+def test_rollback_drops_uncommitted_membership(test_session, membership):
+    user, company = membership
+    AssociationUserCompany.link_user(
+        test_session,
+        company_id=company["id"],
+        user_id=user["id"],
+        role_name="Viewer",
+        added_by=UserRead(id=999, email="other@example.com"),
+    )
+    assert _is_linked(test_session, user, company) is True
+
+    test_session.rollback()
+
+    assert _is_linked(test_session, user, company) is False
+
+
+def test_role_check_cached_until_role_deleted(test_session, membership, query_count):
+    user, company = membership
+
+    assert Role.role_belongs_to_company(test_session, company["id"], "Viewer")
+    assert Role.role_belongs_to_company(test_session, company["id"], "Viewer")
+    assert query_count["count"] == 1
+
+    Role.delete_role_and_reassign_users(
+        test_session,
+        company_id=company["id"],
+        name_to_delete="Viewer",
+        replacement_name="Admin",
+        deleted_by=UserRead(id=user["id"], email=user["email"]),
+    )
+    test_session.commit()
+
+    with pytest.raises(Exception):
+        Role.role_belongs_to_company(test_session, company["id"], "Viewer")
@@ -0,0 +1,73 @@
+import pytest
+
+from app.database.company import Company
+from app.database.pagination import decode_cursor, encode_cursor
+from app.database.role import Role
+from app.utils.app_error import AppError
+from tests.database.conftest import test_company_data, test_session
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor([7, "Viewer"]), 2) == [7, "Viewer"]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1])])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(AppError) as e:
+        decode_cursor(cursor, 2)
+    assert e.value.status_code == 400
+
+
+def test_get_all_pages_by_cursor(test_session, test_company_data):
+    company = Company.create(test_session, **test_company_data["company_one"])
+    names = [f"Role {i:02d}" for i in range(7)]
+    for name in names:
+        Role.create(test_session, company_id=company["id"], name=name)
+
+    seen, cursor = [], None
+    while True:
+        page = Role.get_all(test_session, limit=3, cursor=cursor)
+        seen.extend(role["name"] for role in page["records"])
+        cursor = page["pagination"]["next_cursor"]
+        if cursor is None:
+            break
+        assert page["pagination"]["offset"] in (0, None)
+
+    assert seen == names
+    assert page["pagination"]["total_records"] == len(names)
+
+
+def test_offset_page_returns_cursor_for_next_page(test_session, test_company_data):
+    company = Company.create(test_session, **test_company_data["company_one"])
+    for name in ("A", "B", "C"):
+        Role.create(test_session, company_id=company["id"], name=name)
+
+    first = Role.get_all(test_session, limit=2, offset=0)
+    following = Role.get_all(
+        test_session, limit=2, cursor=first["pagination"]["next_cursor"]
+    )
+
+    assert [role["name"] for role in first["records"]] == ["A", "B"]
+    assert [role["name"] for role in following["records"]] == ["C"]
+    assert following["pagination"]["next_cursor"] is None
+    assert following["pagination"]["current_page"] is None
+
+
+@pytest.mark.parametrize(
+    "count, total, pages", [("exact", 5, 3), ("estimate", 4, 2), ("none", None, None)]
+)
+def test_get_all_count_modes(
+    test_session, test_company_data, monkeypatch, count, total, pages
+):
+    # Without a planner, estimates are counts capped at ESTIMATE_CAP rows
+    monkeypatch.setattr("app.database.pagination.ESTIMATE_CAP", 4)
+    company = Company.create(test_session, **test_company_data["company_one"])
+    for name in ("A", "B", "C", "D", "E"):
+        Role.create(test_session, company_id=company["id"], name=name)
+
+    page = Role.get_all(test_session, limit=2, count=count)
+
+    assert len(page["records"]) == 2
+    assert page["pagination"]["total_records"] == total
+    assert page["pagination"]["total_pages"] == pages
+    assert page["pagination"]["count"] == count
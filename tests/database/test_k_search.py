@@ -0,0 +1,84 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.database.company import Company
+from app.database.user import User
+from tests.database.conftest import test_company_data, test_session
+
+
+def _emails(session, term, column=User.email):
+    query = select(User.email).where(User.search.contains(column, term))
+    return sorted(session.scalars(query))
+
+
+def test_contains_uses_fts_shadow_on_sqlite(test_session):
+    query = select(User.id).where(User.search.contains(User.email, "example"))
+    sql = str(query.compile(bind=test_session.get_bind()))
+    assert "user_search" in sql
+
+
+def test_contains_is_ilike_on_postgres():
+    query = select(User.id).where(User.search.contains(User.email, "example"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "ILIKE" in sql
+    assert "user_search" not in sql
+
+
+def test_search_follows_inserts_updates_and_deletes(test_session):
+    User.create(test_session, email="Alice.Smith@example.com", password="x")
+    bob = User.create(
+        test_session, email="bob@example.org", first_name="Bob", password="x"
+    )
+
+    assert _emails(test_session, "SMITH") == ["Alice.Smith@example.com"]
+    assert _emails(test_session, "example") == [
+        "Alice.Smith@example.com",
+        "bob@example.org",
+    ]
+    # terms shorter than a trigram still match, without the index
+    assert _emails(test_session, "Bo") == ["bob@example.org"]
+
+    User.update(test_session, bob["id"], first_name="Robert")
+    assert _emails(test_session, "Bob", User.first_name) == []
+    assert _emails(test_session, "robert", User.first_name) == ["bob@example.org"]
+
+    test_session.delete(test_session.get(User, bob["id"]))
+    test_session.flush()
+    assert _emails(test_session, "example.org") == []
+
+
+def test_company_search(test_session, test_company_data):
+    Company.create(test_session, **test_company_data["company_one"])
+    names = test_session.scalars(
+        select(Company.name).where(
+            Company.search.contains(
+                Company.name, test_company_data["company_one"]["name"][1:5]
+            )
+        )
+    ).all()
+    assert names == [test_company_data["company_one"]["name"]]
+
+
+def test_starts_with_matches_lowercase_prefix(test_session):
+    User.create(test_session, email="Alice.Smith@example.com", password="x")
+    User.create(test_session, email="alfred@example.com", password="x")
+    User.create(test_session, email="bob_al@example.com", password="x")
+
+    def lookup(prefix):
+        query = select(User.email).where(User.search.starts_with(User.email, prefix))
+        return sorted(test_session.scalars(query))
+
+    assert lookup("AL") == ["Alice.Smith@example.com", "alfred@example.com"]
+    assert lookup("alice.") == ["Alice.Smith@example.com"]
+    assert lookup("bob_") == ["bob_al@example.com"]
+    assert lookup("b%") == []
+
+
+def test_starts_with_is_an_inline_like_on_postgres():
+    query = select(User.id).where(User.search.starts_with(User.email, "Ab_"))
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert 'lower("user".email) LIKE \'ab\\_%' in sql
@@ -0,0 +1,112 @@
+"""
+Plan regression checks for the soft-delete aware indexes.
+
+The tables are seeded with enough rows for the planner to prefer an index
+over a scan, then ``EXPLAIN QUERY PLAN`` of each hot query must name the
+index it is meant to use.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select, text, update
+
+from app.database.association_user_company import AssociationUserCompany
+from app.database.company import Company
+from app.database.role import Role
+from app.database.user import User
+from tests.database.conftest import test_session
+
+COMPANIES = 50
+USERS = 2000
+ROLES = ("Administrator", "Viewer", "Editor")
+CLOSED_AT = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def seeded_session(test_session):
+    test_session.execute(
+        insert(User),
+        [{"email": f"user{i}@example.com", "password": "x"} for i in range(USERS)],
+    )
+    test_session.execute(
+        insert(Company),
+        [{"email": f"company{i}@example.com"} for i in range(COMPANIES)],
+    )
+    test_session.execute(
+        insert(Role),
+        [
+            {"company_id": company_id, "name": name}
+            for company_id in range(1, COMPANIES + 1)
+            for name in ROLES
+        ],
+    )
+    test_session.execute(
+        insert(AssociationUserCompany),
+        [
+            {
+                "user_id": user_id,
+                "company_id": user_id % COMPANIES + 1,
+                "role_name": ROLES[user_id % len(ROLES)],
+                "_closed_at": CLOSED_AT if user_id % 10 == 0 else None,
+            }
+            for user_id in range(1, USERS + 1)
+        ],
+    )
+    test_session.execute(text("ANALYZE"))
+    return test_session
+
+
+def _plan(session, statement) -> str:
+    sql = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_active_company_members_use_partial_index(seeded_session):
+    statement = (
+        select(AssociationUserCompany)
+        .where(
+            AssociationUserCompany.company_id == 7,
+            AssociationUserCompany._closed_at.is_(None),
+        )
+        .order_by(AssociationUserCompany.user_id)
+        .limit(11)
+    )
+    plan = _plan(seeded_session, statement)
+    assert "ix_association_user_company_active" in plan
+    assert "TEMP B-TREE" not in plan  # served in index order, no sort
+
+
+def test_closed_company_members_use_company_closed_at_index(seeded_session):
+    statement = select(AssociationUserCompany.user_id).where(
+        AssociationUserCompany.company_id == 7,
+        AssociationUserCompany._closed_at.is_not(None),
+    )
+    plan = _plan(seeded_session, statement)
+    assert "ix_association_user_company_company_id_closed_at" in plan
+
+
+def test_role_reassignment_uses_company_role_index(seeded_session):
+    statement = (
+        update(AssociationUserCompany)
+        .where(
+            AssociationUserCompany.company_id == 7,
+            AssociationUserCompany.role_name == "Editor",
+        )
+        .values(role_name="Viewer")
+    )
+    plan = _plan(seeded_session, statement)
+    assert "ix_association_user_company_company_id_role_name" in plan
+
+
+def test_active_roles_use_primary_key(seeded_session):
+    statement = (
+        select(Role)
+        .where(Role.company_id == 7, Role._closed_at.is_(None))
+        .order_by(Role.name)
+    )
+    plan = _plan(seeded_session, statement)
+    # (company_id, name) already orders a company's roles; no extra index
+    assert "sqlite_autoindex_role_1" in plan
+    assert "TEMP B-TREE" not in plan
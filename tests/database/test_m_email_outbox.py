@@ -0,0 +1,148 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.database import Base, DatabaseSessionManager
+from app.database.email_outbox import EmailOutbox, utcnow
+from app.logic.mailer import EmailDispatcher, MailService
+from tests.database.conftest import test_session
+
+
+def _queue(session, count=1):
+    for i in range(count):
+        EmailOutbox.create(
+            session,
+            recipient=f"user{i}@example.com",
+            subject="Hello",
+            template_name="user_registration.html",
+            context={"user_name": f"User {i}"},
+        )
+
+
+def test_claim_due_leases_pending_emails(test_session):
+    _queue(test_session, 3)
+    later = test_session.scalars(select(EmailOutbox)).first()
+    later.next_attempt_at = utcnow() + timedelta(minutes=5)
+
+    claimed = EmailOutbox.claim_due(test_session, limit=10, lease=60)
+
+    assert [email.recipient for email in claimed] == [
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert all(email.attempts == 1 for email in claimed)
+    # leased rows are not handed out again
+    assert EmailOutbox.claim_due(test_session, limit=10) == []
+
+
+def test_mark_failed_retries_then_gives_up(test_session):
+    _queue(test_session)
+    (email,) = EmailOutbox.claim_due(test_session)
+
+    email.mark_failed("connection refused", retry_in=30, max_attempts=2)
+    assert email.status == EmailOutbox.PENDING
+    assert email.next_attempt_at > utcnow() + timedelta(seconds=25)
+
+    assert email.context == {"user_name": "User 0"}
+
+    email.attempts = 2
+    email.mark_failed("connection refused", retry_in=30, max_attempts=2)
+    assert email.status == EmailOutbox.FAILED
+    assert email.last_error == "connection refused"
+    assert email.context == {}
+
+
+def test_purge_deletes_only_old_finished_emails(test_session):
+    _queue(test_session, 3)
+    old, recent, pending = test_session.scalars(select(EmailOutbox)).all()
+    old.mark_sent()
+    old.sent_at = utcnow() - timedelta(days=8)
+    recent.mark_sent()
+    test_session.flush()
+
+    before = utcnow() - timedelta(days=7)
+    assert EmailOutbox.purge(test_session, before) == 1
+    test_session.expire_all()
+    assert [email.id for email in test_session.scalars(select(EmailOutbox))] == [
+        recent.id,
+        pending.id,
+    ]
+
+
+def test_retry_delay_backs_off_exponentially():
+    dispatcher = EmailDispatcher(backoff=10, backoff_max=60)
+    assert [dispatcher.retry_delay(n) for n in (1, 2, 3, 4)] == [10, 20, 40, 60]
+
+
+@pytest.fixture
+def outbox_database(tmp_path):
+    # the dispatcher uses the async engine, so share a file database with it
+    DatabaseSessionManager.dispose()
+    DatabaseSessionManager.initialize(
+        {"database_url": f"sqlite:///{tmp_path / 'outbox.db'}"}
+    )
+    Base.metadata.create_all(bind=DatabaseSessionManager._engine)
+    yield DatabaseSessionManager()
+    asyncio.run(DatabaseSessionManager.dispose_async())
+
+
+def test_dispatcher_sends_and_reschedules_failures(outbox_database, monkeypatch):
+    with outbox_database.session_object() as session:
+        _queue(session, 2)
+        session.commit()
+
+    sent = []
+
+    def fake_send(emails):
+        results = []
+        for email in emails:
+            if email["to"] == "user1@example.com":
+                results.append(ConnectionError("SMTP unavailable"))
+            else:
+                sent.append((email["to"], email["context"]["user_name"]))
+                results.append(None)
+        return results
+
+    monkeypatch.setattr(MailService, "send_template_emails", staticmethod(fake_send))
+    dispatcher = EmailDispatcher(backoff=30, max_attempts=3)
+
+    assert asyncio.run(dispatcher.dispatch_once()) == 2
+    # the failed email is not due again yet
+    assert asyncio.run(dispatcher.dispatch_once()) == 0
+
+    assert sent == [("user0@example.com", "User 0")]
+    with outbox_database.session_object() as session:
+        emails = {e.recipient: e for e in session.scalars(select(EmailOutbox))}
+    assert emails["user0@example.com"].status == EmailOutbox.SENT
+    failed = emails["user1@example.com"]
+    assert failed.status == EmailOutbox.PENDING
+    assert failed.attempts == 1
+    assert failed.last_error == "SMTP unavailable"
+
+
+def test_sent_otp_is_not_kept_in_the_outbox(outbox_database, monkeypatch):
+    with outbox_database.session_object() as session:
+        EmailOutbox.create(
+            session,
+            recipient="reset@example.com",
+            subject="Password Reset OTP",
+            template_name="reset_user_password.html",
+            context={"user_name": "Reset", "otp": "Ab12Cd"},
+        )
+        session.commit()
+
+    sent = []
+    monkeypatch.setattr(
+        MailService,
+        "send_template_emails",
+        staticmethod(lambda emails: [sent.append(e["context"]["otp"]) for e in emails]),
+    )
+    assert asyncio.run(EmailDispatcher().dispatch_once()) == 1
+
+    assert sent == ["Ab12Cd"]
+    with outbox_database.session_object() as session:
+        email = session.scalars(select(EmailOutbox)).one()
+    assert email.status == EmailOutbox.SENT
+    assert email.context == {}
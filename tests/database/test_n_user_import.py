@@ -0,0 +1,142 @@
+import asyncio
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import func, select
+
+from app.database import Base, DatabaseSessionManager
+from app.database.email_outbox import EmailOutbox
+from app.database.user import User
+from app.logic.user.importer import UserImporter, read_user_rows
+from app.utils.hash_password import hash_password
+from tests.database.conftest import test_session
+
+CSV = """email,password,first_name,last_name,phone_number
+ann@example.com,secret1,Ann,Lee,
+bob@example.com,secret2,Bob,,0123456789
+not-an-email,secret3,Bad,Row,
+ann@example.com,secret4,Ann,Again,
+carl@example.com,,Carl,,
+dora@example.com,secret5,Dora,Day,
+"""
+
+
+@pytest.fixture
+def import_database(tmp_path):
+    # the importer uses the async engine, so share a file database with it
+    DatabaseSessionManager.dispose()
+    DatabaseSessionManager.initialize(
+        {"database_url": f"sqlite:///{tmp_path / 'import.db'}"}
+    )
+    Base.metadata.create_all(bind=DatabaseSessionManager._engine)
+    with DatabaseSessionManager().session_object() as session:
+        User.create(session, email="dora@example.com", password="x")
+        session.commit()
+    yield DatabaseSessionManager()
+    asyncio.run(DatabaseSessionManager.dispose_async())
+
+
+def test_bulk_create_skip_conflicts_returns_inserted_rows(test_session):
+    User.create(test_session, email="taken@example.com", password="x")
+    inserted = User.bulk_create_skip_conflicts(
+        test_session,
+        [
+            {"email": "new@example.com", "password": "x"},
+            {"email": "taken@example.com", "password": "y"},
+            {"email": "new@example.com", "password": "z"},
+        ],
+        conflict_columns=["email"],
+        returning=["email"],
+    )
+    assert inserted == [{"email": "new@example.com"}]
+    assert test_session.scalar(select(func.count()).select_from(User)) == 2
+
+
+def test_read_user_rows_csv_and_ndjson():
+    rows = list(read_user_rows(io.StringIO(CSV), "csv"))
+    assert rows[0] == (
+        2,
+        {
+            "email": "ann@example.com",
+            "password": "secret1",
+            "first_name": "Ann",
+            "last_name": "Lee",
+            "phone_number": None,
+        },
+    )
+    assert len(rows) == 6
+
+    ndjson = '{"email": "a@example.com"}\n\n[1]\n{oops\n'
+    rows = list(read_user_rows(io.StringIO(ndjson), "ndjson"))
+    assert rows[0] == (1, {"email": "a@example.com"})
+    assert rows[1] == (3, "Expected a JSON object")
+    assert rows[2][0] == 4 and rows[2][1].startswith("Invalid JSON")
+
+
+def test_importer_reports_rows_it_skips(import_database):
+    issues = []
+    importer = UserImporter(chunk_size=2, on_issue=issues.append)
+    summary = asyncio.run(importer.run(read_user_rows(io.StringIO(CSV), "csv")))
+
+    assert summary.model_dump() == {
+        "rows": 6,
+        "created": 2,
+        "invalid": 2,
+        "duplicate": 0,
+        "exists": 2,
+    }
+    # ann@ again is in a later chunk, so it already exists by then
+    assert [(i.line, i.email, i.status) for i in issues] == [
+        (4, "not-an-email", "invalid"),
+        (5, "ann@example.com", "exists"),
+        (6, "carl@example.com", "invalid"),
+        (7, "dora@example.com", "exists"),
+    ]
+
+    with import_database.session_object() as session:
+        users = {u.email: u for u in session.scalars(select(User))}
+        queued = sorted(e.recipient for e in session.scalars(select(EmailOutbox)))
+    assert users["ann@example.com"].password == hash_password("secret1")
+    assert users["ann@example.com"].last_name == "Lee"
+    assert users["bob@example.com"].phone_number == "0123456789"
+    assert queued == ["ann@example.com", "bob@example.com"]
+
+
+def test_importer_reports_duplicates_within_a_chunk(import_database):
+    issues = []
+    rows = [
+        (1, {"email": "eve@example.com", "password": "p"}),
+        (2, {"email": "eve@example.com", "password": "q"}),
+    ]
+    summary = asyncio.run(
+        UserImporter(send_emails=False, on_issue=issues.append).run(rows)
+    )
+    assert (summary.created, summary.duplicate) == (1, 1)
+    assert issues[0].status == "duplicate" and issues[0].line == 2
+
+
+def test_import_users_command(import_database, tmp_path, monkeypatch):
+    from app.main import main
+
+    # the command initializes the manager itself; keep the test database
+    monkeypatch.setattr(DatabaseSessionManager, "initialize", lambda *a, **k: None)
+    source = tmp_path / "users.ndjson"
+    source.write_text(
+        json.dumps({"email": "fay@example.com", "password": "pw"})
+        + "\n"
+        + json.dumps({"email": "dora@example.com", "password": "pw"})
+        + "\n"
+    )
+    report = tmp_path / "report.ndjson"
+
+    result = CliRunner().invoke(
+        main,
+        ["import-users", str(source), "--no-emails", "--report", str(report)],
+    )
+
+    assert result.exit_code == 0, result.output
+    (issue,) = [json.loads(line) for line in report.read_text().splitlines()]
+    assert issue["email"] == "dora@example.com"
+    assert issue["status"] == "exists"
@@ -0,0 +1,137 @@
+import pytest
+from sqlalchemy import event, null, update
+from sqlalchemy.dialects import postgresql
+
+from app.database.base_model import RecordNotFoundError
+from app.database.json_patch import json_set
+from app.database.role import Role
+from app.database.company import Company
+from app.database.user import User
+from tests.database.conftest import test_session
+
+
+@pytest.fixture
+def statements(test_session):
+    executed = []
+    engine = test_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: executed.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_patch_sets_one_key_in_a_single_update(test_session, statements):
+    user = User.create(
+        test_session,
+        email="patch@example.com",
+        password="x",
+        primary_meta_data={"keep": {"nested": [1, 2]}, "replace": "old"},
+    )
+    test_session.expunge_all()
+    statements.clear()
+
+    patched = User.update_json_field(
+        test_session, user["id"], "primary_meta_data", "replace", {"new": True}
+    )
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().startswith("UPDATE")
+    assert patched["primary_meta_data"] == {
+        "keep": {"nested": [1, 2]},
+        "replace": {"new": True},
+    }
+
+
+def test_patch_does_not_overwrite_concurrent_keys(test_session):
+    user = User.create(test_session, email="race@example.com", password="x")
+    loaded = test_session.get(User, user["id"])
+
+    User.patch_json_field(
+        test_session, {"id": user["id"]}, "primary_meta_data", "a", "first"
+    )
+    User.patch_json_field(
+        test_session, {"id": user["id"]}, "primary_meta_data", "b", "second"
+    )
+
+    # the loaded instance was expired rather than left stale
+    assert loaded.primary_meta_data == {"a": "first", "b": "second"}
+
+
+def test_patch_handles_null_documents_and_misses(test_session):
+    user = User.create(test_session, email="null@example.com", password="x")
+    # JSON null, then SQL NULL
+    for document in (None, null()):
+        test_session.execute(
+            update(User).where(User.id == user["id"]).values(primary_meta_data=document)
+        )
+        patched = User.patch_json_field(
+            test_session, {"email": "null@example.com"}, "primary_meta_data", "k", 1
+        )
+        assert patched["primary_meta_data"] == {"k": 1}
+
+    assert (
+        User.patch_json_field(
+            test_session, {"email": "nobody@example.com"}, "primary_meta_data", "k", 1
+        )
+        is None
+    )
+    with pytest.raises(ValueError, match="is not a JSON field"):
+        User.patch_json_field(test_session, {"id": user["id"]}, "email", "k", 1)
+
+
+def test_role_update_json_field_by_composite_key(test_session):
+    company = Company.create(test_session, email="json@example.com")
+    Role.create(test_session, company_id=company["id"], name="Viewer")
+
+    role = Role.update_json_field(
+        test_session, company["id"], "Viewer", "primary_meta_data", "k", "v"
+    )
+    assert role["primary_meta_data"] == {"k": "v"}
+
+    with pytest.raises(ValueError, match="not found"):
+        Role.update_json_field(
+            test_session, company["id"], "Missing", "primary_meta_data", "k", "v"
+        )
+
+
+def test_json_set_compiles_to_jsonb_concatenation_on_postgres():
+    statement = (
+        update(User)
+        .where(User.id == 1)
+        .values(primary_meta_data=json_set(User.primary_meta_data, "key", {"a": 1}))
+    )
+    sql = str(statement.compile(dialect=postgresql.psycopg.dialect()))
+    assert 'jsonb_typeof("user".primary_meta_data)' in sql
+    assert "ELSE '{}'::jsonb END || jsonb_build_object(" in sql
+    impl = User.__table__.c.primary_meta_data.type.dialect_impl(
+        postgresql.psycopg.dialect()
+    )
+    assert isinstance(impl, postgresql.JSONB)
+
+
+def test_patch_rewrites_the_document_on_other_dialects(
+    test_session, statements, monkeypatch
+):
+    user = User.create(
+        test_session,
+        email="mysql@example.com",
+        password="x",
+        primary_meta_data={"keep": 1},
+    )
+    company = Company.create(test_session, email="mysql@example.com")
+    Role.create(test_session, company_id=company["id"], name="Viewer")
+    monkeypatch.setattr(test_session.get_bind().dialect, "name", "mysql")
+    statements.clear()
+
+    patched = User.update_json_field(
+        test_session, user["id"], "primary_meta_data", "k", [1]
+    )
+    role = Role.update_json_field(
+        test_session, company["id"], "Viewer", "primary_meta_data", "k", "v"
+    )
+
+    assert patched["primary_meta_data"] == {"keep": 1, "k": [1]}
+    assert role["primary_meta_data"] == {"k": "v"}
+    assert not any("json_set" in statement for statement in statements)
+    with pytest.raises(RecordNotFoundError):
+        User.update_json_field(test_session, -1, "primary_meta_data", "k", 1)
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import event, select
+
+from app.database.association_user_company import AssociationUserCompany
+from app.database.audit_event import AuditEvent
+from app.database.company import Company
+from app.database.user import User
+from app.models.company.response_messages import CompanyUserResponseMessages
+from app.models.user.user import UserRead
+from app.utils.app_error import AppError
+from tests.database.conftest import test_session
+
+
+@pytest.fixture
+def company_with_users(test_session):
+    users = [
+        User.create(test_session, email=f"audit{i}@example.com", password="x")
+        for i in range(4)
+    ]
+    creator = UserRead(id=users[0]["id"], email=users[0]["email"])
+    company = Company.register(
+        test_session,
+        data={"email": "audit@example.com", "name": "Audit"},
+        roles=[("Administrator", "All access"), ("Viewer", "Read only")],
+        admin_role="Administrator",
+        created_by=creator,
+    )
+    test_session.commit()
+    return company, users, creator
+
+
+def _events(session, action):
+    return session.scalars(
+        select(AuditEvent).where(AuditEvent.action == action).order_by(AuditEvent.id)
+    ).all()
+
+
+def test_link_users_writes_events_in_one_insert(test_session, company_with_users):
+    company, users, creator = company_with_users
+    statements = []
+    engine = test_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        AssociationUserCompany.link_users(
+            test_session,
+            company_id=company["id"],
+            members={user["id"]: "Viewer" for user in users[1:]},
+            added_by=creator,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert (
+        len([s for s in statements if s.lstrip().startswith("INSERT INTO audit")]) == 1
+    )
+    added = _events(test_session, AuditEvent.MEMBER_ADDED)
+    assert [e.target_id for e in added] == [str(user["id"]) for user in users[1:]]
+    assert all(
+        e.actor_id == creator.id
+        and e.company_id == company["id"]
+        and e.payload == {"role_name": "Viewer"}
+        for e in added
+    )
+    # links no longer carry who added them
+    link = test_session.get(AssociationUserCompany, (users[1]["id"], company["id"]))
+    assert link.primary_meta_data == {}
+
+
+def test_unlink_records_event_and_protects_creator(test_session, company_with_users):
+    company, users, creator = company_with_users
+    AssociationUserCompany.link_user(
+        test_session,
+        company_id=company["id"],
+        user_id=users[1]["id"],
+        role_name="Administrator",
+        added_by=creator,
+    )
+    other_admin = UserRead(id=users[1]["id"], email=users[1]["email"])
+
+    with pytest.raises(AppError) as e:
+        AssociationUserCompany.unlink_user(
+            test_session,
+            company_id=company["id"],
+            user_id=creator.id,
+            removed_by=creator,
+        )
+    assert (
+        e.value.detail["message"]
+        == CompanyUserResponseMessages.SUPER_ADMIN_REMOVE_FORBIDDEN.value
+    )
+
+    # any other admin may leave on their own
+    AssociationUserCompany.unlink_user(
+        test_session,
+        company_id=company["id"],
+        user_id=other_admin.id,
+        removed_by=other_admin,
+    )
+    removed = _events(test_session, AuditEvent.MEMBER_REMOVED)
+    assert [(e.actor_id, e.target_id, e.payload) for e in removed] == [
+        (other_admin.id, str(other_admin.id), {"role_name": "Administrator"})
+    ]
+
+
+def test_events_roll_back_with_the_change(test_session, company_with_users):
+    company, users, creator = company_with_users
+    AssociationUserCompany.link_user(
+        test_session,
+        company_id=company["id"],
+        user_id=users[1]["id"],
+        role_name="Viewer",
+        added_by=creator,
+    )
+    assert len(_events(test_session, AuditEvent.MEMBER_ADDED)) == 1
+
+    test_session.rollback()
+
+    assert _events(test_session, AuditEvent.MEMBER_ADDED) == []
+    assert len(_events(test_session, AuditEvent.COMPANY_CREATED)) == 1
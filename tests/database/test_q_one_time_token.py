@@ -0,0 +1,127 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.database import Base, DatabaseSessionManager
+from app.database.one_time_token import OneTimeToken
+from app.database.user import User
+from app.logic.user.tokens import TokenSweeper
+from tests.database.conftest import test_session
+
+RESET = OneTimeToken.PASSWORD_RESET
+SECRET = b"server-secret"
+
+
+def _user(session, email="otp@example.com"):
+    return User.create(session, email=email, password="x")["id"]
+
+
+def _expire(session, user_id):
+    session.execute(
+        update(OneTimeToken)
+        .where(OneTimeToken.user_id == user_id)
+        .values(expires_at=OneTimeToken.created_at - timedelta(seconds=1))
+    )
+
+
+def test_issue_stores_only_a_hash_and_replaces(test_session):
+    user_id = _user(test_session)
+    OneTimeToken.issue(
+        test_session, user_id, RESET, "ABC123", SECRET, timedelta(hours=1)
+    )
+    OneTimeToken.issue(
+        test_session, user_id, RESET, "XYZ789", SECRET, timedelta(hours=1)
+    )
+
+    (token,) = test_session.scalars(select(OneTimeToken)).all()
+    assert "XYZ789" not in token.token_hash
+    assert token.expires_at - token.created_at == timedelta(hours=1)
+
+    assert OneTimeToken.verify(test_session, user_id, RESET, "ABC123", SECRET) is False
+    assert OneTimeToken.verify(test_session, user_id, RESET, "XYZ789", SECRET) is True
+    # used up
+    assert OneTimeToken.verify(test_session, user_id, RESET, "XYZ789", SECRET) is False
+    assert test_session.scalars(select(OneTimeToken)).all() == []
+
+
+def test_token_hash_is_keyed_with_the_server_secret(test_session):
+    user_id = _user(test_session)
+    OneTimeToken.issue(
+        test_session, user_id, RESET, "ABC123", SECRET, timedelta(hours=1)
+    )
+
+    token = test_session.scalars(select(OneTimeToken)).one()
+    assert token.token_hash != OneTimeToken.hash_token(
+        b"other", user_id, RESET, "ABC123"
+    )
+    assert (
+        OneTimeToken.verify(test_session, user_id, RESET, "ABC123", b"other") is False
+    )
+    assert OneTimeToken.verify(test_session, user_id, RESET, "ABC123", SECRET) is True
+
+
+def test_verify_counts_attempts(test_session):
+    user_id = _user(test_session)
+    OneTimeToken.issue(
+        test_session,
+        user_id,
+        RESET,
+        "ABC123",
+        SECRET,
+        timedelta(hours=1),
+        max_attempts=2,
+    )
+
+    assert OneTimeToken.verify(test_session, user_id, RESET, "wrong", SECRET) is False
+    assert OneTimeToken.verify(test_session, user_id, RESET, "wrong", SECRET) is False
+    # locked once the attempts run out, even with the right token
+    assert OneTimeToken.verify(test_session, user_id, RESET, "ABC123", SECRET) is False
+
+    # a new token starts over
+    OneTimeToken.issue(
+        test_session, user_id, RESET, "ABC123", SECRET, timedelta(hours=1)
+    )
+    assert OneTimeToken.verify(test_session, user_id, RESET, "ABC123", SECRET) is True
+
+
+def test_expired_tokens_are_rejected_and_swept(test_session):
+    stale, fresh = _user(test_session), _user(test_session, "fresh@example.com")
+    for user_id in (stale, fresh):
+        OneTimeToken.issue(
+            test_session, user_id, RESET, "ABC123", SECRET, timedelta(hours=1)
+        )
+    _expire(test_session, stale)
+
+    assert OneTimeToken.verify(test_session, stale, RESET, "ABC123", SECRET) is False
+    assert OneTimeToken.sweep(test_session) == 1
+    assert [t.user_id for t in test_session.scalars(select(OneTimeToken))] == [fresh]
+
+
+@pytest.fixture
+def token_database(tmp_path):
+    # the sweeper uses the async engine, so share a file database with it
+    DatabaseSessionManager.dispose()
+    DatabaseSessionManager.initialize(
+        {"database_url": f"sqlite:///{tmp_path / 'tokens.db'}"}
+    )
+    Base.metadata.create_all(bind=DatabaseSessionManager._engine)
+    yield DatabaseSessionManager()
+    asyncio.run(DatabaseSessionManager.dispose_async())
+
+
+def test_sweeper_deletes_expired_tokens_in_batches(token_database):
+    with token_database.session_object() as session:
+        for i in range(3):
+            user_id = _user(session, f"sweep{i}@example.com")
+            OneTimeToken.issue(
+                session, user_id, RESET, "ABC123", SECRET, timedelta(hours=1)
+            )
+            _expire(session, user_id)
+        session.commit()
+
+    sweeper = TokenSweeper(batch_size=2)
+    assert asyncio.run(sweeper.sweep_once()) == 2
+    assert asyncio.run(sweeper.sweep_once()) == 1
+    assert asyncio.run(sweeper.sweep_once()) == 0
@@ -1,3 +1,8 @@
+from sqlalchemy import select
+
+from app.database import DatabaseSessionManager
+from app.database.one_time_token import OneTimeToken
+from app.database.user import User
 from app.models.user.response_messages import PasswordResetResponseMessages
 from tests.http.conftest import client, get_user_two_otp, test_user_data
 from tests.utils.basic_auth import get_basic_auth_header
@@ -29,6 +34,15 @@ def test_a_password_reset_validate_otp_fail(client, test_user_data, get_user_two
     )
     assert json_data["detail"]["error"] == PasswordResetResponseMessages.ERROR.value
 
+    # the failed attempt outlives the rolled back request
+    with DatabaseSessionManager().session_object() as session:
+        attempts = session.scalar(
+            select(OneTimeToken.attempts)
+            .join(User, User.id == OneTimeToken.user_id)
+            .where(User.email == user_one["email"])
+        )
+    assert attempts == 1
+
 
 def test_b_password_reset_validate_otp_success(
     client, test_user_data, get_user_two_otp
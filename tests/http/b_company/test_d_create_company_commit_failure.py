@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import DatabaseSessionManager
+from app.database.company import Company
+from tests.http.conftest import client, login_token
+
+
+def test_failed_commit_is_reported_to_the_client(client, login_token, monkeypatch):
+    """
+    The request's commit runs before the response is sent, so a commit that
+    fails turns into an error response instead of a lost write behind a 201.
+    """
+
+    async def failing_commit(self):
+        raise OperationalError("COMMIT", {}, Exception("connection lost"))
+
+    payload = {"name": "Commit Failure", "email": "commit.failure@email.com"}
+    headers = {"Authorization": f"Bearer {login_token}"}
+    # the session client re-raises server errors; this one returns them
+    app_client = TestClient(client.app, raise_server_exceptions=False)
+
+    monkeypatch.setattr(AsyncSession, "commit", failing_commit)
+    response = app_client.post("/company", json=payload, headers=headers)
+    monkeypatch.undo()
+
+    assert response.status_code == 500
+    assert "connection lost" in response.json()["detail"]["error"]
+
+    with DatabaseSessionManager().session_object() as session:
+        assert session.scalar(select(Company).filter_by(email=payload["email"])) is None
@@ -83,3 +83,55 @@ def test_get_roles_with_pagination(client, login_token, test_company_data):
     assert pagination["limit"] == 1
     assert pagination["offset"] == 1
     assert pagination["current_page"] == 2
+
+
+def test_get_roles_with_cursor(client, login_token, test_company_data):
+    """
+    Test walking every role page by page with next_cursor.
+    """
+    headers = {
+        "Authorization": f"Bearer {login_token}",
+        "accept": "application/json",
+    }
+
+    names, query = [], "limit=1"
+    while True:
+        response = client.get(f"/company/1/roles?{query}", headers=headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        names.extend(role["name"] for role in data["records"])
+        next_cursor = data["pagination"]["next_cursor"]
+        if not next_cursor:
+            break
+        assert data["pagination"]["current_page"] in (1, None)
+        query = f"limit=1&cursor={next_cursor}"
+
+    assert names == sorted(names)
+    assert set(names) == {"Administrator", "User Updated", "Viewer"}
+
+
+def test_get_roles_with_invalid_cursor(client, login_token, test_company_data):
+    headers = {
+        "Authorization": f"Bearer {login_token}",
+        "accept": "application/json",
+    }
+
+    response = client.get(
+        "/company/1/roles?limit=1&cursor=not-a-cursor", headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_get_roles_without_count(client, login_token, test_company_data):
+    headers = {
+        "Authorization": f"Bearer {login_token}",
+        "accept": "application/json",
+    }
+
+    response = client.get("/company/1/roles?limit=1&count=none", headers=headers)
+    assert response.status_code == 200
+    pagination = response.json()["data"]["pagination"]
+    assert pagination["total_records"] is None
+    assert pagination["total_pages"] is None
+    assert pagination["count"] == "none"
+    assert pagination["next_cursor"]
@@ -9,7 +9,8 @@ from fastapi.testclient import TestClient
 from app.main import create_app
 from app.utils.config.loader import ConfigLoader
 from app.database import DatabaseSessionManager
-from app.database.user import User
+from app.database.bootstrap import bootstrap_database
+from app.logic.user.password import UserPasswordService
 
 
 @pytest.fixture(scope="session")
@@ -20,9 +21,14 @@ def client():
         environment="testing"
     ).get_config()  # pulls the default from your updated loader
 
+    # schema for the database the app's lifespan connects to
+    bootstrap_database()
     with patch.object(ConfigLoader, "get_config", return_value=default_config):
         app = create_app()
-        return TestClient(app)
+
+    # run the lifespan so every request shares one event loop and engine
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="session")
@@ -41,19 +47,24 @@ def test_company_data():
     return data
 
 
-# Get user row based on email, and extract OTP
+# Request a password reset for user two and capture the OTP it issues
 @pytest.fixture
-def get_user_two_otp(test_user_data):
-    """Get user row based on email, and extract OTP."""
-    user_one = test_user_data["user_two"]
-    email = user_one["email"]
-    db = DatabaseSessionManager()
-    session = db.session_object()
-    user = session.query(User).filter_by(email=email).first()
-    if user:
-        password_reset_data = user.primary_meta_data.get("password_reset", {})
-        return password_reset_data.get("password_reset_token")
-    return None
+def get_user_two_otp(client, test_user_data):
+    """Only a hash of the OTP is stored, so record it as it is generated."""
+    issued = []
+    generate = UserPasswordService.generate_random_string
+
+    def record(length=10):
+        issued.append(generate(length=length))
+        return issued[-1]
+
+    with patch.object(UserPasswordService, "generate_random_string", record):
+        response = client.patch(
+            "password-reset/request",
+            json={"email": test_user_data["user_two"]["email"]},
+        )
+    assert response.status_code == 202
+    return issued[-1]
 
 
 @pytest.fixture
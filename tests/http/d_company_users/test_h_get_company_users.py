@@ -94,3 +94,43 @@ def test_get_users_for_company(
             json_data["detail"]["message"]
             == CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value
         )
+
+
+@pytest.mark.parametrize(
+    "company_id, query_params, expected_emails, expected_status",
+    [
+        (1, "q=USER.O", ["user.one@email.com"], 200),
+        (1, "q=user.&limit=1", ["user.one@email.com"], 200),
+        (1, "q=user.two", [], 200),
+        (1, "q=%25", [], 200),
+        (1, "q=", [], 422),
+        (1, "q=%20%20%20", [], 422),
+        (1, "q=%20user.o%20", ["user.one@email.com"], 200),
+        (2, "q=user", [], 403),
+    ],
+)
+def test_lookup_company_users(
+    client, login_token, company_id, query_params, expected_emails, expected_status
+):
+    """
+    Test typeahead lookup of company members by prefix.
+    """
+    headers = {
+        "Authorization": f"Bearer {login_token}",
+        "accept": "application/json",
+    }
+
+    response = client.get(
+        f"/company/{company_id}/users/lookup?{query_params}", headers=headers
+    )
+    assert response.status_code == expected_status
+
+    if expected_status == 200:
+        json_data = response.json()
+        assert (
+            json_data["message"]
+            == CompanyUserResponseMessages.LOOKUP_COMPANY_USERS.value
+        )
+        assert [user["email"] for user in json_data["data"]] == expected_emails
+        for user in json_data["data"]:
+            assert set(user) == {"id", "first_name", "last_name", "email"}
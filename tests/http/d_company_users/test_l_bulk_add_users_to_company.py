@@ -0,0 +1,98 @@
+import pytest
+from tests.http.conftest import client, login_token, login_token_user_two
+from app.database import DatabaseSessionManager
+from app.database.email_outbox import EmailOutbox
+from app.models.company.response_messages import (
+    CompanyResponseMessages,
+    CompanyUserResponseMessages,
+)
+
+
+def _headers(token):
+    return {
+        "Authorization": f"Bearer {token}",
+        "accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+
+def test_bulk_add_users_forbidden_for_non_admin(client, login_token_user_two):
+    response = client.post(
+        "/company/1/users/bulk",
+        json={"users": [{"email": "user.three@email.com", "role": "Viewer"}]},
+        headers=_headers(login_token_user_two),
+    )
+    assert response.status_code == 403
+    assert (
+        response.json()["detail"]["message"]
+        == CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value
+    )
+
+
+def test_bulk_add_users_rejects_empty_payload(client, login_token):
+    response = client.post(
+        "/company/1/users/bulk", json={"users": []}, headers=_headers(login_token)
+    )
+    assert response.status_code in (400, 422)
+
+
+def test_bulk_add_users_reports_each_entry(client, login_token):
+    """
+    user.three was removed from company 1 earlier, so its link is re-opened;
+    user.two is new to the company.
+    """
+    payload = {
+        "users": [
+            {"email": "user.two@email.com", "role": "Viewer"},
+            {"email": "user.three@email.com", "role": "Viewer"},
+            {"email": "user.one@email.com", "role": "Viewer"},
+            {"email": "user.three@email.com", "role": "Viewer"},
+            {"email": "nobody@email.com", "role": "Viewer"},
+            {"email": "user.two@email.com", "role": "NotARealRole"},
+        ]
+    }
+    response = client.post(
+        "/company/1/users/bulk", json=payload, headers=_headers(login_token)
+    )
+    assert response.status_code == 200
+    json_data = response.json()
+    assert json_data["message"] == CompanyUserResponseMessages.BULK_ADD_USERS.value
+
+    data = json_data["data"]
+    assert [outcome["status"] for outcome in data["results"]] == [
+        "added",
+        "added",
+        "already_member",
+        "duplicate",
+        "user_not_found",
+        "role_not_found",
+    ]
+    assert data["added"] == 2
+    assert data["failed"] == 4
+
+    members = client.get("/company/1/users", headers=_headers(login_token)).json()
+    roles = {
+        record["email"]: record["role_name"] for record in members["data"]["records"]
+    }
+    assert roles["user.two@email.com"] == "Viewer"
+    assert roles["user.three@email.com"] == "Viewer"
+
+    with DatabaseSessionManager().session_object() as session:
+        invited = {
+            email.recipient
+            for email in session.query(EmailOutbox).filter_by(
+                template_name="company_invite.html"
+            )
+        }
+    assert {"user.two@email.com", "user.three@email.com"} <= invited
+
+    # a second run adds nobody
+    response = client.post(
+        "/company/1/users/bulk",
+        json={"users": payload["users"][:2]},
+        headers=_headers(login_token),
+    )
+    assert [outcome["status"] for outcome in response.json()["data"]["results"]] == [
+        "already_member",
+        "already_member",
+    ]
@@ -0,0 +1,64 @@
+import pytest
+from tests.http.conftest import client, login_token, login_token_user_two
+from app.database.audit_event import AuditEvent
+from app.models.company.response_messages import CompanyResponseMessages
+
+
+def _headers(token):
+    return {"Authorization": f"Bearer {token}", "accept": "application/json"}
+
+
+def test_audit_events_forbidden_for_non_admin(client, login_token_user_two):
+    response = client.get("/company/1/audit", headers=_headers(login_token_user_two))
+    assert response.status_code == 403
+    assert (
+        response.json()["detail"]["message"]
+        == CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value
+    )
+
+
+def test_audit_events_record_company_history(client, login_token):
+    response = client.get(
+        "/company/1/audit", params={"limit": 100}, headers=_headers(login_token)
+    )
+    assert response.status_code == 200
+    json_data = response.json()
+    assert (
+        json_data["message"] == CompanyResponseMessages.GET_COMPANY_AUDIT_EVENTS.value
+    )
+    events = json_data["data"]["records"]
+    actions = [event["action"] for event in events]
+    assert actions[0] == AuditEvent.COMPANY_CREATED
+    assert {
+        AuditEvent.ROLE_CREATED,
+        AuditEvent.MEMBER_ADDED,
+        AuditEvent.MEMBER_REMOVED,
+    } <= set(actions)
+    assert [event["id"] for event in events] == sorted(e["id"] for e in events)
+    assert all(event["company_id"] == 1 for event in events)
+
+
+def test_audit_events_filter_and_cursor(client, login_token):
+    response = client.get(
+        "/company/1/audit",
+        params={"action": AuditEvent.MEMBER_REMOVED, "target_type": "user"},
+        headers=_headers(login_token),
+    )
+    assert response.status_code == 200
+    removed = response.json()["data"]["records"]
+    assert [(event["actor_id"], event["target_id"]) for event in removed] == [(1, "3")]
+
+    first = client.get(
+        "/company/1/audit",
+        params={"limit": 1, "count": "none"},
+        headers=_headers(login_token),
+    ).json()["data"]
+    cursor = first["pagination"]["next_cursor"]
+    assert cursor and first["pagination"]["total_records"] is None
+
+    second = client.get(
+        "/company/1/audit",
+        params={"limit": 1, "cursor": cursor},
+        headers=_headers(login_token),
+    ).json()["data"]
+    assert second["records"][0]["id"] > first["records"][0]["id"]
@@ -1,3 +1,7 @@
+from unittest.mock import patch
+
+from app.main import create_app
+from app.utils.config.loader import ConfigLoader
 from tests.http.conftest import client
 
 
@@ -11,3 +15,38 @@ def test_read_main(client):
     assert "description" in json_data
     assert "status" in json_data
     assert json_data["status"] == "ok"
+
+
+def test_database_pool_health(client):
+    response = client.get("/health/database")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_jwks(client):
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert "keys" in response.json()
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = client.get(
+        "/.well-known/jwks.json",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_telemetry_is_set_up_when_enabled():
+    configs = ConfigLoader(environment="testing").get_config()
+    enabled = configs.model_copy(
+        update={"telemetry": {"ENABLED": True, "SERVICE_NAME": "userverse-test"}}
+    )
+    with (
+        patch.object(ConfigLoader, "get_config", return_value=enabled),
+        patch("app.main.setup_otel") as setup_otel,
+    ):
+        app = create_app()
+
+    setup_otel.assert_called_once()
+    assert setup_otel.call_args.args == (app,)
+    assert setup_otel.call_args.kwargs["service_name"] == "userverse-test"
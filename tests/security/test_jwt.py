@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from fastapi import status
 import jwt
+from unittest.mock import patch
 
 from app.models.user.user import UserRead
 from app.models.security_messages import SecurityResponseMessages
@@ -71,3 +72,29 @@ def test_decode_invalid_token_signature():
         jwt_manager.decode_token(tampered_token)
     assert e.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert e.value.detail["message"] == SecurityResponseMessages.INVALID_TOKEN.value
+
+
+def test_get_instance_is_reused():
+    assert JWTManager.get_instance() is JWTManager.get_instance()
+
+
+def test_decode_repeat_token_uses_cache():
+    jwt_manager = JWTManager()
+    tokens = jwt_manager.sign_jwt(sample_user)
+    first = jwt_manager.decode_token(tokens.access_token)
+
+    with patch("app.security.jwt.jwt.decode") as mock_decode:
+        second = jwt_manager.decode_token(tokens.access_token)
+
+    mock_decode.assert_not_called()
+    assert second is first
+    assert jwt_manager.token_cache.stats()["hits"] == 1
+
+
+def test_decode_does_not_cache_rejected_tokens():
+    jwt_manager = JWTManager()
+    tokens = jwt_manager.sign_jwt(sample_user)
+    with pytest.raises(AppError):
+        jwt_manager.decode_token(tokens.refresh_token)
+
+    assert jwt_manager.token_cache.stats()["size"] == 0
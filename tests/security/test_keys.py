@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import patch
+from cryptography.hazmat.primitives import serialization
+from fastapi import status
+
+from app.models.user.user import UserRead
+from app.security.jwt import JWTManager
+from app.security.keys import KeyRing, generate_private_key_pem
+from app.utils.app_error import AppError
+from app.utils.config.loader import ConfigLoader
+
+sample_user = UserRead(id=1, email="test@example.com")
+OLD_KEY = generate_private_key_pem("ES256")
+NEW_KEY = generate_private_key_pem("EdDSA")
+
+
+def _manager(jwt_config: dict) -> JWTManager:
+    with patch.object(ConfigLoader, "get_config", return_value={"jwt": jwt_config}):
+        return JWTManager()
+
+
+def test_asymmetric_token_round_trip():
+    jwt_manager = _manager(
+        {"ALGORITHM": "EdDSA", "KEYS": [{"KID": "k1", "PRIVATE_KEY": NEW_KEY}]}
+    )
+    tokens = jwt_manager.sign_jwt(sample_user)
+
+    assert jwt_manager.decode_token(tokens.access_token).email == sample_user.email
+
+
+def test_token_signed_before_rotation_still_verifies():
+    before = _manager(
+        {"ALGORITHM": "ES256", "KEYS": [{"KID": "old", "PRIVATE_KEY": OLD_KEY}]}
+    )
+    token = before.sign_jwt(sample_user).access_token
+
+    after = _manager(
+        {
+            "ALGORITHM": "EdDSA",
+            "ACTIVE_KID": "new",
+            "KEYS": [
+                {"KID": "new", "PRIVATE_KEY": NEW_KEY},
+                {"KID": "old", "ALGORITHM": "ES256", "PRIVATE_KEY": OLD_KEY},
+            ],
+        }
+    )
+
+    assert after.decode_token(token).email == sample_user.email
+    assert {key["kid"] for key in after.key_ring.jwks["keys"]} == {"new", "old"}
+
+
+def test_unknown_kid_is_rejected():
+    other = _manager(
+        {"ALGORITHM": "ES256", "KEYS": [{"KID": "other", "PRIVATE_KEY": OLD_KEY}]}
+    )
+    token = other.sign_jwt(sample_user).access_token
+    jwt_manager = _manager(
+        {"ALGORITHM": "EdDSA", "KEYS": [{"KID": "k1", "PRIVATE_KEY": NEW_KEY}]}
+    )
+
+    with pytest.raises(AppError) as e:
+        jwt_manager.decode_token(token)
+    assert e.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_jwks_publishes_public_keys_only():
+    key_ring = KeyRing.from_config(
+        {"ALGORITHM": "EdDSA", "KEYS": [{"KID": "k1", "PRIVATE_KEY": NEW_KEY}]}
+    )
+    (jwk,) = key_ring.jwks["keys"]
+
+    assert jwk["kid"] == "k1"
+    assert jwk["alg"] == "EdDSA"
+    assert "d" not in jwk
+
+
+def test_hmac_key_ring_publishes_nothing():
+    key_ring = KeyRing.from_config({"ALGORITHM": "HS256", "SECRET": "secret"})
+
+    assert key_ring.jwks == {"keys": []}
+
+
+def test_active_key_must_have_private_key():
+    public_key = KeyRing.from_config(
+        {"ALGORITHM": "EdDSA", "KEYS": [{"KID": "k1", "PRIVATE_KEY": NEW_KEY}]}
+    ).active.public_key
+    public_pem = public_key.public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+    with pytest.raises(ValueError, match="no private key"):
+        KeyRing.from_config(
+            {"ALGORITHM": "EdDSA", "KEYS": [{"KID": "k1", "PUBLIC_KEY": public_pem}]}
+        )
@@ -0,0 +1,118 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.logic.company.user import CompanyUserService
+from app.models.user.user import UserRead
+from app.security.jwt import JWTManager
+from app.security.membership import MembershipChanges, MembershipClaim
+from app.utils.app_error import AppError
+
+sample_user = UserRead(id=1, email="test@example.com")
+
+
+def test_claim_round_trips_through_access_token():
+    jwt_manager = JWTManager()
+    tokens = jwt_manager.sign_jwt(sample_user, memberships={7: "Administrator"})
+    user = jwt_manager.decode_token(tokens.access_token)
+
+    assert user.memberships.roles == {7: "Administrator"}
+    assert "memberships" not in user.model_dump()
+
+
+def test_large_claims_are_left_out():
+    jwt_manager = JWTManager()
+    memberships = {i: "Viewer" for i in range(jwt_manager.MEMBERSHIP_CLAIM_LIMIT + 1)}
+    tokens = jwt_manager.sign_jwt(sample_user, memberships=memberships)
+
+    assert jwt_manager.decode_token(tokens.access_token).memberships is None
+
+
+def test_claim_grants_only_matching_fresh_membership():
+    claim = MembershipClaim({7: "Administrator"}, int(time.time()))
+
+    assert claim.grants(1, 7)
+    assert claim.grants(1, 7, "Administrator")
+    assert not claim.grants(1, 7, "Viewer")
+    assert not claim.grants(1, 8)
+
+
+def test_claim_expires_after_max_age():
+    claim = MembershipClaim({7: "Administrator"}, int(time.time()) - 120, max_age=60)
+
+    assert not claim.grants(1, 7)
+
+
+def test_local_change_makes_claim_stale():
+    changes = MembershipChanges()
+    claim = MembershipClaim({7: "Administrator"}, int(time.time()))
+
+    with patch("app.security.membership.membership_changes", changes):
+        assert claim.grants(1, 7)
+        changes.company_changed(7)
+        assert not claim.grants(1, 7)
+
+
+def test_fresh_claim_skips_database_check():
+    session = AsyncMock()
+    claim = MembershipClaim({7: "Administrator"}, int(time.time()))
+
+    result = asyncio.run(
+        CompanyUserService.check_if_user_is_in_company(
+            session, user_id=1, company_id=7, role="Administrator", memberships=claim
+        )
+    )
+
+    assert result is True
+    session.run_sync.assert_not_called()
+
+
+def test_claim_is_trusted_for_the_access_token_lifetime():
+    jwt_manager = JWTManager()
+    tokens = jwt_manager.sign_jwt(sample_user, memberships={7: "Administrator"})
+    claim = jwt_manager.decode_token(tokens.access_token).memberships
+    lifetime = jwt_manager.SESSION_TIMEOUT * 60
+    session = AsyncMock()
+    changes = MembershipChanges()
+
+    assert jwt_manager.MEMBERSHIP_CLAIM_MAX_AGE == lifetime
+    with (
+        patch("app.security.membership.membership_changes", changes),
+        patch(
+            "app.security.membership.time.time",
+            return_value=claim.version + lifetime - 1,
+        ),
+    ):
+        # shortly before the token expires, no database check is needed
+        assert asyncio.run(
+            CompanyUserService.check_if_user_is_in_company(
+                session,
+                user_id=1,
+                company_id=7,
+                role="Administrator",
+                memberships=claim,
+            )
+        )
+        session.run_sync.assert_not_called()
+        # a change recorded by this worker still takes effect at once
+        changes.user_changed(1)
+        assert not claim.grants(1, 7)
+
+
+def test_unconfirmed_claim_falls_back_to_database():
+    session = AsyncMock()
+    session.run_sync.return_value = False
+    claim = MembershipClaim({7: "Viewer"}, int(time.time()))
+
+    with pytest.raises(AppError):
+        asyncio.run(
+            CompanyUserService.check_if_user_is_in_company(
+                session,
+                user_id=1,
+                company_id=7,
+                role="Administrator",
+                memberships=claim,
+            )
+        )
+    session.run_sync.assert_called_once()
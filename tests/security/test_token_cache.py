@@ -0,0 +1,51 @@
+import time
+
+from app.models.user.user import UserRead
+from app.security.token_cache import TokenCache
+
+sample_user = UserRead(id=1, email="test@example.com")
+
+
+def test_hit_and_miss_are_counted():
+    cache = TokenCache(max_size=2)
+    key = cache.digest("token")
+
+    assert cache.get(key) is None
+    cache.put(key, sample_user, time.time() + 60)
+    assert cache.get(key) is sample_user
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_expired_entry_is_dropped():
+    cache = TokenCache()
+    key = cache.digest("token")
+    cache.put(key, sample_user, time.time() - 1)
+
+    assert cache.get(key) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TokenCache(max_size=2)
+    first, second, third = (cache.digest(t) for t in ("one", "two", "three"))
+    expires_at = time.time() + 60
+    cache.put(first, sample_user, expires_at)
+    cache.put(second, sample_user, expires_at)
+    cache.get(first)
+    cache.put(third, sample_user, expires_at)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is sample_user
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_size_disables_cache():
+    cache = TokenCache(max_size=0)
+    key = cache.digest("token")
+    cache.put(key, sample_user, time.time() + 60)
+
+    assert cache.get(key) is None
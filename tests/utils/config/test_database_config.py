@@ -92,6 +92,44 @@ class TestDatabaseConfigWithLogging(unittest.TestCase):
         result = DatabaseConfig.get_connection_string(config, environment="any")
         self.assertEqual(result, "sqlite:///custom.db")
 
+    def test_pool_options_defaults(self):
+        result = DatabaseConfig.get_pool_options({})
+        self.assertEqual(
+            result,
+            {
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_timeout": 30.0,
+                "pool_recycle": -1,
+                "pool_use_lifo": False,
+                "pool_pre_ping": True,
+            },
+        )
+
+    def test_pool_options_from_config(self):
+        config = {
+            "database": {
+                "POOL_SIZE": "20",
+                "MAX_OVERFLOW": 0,
+                "POOL_RECYCLE": 1800,
+                "POOL_USE_LIFO": "true",
+                "POOL_PRE_PING": False,
+            }
+        }
+        result = DatabaseConfig.get_pool_options(config)
+        self.assertEqual(result["pool_size"], 20)
+        self.assertEqual(result["max_overflow"], 0)
+        self.assertEqual(result["pool_recycle"], 1800)
+        self.assertTrue(result["pool_use_lifo"])
+        self.assertFalse(result["pool_pre_ping"])
+
+    @patch("app.utils.config.database.logger")
+    def test_pool_options_invalid_value_uses_default(self, mock_logger):
+        config = {"database": {"POOL_SIZE": "lots"}}
+        result = DatabaseConfig.get_pool_options(config)
+        self.assertEqual(result["pool_size"], 5)
+        mock_logger.warning.assert_called()
+
 
 if __name__ == "__main__":
     unittest.main()
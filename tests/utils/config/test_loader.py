@@ -0,0 +1,63 @@
+import json
+import pytest
+from pydantic import ValidationError
+
+from app.logic.user.password import UserPasswordService
+from app.utils.config.loader import ConfigLoader
+
+
+@pytest.fixture
+def json_config(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps({"name": "Cached", "jwt": {"SECRET": "one", "ALGORITHM": "HS256"}})
+    )
+    monkeypatch.setenv("JSON_CONFIG_PATH", str(path))
+    ConfigLoader.reload()
+    yield path
+    ConfigLoader.reload()
+
+
+def test_config_is_loaded_once(json_config):
+    first = ConfigLoader().get_config()
+    json_config.write_text(json.dumps({"name": "Changed"}))
+
+    assert ConfigLoader().get_config() is first
+    assert first.name == "Cached"
+
+
+def test_reload_reads_config_again(json_config):
+    ConfigLoader().get_config()
+    json_config.write_text(json.dumps({"name": "Changed"}))
+    ConfigLoader.reload()
+
+    assert ConfigLoader().get_config().name == "Changed"
+
+
+def test_config_is_immutable(json_config):
+    config = ConfigLoader().get_config()
+
+    with pytest.raises(ValidationError):
+        config.name = "Other"
+    with pytest.raises(TypeError):
+        config.jwt["SECRET"] = "two"
+
+
+def test_config_supports_mapping_access(json_config):
+    config = ConfigLoader().get_config()
+
+    assert config["jwt"]["SECRET"] == "one"
+    assert config.get("email", {}) == {}
+    assert config.get("repository", "n/a") == "n/a"
+    with pytest.raises(KeyError):
+        config["missing"]
+
+
+def test_one_time_token_secret_falls_back_to_jwt_secret(json_config):
+    assert UserPasswordService.token_secret() == b"one"
+
+    json_config.write_text(json.dumps({"one_time_tokens": {"SECRET": "otp"}}))
+    ConfigLoader.reload()
+
+    assert ConfigLoader().get_config().one_time_tokens["SECRET"] == "otp"
+    assert UserPasswordService.token_secret() == b"otp"
@@ -1,5 +1,16 @@
 import pytest
-from app.utils.email.renderer import render_email_template
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
+
+from app.utils.email.renderer import (
+    EmailTemplate,
+    RenderedEmail,
+    environment,
+    get_email_template,
+    html_to_text,
+    render_email,
+    render_email_template,
+)
 
 
 @pytest.mark.parametrize(
@@ -29,3 +40,115 @@ def test_render_email_template_invalid_template():
         Exception
     ):  # Could be jinja2.TemplateNotFound if Jinja2 is strict
         render_email_template("nonexistent_template.html", {"key": "value"})
+
+
+def test_render_email_text_alternative():
+    email = render_email(
+        "user_registration.html",
+        {
+            "template_name": "Verify",
+            "user_name": "Sandile",
+            "verification_link": "https://example.com/verify?a=1&b=2",
+        },
+    )
+    assert "Sandile" in email.text
+    assert "https://example.com/verify?a=1&b=2" in email.text
+    assert "<" not in email.text
+    assert "{" not in email.text  # no CSS from the <style> block
+    assert 'href="https://example.com/verify?a=1&amp;b=2"' in email.html
+
+
+def test_render_email_escapes_values():
+    email = render_email(
+        "company_invite.html",
+        {"invitee": "<script>x</script>", "company": "A & B"},
+    )
+    assert "<script>" not in email.html
+    assert "&lt;script&gt;x&lt;/script&gt;" in email.html
+    assert "A &amp; B" in email.html
+    assert "<script>x</script>" in email.text
+    assert "A & B" in email.text
+
+
+@pytest.mark.parametrize(
+    "template_name, context",
+    [
+        ("reset_user_password.html", {"user_name": "O'Neil & co", "otp": "42"}),
+        ("company_invite.html", {"invitee": "Jo", "company": "<b>", "role": None}),
+        ("company_invite.html", {"invitee": Markup("<i>Jo</i>"), "company": 1}),
+        (
+            "user_registration.html",
+            {"template_name": "Hi", "user_name": "Ann", "verification_link": "x"},
+        ),
+    ],
+)
+def test_precompiled_render_matches_jinja(template_name, context):
+    template = get_email_template(template_name)
+    assert template.html_parts is not None
+    html = environment.get_template(template_name).render(context)
+    assert template.render(context) == RenderedEmail(html, html_to_text(html))
+
+
+def test_templates_with_logic_fall_back_to_jinja(tmp_path):
+    (tmp_path / "greeting.html").write_text(
+        "<p>{% if name %}Hi {{ name|upper }}{% else %}Hi there{% endif %}</p>"
+    )
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), autoescape=True)
+    template = EmailTemplate("greeting.html", env)
+    assert template.html_parts is None
+    assert template.render({"name": "ann"}) == ("<p>Hi ANN</p>", "Hi ANN")
+    assert template.render({}).text == "Hi there"
+
+
+def test_parent_template_variables_are_substituted(tmp_path):
+    (tmp_path / "layout.html").write_text(
+        "<h1>{{ title }}</h1>{% block body %}{% endblock %}"
+        "{% include 'footer.html' %}"
+    )
+    (tmp_path / "footer.html").write_text("<p>{{ sender }}</p>")
+    (tmp_path / "note.html").write_text(
+        "{% extends 'layout.html' %}{% block body %}<p>{{ note }}</p>{% endblock %}"
+    )
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), autoescape=True)
+    template = EmailTemplate("note.html", env)
+    context = {"title": "Hi & bye", "note": "Read me", "sender": "Ops"}
+
+    assert template.html_parts is not None
+    assert template.variables == ["note", "sender", "title"]
+    html = env.get_template("note.html").render(context)
+    assert template.render(context) == RenderedEmail(html, html_to_text(html))
+
+
+def test_dynamic_include_falls_back_to_jinja(tmp_path):
+    (tmp_path / "part.html").write_text("<p>{{ name }}</p>")
+    (tmp_path / "wrapper.html").write_text("{% include part %}")
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), autoescape=True)
+    template = EmailTemplate("wrapper.html", env)
+
+    assert template.html_parts is None
+    assert template.render({"part": "part.html", "name": "Ann"}).html == "<p>Ann</p>"
+
+
+@pytest.mark.parametrize(
+    "source, context, expected",
+    [
+        (
+            "<p>Hi {{ user.name }} {{ tags[0] }}</p>",
+            {"user": {"name": "Bob"}, "tags": "a"},
+            "<p>Hi Bob a</p>",
+        ),
+        (
+            "<p>{{ count + 1 }} {{ first ~ last }}</p>",
+            {"count": 1, "first": "A", "last": "B"},
+            "<p>2 AB</p>",
+        ),
+        ("<p>{{ link() }}</p>", {"link": lambda: "x"}, "<p>x</p>"),
+    ],
+)
+def test_expressions_fall_back_to_jinja(tmp_path, source, context, expected):
+    (tmp_path / "expr.html").write_text(source)
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), autoescape=True)
+    template = EmailTemplate("expr.html", env)
+
+    assert template.html_parts is None
+    assert template.render(context).html == expected
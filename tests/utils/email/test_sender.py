@@ -1,7 +1,15 @@
 import socket, smtplib
 import pytest
 from unittest.mock import patch, MagicMock
-from app.utils.email.sender import send_email
+from app.utils.email.sender import close_smtp_pools, send_email
+
+
+@pytest.fixture(autouse=True)
+def fresh_smtp_pools():
+    # pooled connections would otherwise outlive each test's SMTP mock
+    close_smtp_pools()
+    yield
+    close_smtp_pools()
 
 
 def test_send_email_in_test_environment(capfd):
@@ -84,7 +92,7 @@ def test_send_email_success():
     ):
         with patch("smtplib.SMTP_SSL") as mock_smtp_ssl:
             mock_server = MagicMock()
-            mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+            mock_smtp_ssl.return_value = mock_server
 
             send_email("to@example.com", "Subject", "<p>test</p>")
 
@@ -156,7 +164,7 @@ def test_send_email_smtp_exception():
     ):
         with patch("smtplib.SMTP_SSL") as mock_smtp_ssl:
             mock_server = MagicMock()
-            mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+            mock_smtp_ssl.return_value = mock_server
             mock_server.login.side_effect = smtplib.SMTPAuthenticationError(
                 535, "Authentication failed"
             )
@@ -182,7 +190,7 @@ def test_send_email_general_exception():
     ):
         with patch("smtplib.SMTP_SSL") as mock_smtp_ssl:
             mock_server = MagicMock()
-            mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+            mock_smtp_ssl.return_value = mock_server
             mock_server.send_message.side_effect = Exception("Unexpected error")
 
             with pytest.raises(Exception):
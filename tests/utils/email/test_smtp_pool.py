@@ -0,0 +1,169 @@
+import smtplib
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.config.email_config import EmailSettings
+from app.utils.email.sender import SMTPConnectionPool, build_message
+
+SETTINGS = EmailSettings(
+    HOST="smtp.test.com", PORT=465, USERNAME="user@test.com", PASSWORD="secure"
+)
+
+
+class FakeSMTP:
+    """
+    Stand-in SMTP server session recording what each connection did.
+    """
+
+    sessions = []
+    refuse = set()
+
+    def __init__(self, host, port, timeout=None):
+        self.logins = 0
+        self.sent = []
+        self.noops = 0
+        self.dropped = False
+        self.closed = False
+        FakeSMTP.sessions.append(self)
+
+    def login(self, username, password):
+        if password != SETTINGS.password:
+            raise smtplib.SMTPAuthenticationError(535, b"Authentication failed")
+        self.logins += 1
+
+    def noop(self):
+        self.noops += 1
+        if self.dropped:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if self.dropped:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        if message["To"] in FakeSMTP.refuse:
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"No")})
+        self.sent.append(message["To"])
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp():
+    FakeSMTP.sessions = []
+    FakeSMTP.refuse = set()
+    with patch("smtplib.SMTP_SSL", FakeSMTP):
+        yield FakeSMTP
+
+
+def _messages(count, start=0):
+    return [
+        build_message(SETTINGS, f"to{i}@example.com", "Invite", "<p>Hi</p>")
+        for i in range(start, start + count)
+    ]
+
+
+def test_batch_uses_one_authenticated_session():
+    pool = SMTPConnectionPool(SETTINGS)
+
+    results = pool.send_many(_messages(200))
+
+    assert results == [None] * 200
+    assert len(FakeSMTP.sessions) == 1
+    assert FakeSMTP.sessions[0].logins == 1
+    assert len(FakeSMTP.sessions[0].sent) == 200
+
+
+def test_connections_are_reused_between_sends():
+    pool = SMTPConnectionPool(SETTINGS)
+    for message in _messages(5):
+        pool.send(message)
+
+    assert len(FakeSMTP.sessions) == 1
+    assert FakeSMTP.sessions[0].noops == 0
+
+
+def test_idle_connection_is_checked_with_noop():
+    pool = SMTPConnectionPool(SETTINGS, keepalive=0)
+    pool.send_many(_messages(1))
+    time.sleep(0.01)
+    pool.send_many(_messages(1, start=1))
+
+    assert len(FakeSMTP.sessions) == 1
+    assert FakeSMTP.sessions[0].noops == 1
+
+
+def test_dead_idle_connection_is_replaced():
+    pool = SMTPConnectionPool(SETTINGS, keepalive=0)
+    pool.send_many(_messages(1))
+    FakeSMTP.sessions[0].dropped = True
+    time.sleep(0.01)
+
+    assert pool.send_many(_messages(1, start=1)) == [None]
+    assert len(FakeSMTP.sessions) == 2
+    assert FakeSMTP.sessions[1].sent == ["to1@example.com"]
+
+
+def test_connection_dropped_mid_batch_reconnects_and_continues():
+    pool = SMTPConnectionPool(SETTINGS)
+    messages = _messages(4)
+    original = FakeSMTP.send_message
+
+    def drop_after_two(self, message):
+        if len(self.sent) == 2:
+            self.dropped = True
+        original(self, message)
+
+    with patch.object(FakeSMTP, "send_message", drop_after_two):
+        results = pool.send_many(messages)
+
+    assert results == [None] * 4
+    assert [len(session.sent) for session in FakeSMTP.sessions] == [2, 2]
+
+
+def test_refused_recipient_does_not_stop_the_batch():
+    FakeSMTP.refuse = {"to1@example.com"}
+    pool = SMTPConnectionPool(SETTINGS)
+
+    results = pool.send_many(_messages(3))
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], smtplib.SMTPRecipientsRefused)
+    assert len(FakeSMTP.sessions) == 1
+
+
+def test_login_failure_fails_the_whole_batch():
+    settings = SETTINGS.model_copy(update={"password": "wrong"})
+    pool = SMTPConnectionPool(settings)
+
+    results = pool.send_many(_messages(3))
+
+    assert all(isinstance(e, smtplib.SMTPAuthenticationError) for e in results)
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        pool.send(_messages(1)[0])
+
+
+def test_pool_never_opens_more_than_max_size_connections():
+    pool = SMTPConnectionPool(SETTINGS, max_size=2)
+    threads = [
+        threading.Thread(target=pool.send_many, args=(_messages(20),)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeSMTP.sessions) <= 2
+    assert sum(len(session.sent) for session in FakeSMTP.sessions) == 160
+
+
+def test_close_quits_idle_connections():
+    pool = SMTPConnectionPool(SETTINGS)
+    pool.send_many(_messages(1))
+    pool.close()
+    assert FakeSMTP.sessions[0].closed
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from app.utils.ttl_cache import MISSING, TTLCache
+
+
+def test_none_is_cached():
+    cache = TTLCache()
+    cache.set("key", None)
+
+    assert cache.get("key") is None
+    assert cache.get("other") is MISSING
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(ttl=10)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=100):
+        cache.set("key", "value")
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=111):
+        assert cache.get("key") is MISSING
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2)
+    cache.set("one", 1)
+    cache.set("two", 2)
+    cache.get("one")
+    cache.set("three", 3)
+
+    assert cache.get("two") is MISSING
+    assert cache.get("one") == 1
+
+
+def test_invalidate_by_predicate():
+    cache = TTLCache()
+    cache.set((1, 7), "Administrator")
+    cache.set((2, 7), "Viewer")
+    cache.set((1, 8), "Viewer")
+
+    assert cache.invalidate(lambda key: key[0] == 1) == 2
+    assert cache.get((2, 7)) == "Viewer"
+    assert cache.stats()["hits"] == 1
+
+
+def test_per_entry_ttl_overrides_default():
+    cache = TTLCache(ttl=10)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=100):
+        cache.set("short", 1, ttl=1)
+        cache.set("default", 2)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=105):
+        assert cache.get("short") is MISSING
+        assert cache.get("default") == 2